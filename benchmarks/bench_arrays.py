@@ -0,0 +1,69 @@
+"""
+Measure the memory used by large numeric sequence settings, e.g., rate limit tables or port lists.
+
+`ArrayValue`, which stores the numbers in a packed buffer, is compared to `ListValue` and `TupleValue`,
+which store each number as a separate object.
+
+Run with `python -m benchmarks.bench_arrays`.
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from env_config import values
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from env_config.typing import Any
+
+ITEMS = 100_000
+REPEAT = 5
+
+
+def measure(func: Callable[[], Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()  # noqa: F841
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def best_of(func: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    integers = ",".join(str(1_000 + i * 7) for i in range(ITEMS))
+    floats = ",".join(f"{i}.25" for i in range(ITEMS))
+    cases: list[tuple[str, values.Value, str]] = [
+        ("ListValue(IntegerValue())", values.ListValue(child=values.IntegerValue()), integers),
+        ("TupleValue(IntegerValue())", values.TupleValue(child=values.IntegerValue()), integers),
+        ('ArrayValue("q")', values.ArrayValue("q"), integers),
+        ('ArrayValue("L")', values.ArrayValue("L"), integers),
+        ("ListValue(FloatValue())", values.ListValue(child=values.FloatValue()), floats),
+        ('ArrayValue("d")', values.ArrayValue("d"), floats),
+        ('ArrayValue("f")', values.ArrayValue("f"), floats),
+    ]
+
+    print(f"{ITEMS} items, best of {REPEAT}")
+    print(f"{'value':<28} {'memory':>12} {'per item':>10} {'convert':>12}")
+    for name, value, raw in cases:
+        memory = measure(lambda: value.convert(raw))  # noqa: B023
+        duration = best_of(lambda: value.convert(raw))  # noqa: B023
+        print(f"{name:<28} {memory / 1024:>8.0f} KiB {memory / ITEMS:>8.1f} B {duration * 1000:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
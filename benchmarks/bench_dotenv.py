@@ -0,0 +1,87 @@
+"""
+Compare parsing `.env` files with `python-dotenv` and the native parser in `env_config.parser`,
+with and without projecting the values to the few keys an environment would declare.
+
+Run with `python -m benchmarks.bench_dotenv`.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from dotenv import dotenv_values
+
+from env_config.parser import read_dotenv
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from env_config.typing import Any
+
+SIZES = (100, 1_000, 5_000)
+REPEAT = 3
+# Keys declared by a typical environment: a few dozen names out of the whole file.
+KEYS = {"BASE_URL"} | {f"SETTING_{i}" for i in range(50)}
+
+
+def write_dotenv(path: Path, lines: int) -> None:
+    """Write a `.env` file with a mix of plain, quoted, commented and interpolated values."""
+    content: list[str] = ["# Generated configuration", "BASE_URL=https://example.com"]
+    for i in range(lines):
+        match i % 5:
+            case 0:
+                content.append(f"SETTING_{i}=value_{i}")
+            case 1:
+                content.append(f"export SETTING_{i}='quoted value {i}'")
+            case 2:
+                content.append(f'SETTING_{i}="escaped\\tvalue {i}"  # comment')
+            case 3:
+                content.append(f"SETTING_{i}=${{BASE_URL}}/path/{i}")
+            case _:
+                content.append(f"SETTING_{i}=1,2,3,{i}")
+    path.write_text("\n".join(content) + "\n", encoding="utf-8")
+
+
+def measure(func: Callable[[Path], Any], path: Path) -> tuple[float, int]:
+    best = min(_timed(func, path) for _ in range(REPEAT))
+    tracemalloc.start()
+    try:
+        func(path)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def _timed(func: Callable[[Path], Any], path: Path) -> float:
+    start = time.perf_counter()
+    func(path)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parsers: dict[str, Callable[[Path], Any]] = {
+        "python-dotenv": lambda path: dotenv_values(dotenv_path=path),
+        "native": read_dotenv,
+        "native (keys)": lambda path: read_dotenv(path, keys=KEYS),
+    }
+
+    print(f"{'lines':>6} {'parser':<14} {'time':>12} {'peak memory':>14}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / ".env"
+        for lines in SIZES:
+            write_dotenv(path, lines)
+            expected = parsers["python-dotenv"](path)
+            assert parsers["native"](path) == expected  # noqa: S101
+            assert parsers["native (keys)"](path) == {k: v for k, v in expected.items() if k in KEYS}  # noqa: S101
+            for name, func in parsers.items():
+                seconds, peak = measure(func, path)
+                print(f"{lines:>6} {name:<14} {seconds * 1000:>9.2f} ms {peak / 1024:>10.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
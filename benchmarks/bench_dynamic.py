@@ -0,0 +1,91 @@
+"""
+Measure accessing settings through the environment class on a request path.
+
+`DynamicValue`, which serves a cached value and refreshes it in the background after it expires,
+is compared to a regular value descriptor, which is never refreshed, and to reading and converting
+the raw value on every access, which is how tunables are otherwise kept up to date.
+
+Run with `python -m benchmarks.bench_dynamic`.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import TYPE_CHECKING
+
+from env_config import Environment, values
+from env_config.constants import ENV_NAME
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from env_config.typing import Any
+
+ACCESSES = 100_000
+REPEAT = 5
+
+
+def best_of(func: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    source = {"RATE_LIMIT": "100"}
+    os.environ[ENV_NAME] = "Bench"
+    os.environ["RATE_LIMIT"] = "100"
+    try:
+
+        class Bench(Environment, use_environ=True):
+            RATE_LIMIT = values.PositiveIntegerValue()
+            DYNAMIC_RATE_LIMIT = values.DynamicValue(
+                values.PositiveIntegerValue(), ttl=60, source=source, env_name="RATE_LIMIT"
+            )
+            EXPIRED_RATE_LIMIT = values.DynamicValue(
+                values.PositiveIntegerValue(), ttl=0.01, source=source, env_name="RATE_LIMIT"
+            )
+
+    finally:
+        del os.environ[ENV_NAME]
+
+    converter = values.PositiveIntegerValue()
+
+    def static() -> None:
+        for _ in range(ACCESSES):
+            Bench.RATE_LIMIT  # noqa: B018
+
+    def dynamic() -> None:
+        for _ in range(ACCESSES):
+            Bench.DYNAMIC_RATE_LIMIT  # noqa: B018
+
+    def short_ttl() -> None:
+        for _ in range(ACCESSES):
+            Bench.EXPIRED_RATE_LIMIT  # noqa: B018
+
+    def reread() -> None:
+        for _ in range(ACCESSES):
+            converter.convert(os.environ["RATE_LIMIT"])
+
+    print(f"{ACCESSES} accesses, best of {REPEAT}")
+    print(f"{'access':<36} {'total':>10} {'per access':>12}")
+    for name, func in [
+        ("PositiveIntegerValue", static),
+        ("DynamicValue (fresh)", dynamic),
+        ("DynamicValue (ttl=10 ms)", short_ttl),
+        ("read and convert on each access", reread),
+    ]:
+        duration = best_of(func)
+        print(f"{name:<36} {duration * 1000:>7.1f} ms {duration / ACCESSES * 1e9:>9.0f} ns")
+
+    stats = Bench.fields["EXPIRED_RATE_LIMIT"].value.stats
+    print(f"Expired value: {stats.stale_hits} stale hits, {stats.refreshes} refreshes")
+    del os.environ["RATE_LIMIT"]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Measure how long importing a settings module takes in a worker process,
+when the settings are resolved again compared to when they are handed off from the parent process.
+
+Run with `python -m benchmarks.bench_handoff`.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from env_config.constants import ENV_NAME, HANDOFF_ENV_NAME
+
+MODULE = "env_config_bench_handoff_settings"
+FIELDS = 200
+ITEMS = 50
+REPEAT = 20
+
+
+def write_settings(tmp_dir: Path) -> None:
+    """Write a settings module and a `.env` file with a mix of value descriptors."""
+    lines = [
+        "from env_config import Environment, values",
+        "",
+        "class Production(Environment, dotenv_path=__file__.replace('.py', '.env')):",
+    ]
+    dotenv: list[str] = []
+    for i in range(FIELDS):
+        match i % 4:
+            case 0:
+                lines.append(f"    URLS_{i} = values.ListValue(child=values.URLValue())")
+                dotenv.append(f"URLS_{i}=" + ",".join(f"https://host{j}.example.com" for j in range(ITEMS)))
+            case 1:
+                lines.append(f"    EMAILS_{i} = values.ListValue(child=values.EmailValue())")
+                dotenv.append(f"EMAILS_{i}=" + ",".join(f"user{j}@example.com" for j in range(ITEMS)))
+            case 2:
+                lines.append(f"    NUMBER_{i} = values.IntegerValue()")
+                dotenv.append(f"NUMBER_{i}={i}")
+            case _:
+                lines.append(f"    BACKEND_{i} = values.ImportStringValue()")
+                dotenv.append(f"BACKEND_{i}=json.decoder.JSONDecoder")
+
+    (tmp_dir / f"{MODULE}.py").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    (tmp_dir / f"{MODULE}.env").write_text("\n".join(dotenv) + "\n", encoding="utf-8")
+
+
+def import_settings() -> float:
+    sys.modules.pop(MODULE, None)
+    start = time.perf_counter()
+    importlib.import_module(MODULE)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    os.environ[ENV_NAME] = "Production"
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        write_settings(tmp_dir)
+        sys.path.insert(0, tmp)
+
+        # Warm up imports and caches that would be shared by all workers.
+        import_settings()
+        resolve = min(import_settings() for _ in range(REPEAT))
+
+        print(f"{FIELDS} settings, best of {REPEAT}")
+        print(f"{'mode':<16} {'import time':>12}")
+        print(f"{'resolve':<16} {resolve * 1000:>9.2f} ms")
+
+        module = sys.modules[MODULE]
+        for kind in ("file", "fd", "shm"):
+            location = module.Production.export_handoff(kind=kind)
+            assert import_settings() < resolve  # noqa: S101
+            handoff = min(import_settings() for _ in range(REPEAT))
+            print(f"{'handoff (' + kind + ')':<16} {handoff * 1000:>9.2f} ms")
+            if kind == "fd":
+                os.close(int(location.split(":")[1]))
+            del os.environ[HANDOFF_ENV_NAME]
+
+
+if __name__ == "__main__":
+    main()
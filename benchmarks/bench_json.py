@@ -0,0 +1,103 @@
+"""
+Measure parsing JSON settings of different sizes, e.g., routing tables or feature matrices,
+with the available JSON backends, from a string with `JsonValue` and from a file with `JsonFileValue`.
+
+Run with `python -m benchmarks.bench_json`.
+"""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from env_config import values
+from env_config.errors import MissingExtraDependencyError
+from env_config.jsonlib import get_json_backend
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from env_config.typing import Any
+
+SIZES = (10, 1_000, 100_000)
+REPEAT = 5
+
+SCHEMA = {
+    "type": "object",
+    "required": ["routes"],
+    "properties": {
+        "routes": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["path", "port"],
+                "properties": {
+                    "path": {"type": "string"},
+                    "port": {"type": "integer", "minimum": 1, "maximum": 65535},
+                    "weight": {"type": "number"},
+                    "enabled": {"type": "boolean"},
+                },
+            },
+        },
+    },
+}
+
+
+def best_of(func: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def create_document(routes: int) -> str:
+    return json.dumps(
+        {
+            "routes": [
+                {"path": f"/service-{i}/api", "port": 8000 + i % 1000, "weight": i / 7, "enabled": i % 3 != 0}
+                for i in range(routes)
+            ],
+        }
+    )
+
+
+def main() -> None:
+    backends: list[str] = []
+    for name in ("json", "ujson", "orjson"):
+        try:
+            get_json_backend(name)
+        except MissingExtraDependencyError:
+            print(f"{name} is not installed, skipping")
+            continue
+        backends.append(name)
+
+    print(f"Best of {REPEAT}")
+    print(f"{'routes':>8} {'size':>10} {'backend':<8} {'string':>12} {'file':>12} {'file+schema':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for routes in SIZES:
+            document = create_document(routes)
+            path = Path(tmp) / f"routes-{routes}.json"
+            path.write_text(document, encoding="utf-8")
+
+            for backend in backends:
+                string_value = values.JsonValue(backend=backend)
+                file_value = values.JsonFileValue(backend=backend)
+                schema_value = values.JsonFileValue(backend=backend, schema=SCHEMA)
+                assert string_value.convert(document) == file_value.convert(str(path))  # noqa: S101
+
+                string = best_of(lambda: string_value.convert(document))  # noqa: B023
+                file = best_of(lambda: file_value.convert(str(path)))  # noqa: B023
+                schema = best_of(lambda: schema_value.convert(str(path)))  # noqa: B023
+                print(
+                    f"{routes:>8} {len(document) / 1024:>6.0f} KiB {backend:<8} {string * 1000:>9.3f} ms"
+                    f" {file * 1000:>9.3f} ms {schema * 1000:>9.3f} ms",
+                )
+
+
+if __name__ == "__main__":
+    main()
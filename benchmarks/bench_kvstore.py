@@ -0,0 +1,122 @@
+"""
+Measure fetching settings from an HTTP key-value service with `HttpKeyValueSource`,
+against a local stand-in for the service that adds a fixed latency to each request.
+
+Fetching the keys one per request on a new connection each time is compared to fetching them
+in batches on pooled keep-alive connections, from the in-memory TTL cache, and from the cache file
+on a cold start.
+
+Run with `python -m benchmarks.bench_kvstore`.
+"""
+
+from __future__ import annotations
+
+import base64
+import http.client
+import json
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from env_config.aio import fetch_values
+from env_config.kvstore import HttpKeyValueSource
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from env_config.typing import Any
+
+KEYS = (10, 100, 500)
+LATENCY = 0.001
+REPEAT = 3
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # The headers and the body are written separately, which would delay responses on keep-alive connections.
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        time.sleep(LATENCY)
+        responses = []
+        for operation in request["success"]:
+            key = operation["request_range"]["key"]
+            value = base64.b64encode(b"value-" + base64.b64decode(key)).decode()
+            responses.append({"response_range": {"kvs": [{"key": key, "value": value}]}})
+
+        body = json.dumps({"responses": responses}).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def best_of(func: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def fetch_one_by_one(port: int, keys: list[str]) -> dict[str, str]:
+    values: dict[str, str] = {}
+    for key in keys:
+        connection = http.client.HTTPConnection("127.0.0.1", port)
+        operation = {"request_range": {"key": base64.b64encode(key.encode()).decode()}}
+        connection.request("POST", "/v3/kv/txn", body=json.dumps({"success": [operation]}))
+        response = json.loads(connection.getresponse().read())
+        connection.close()
+        for item in response["responses"][0]["response_range"]["kvs"]:
+            values[key] = base64.b64decode(item["value"]).decode()
+    return values
+
+
+def main() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    port = server.server_address[1]
+    url = f"http://127.0.0.1:{port}"
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True).start()
+
+    print(f"{LATENCY * 1000:.0f} ms latency per request, best of {REPEAT}")
+    print(f"{'keys':>6} {'one by one':>12} {'batched':>12} {'cached':>12} {'cold start':>12}")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for count in KEYS:
+                keys = [f"SETTING_{i}" for i in range(count)]
+                cache_path = Path(tmp) / f"kv-{count}.json"
+                source = HttpKeyValueSource(url, api="etcd", cache_path=cache_path)
+                assert fetch_values([source], keys) == fetch_one_by_one(port, keys)  # noqa: S101
+
+                def batched(source: HttpKeyValueSource = source) -> None:
+                    source.cache.clear()
+                    fetch_values([source], keys)  # noqa: B023
+
+                def cold_start(cache_path: Path = cache_path) -> None:
+                    fetch_values([HttpKeyValueSource(url, api="etcd", cache_path=cache_path)], keys)  # noqa: B023
+
+                one_by_one = best_of(lambda: fetch_one_by_one(port, keys))  # noqa: B023
+                batch = best_of(batched)
+                cached = best_of(lambda: fetch_values([source], keys))  # noqa: B023
+                cold = best_of(cold_start)
+                print(
+                    f"{count:>6} {one_by_one * 1000:>9.1f} ms {batch * 1000:>9.1f} ms"
+                    f" {cached * 1000:>9.1f} ms {cold * 1000:>9.1f} ms"
+                )
+                source.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Measure the memory overhead of value descriptors, and whether discarded environments are kept alive by them.
+
+The current descriptors are compared to a replica of the previous implementation,
+which stored values in an instance `__dict__` and a `defaultdict` keyed by strong
+references to the environments.
+
+Run with `python -m benchmarks.bench_memory`.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import tracemalloc
+import weakref
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from env_config import Environment, values
+from env_config.constants import ENV_NAME, Undefined
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from env_config.typing import Any
+
+DESCRIPTORS = 10_000
+ENVIRONMENTS = 1_000
+
+
+class LegacyValue:
+    """Replica of the previous value descriptor storage."""
+
+    def __init__(self, *, default: Any = Undefined, env_name: str | None = None) -> None:
+        self.default = default
+        self.name = env_name
+        self.skip_env = env_name is None
+        self.value_by_environment: dict[type, Any] = defaultdict(lambda: Undefined)
+
+    def __get__(self, _: object, env: type) -> Any:
+        if self.value_by_environment[env] is not Undefined:
+            return self.value_by_environment[env]
+
+        self.value_by_environment[env] = self.default
+        return self.value_by_environment[env]
+
+
+def measure(func: Callable[[], Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()  # noqa: F841
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def per_descriptor(factory: Callable[[], Any]) -> float:
+    return measure(lambda: [factory() for _ in range(DESCRIPTORS)]) / DESCRIPTORS
+
+
+def alive_environments(factory: Callable[[], Any]) -> int:
+    """Create throwaway environments sharing a descriptor, and count how many survive garbage collection."""
+    descriptor = factory()
+    refs: list[weakref.ref[type]] = []
+    for _ in range(ENVIRONMENTS):
+        env = type("Throwaway", (Environment,), {"FOO": descriptor})
+        env.FOO  # noqa: B018
+        refs.append(weakref.ref(env))
+    del env
+    gc.collect()
+    return sum(ref() is not None for ref in refs)
+
+
+def main() -> None:
+    os.environ[ENV_NAME] = "NotActive"
+    legacy = lambda: LegacyValue(default="foo")  # noqa: E731
+    current = lambda: values.StringValue(default="foo")  # noqa: E731
+
+    print(f"{'implementation':<16} {'bytes / descriptor':>20} {'alive environments':>20}")
+    for name, factory in (("previous", legacy), ("current", current)):
+        print(f"{name:<16} {per_descriptor(factory):>20.0f} {alive_environments(factory):>14} / {ENVIRONMENTS}")
+
+
+if __name__ == "__main__":
+    main()
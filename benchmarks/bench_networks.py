@@ -0,0 +1,71 @@
+"""
+Measure checking client IP addresses against a large allowlist of networks.
+
+`IPNetworkSetValue` is compared to a `ListValue(IPValue())` of single addresses checked with
+a linear scan (`address in allowlist`), and to a list of `ipaddress` networks checked one by one.
+
+Run with `python -m benchmarks.bench_networks`.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import random
+import time
+from typing import TYPE_CHECKING
+
+from env_config import values
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from env_config.typing import Any
+
+NETWORKS = 5_000
+LOOKUPS = 500
+REPEAT = 3
+
+
+def best_of(func: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    rng = random.Random(0)  # noqa: S311
+    hosts = [str(ipaddress.IPv4Address(rng.getrandbits(32))) for _ in range(NETWORKS)]
+    networks = [f"{ipaddress.IPv4Address(rng.getrandbits(24) << 8)}/24" for _ in range(NETWORKS)]
+    # Half of the lookups are hits, e.g., clients in the allowlist.
+    lookups = [rng.choice(hosts) if i % 2 else str(ipaddress.IPv4Address(rng.getrandbits(32))) for i in range(LOOKUPS)]
+
+    allowlist = values.ListValue(child=values.IPValue()).convert(",".join(hosts))
+    parsed = [ipaddress.ip_network(network) for network in networks]
+    host_set = values.IPNetworkSetValue().convert(",".join(hosts))
+    network_set = values.IPNetworkSetValue().convert(",".join(networks))
+
+    assert [address in allowlist for address in lookups] == [address in host_set for address in lookups]  # noqa: S101
+
+    def scan_networks() -> list[bool]:
+        return [any(ipaddress.ip_address(address) in network for network in parsed) for address in lookups]
+
+    assert scan_networks() == [address in network_set for address in lookups]  # noqa: S101
+
+    print(f"{NETWORKS} entries, {LOOKUPS} lookups, best of {REPEAT}")
+    print(f"{'allowlist':<30} {'time':>12} {'per lookup':>12}")
+    cases: list[tuple[str, Callable[[], Any]]] = [
+        ("addresses, list", lambda: [address in allowlist for address in lookups]),
+        ("addresses, IPNetworkSetValue", lambda: [address in host_set for address in lookups]),
+        ("networks, list", scan_networks),
+        ("networks, IPNetworkSetValue", lambda: [address in network_set for address in lookups]),
+    ]
+    for name, func in cases:
+        duration = best_of(func)
+        print(f"{name:<30} {duration * 1000:>9.2f} ms {duration / LOOKUPS * 1e6:>9.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Measure importing a settings module with many environments, each with many value descriptors.
+
+Defining all environments in the settings module, where all class bodies are evaluated even though
+only one environment is active, is compared to registering each environment's module with
+`env_config.registry.registry`, so that only the module of the active environment is imported.
+
+Run with `python -m benchmarks.bench_registry`.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from env_config.constants import ENV_NAME
+from env_config.registry import registry
+
+ENVIRONMENTS = (5, 20, 50)
+VALUES = 100
+REPEAT = 5
+
+
+def environment_source(index: int) -> str:
+    lines = [f"class Environment{index}(Environment, dotenv_path=None):"]
+    lines += [f"    VALUE_{i} = values.IntegerValue(default={i})" for i in range(VALUES)]
+    return "\n".join(lines) + "\n"
+
+
+def create_package(directory: Path, name: str, environments: int) -> None:
+    package = directory / name
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    header = "from env_config import Environment, values\n\n"
+
+    single = header + "\n".join(environment_source(i) for i in range(environments))
+    (package / "single.py").write_text(single)
+
+    registered = ["from env_config.registry import registry\n"]
+    for i in range(environments):
+        (package / f"env{i}.py").write_text(header + environment_source(i))
+        registered.append(f"registry.register('Environment{i}', '{name}.env{i}')\n")
+    registered.append("registry.load_active()\n")
+    (package / "registered.py").write_text("".join(registered))
+
+
+def import_fresh(module: str) -> float:
+    package = module.split(".", maxsplit=1)[0]
+    best = float("inf")
+    for _ in range(REPEAT):
+        for name in [name for name in sys.modules if name.startswith(f"{package}.")]:
+            del sys.modules[name]
+        # Simulate a new process, where no environments have been created yet.
+        registry.classes.clear()
+        start = time.perf_counter()
+        importlib.import_module(module)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    os.environ[ENV_NAME] = "Environment0"
+    print(f"{VALUES} values per environment, best of {REPEAT}")
+    print(f"{'environments':>12} {'single module':>15} {'registry':>12}")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            sys.path.insert(0, tmp)
+            for environments in ENVIRONMENTS:
+                name = f"bench_registry_{environments}"
+                create_package(Path(tmp), name, environments)
+                # Compile the modules once, so that both cases use cached bytecode.
+                import_fresh(f"{name}.single")
+                import_fresh(f"{name}.registered")
+
+                single = import_fresh(f"{name}.single")
+                registered = import_fresh(f"{name}.registered")
+                print(f"{environments:>12} {single * 1000:>12.2f} ms {registered * 1000:>9.2f} ms")
+                registry.modules.clear()
+    finally:
+        del os.environ[ENV_NAME]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Measure loading settings from a directory of secret files, e.g., Docker secrets or a mounted
+Kubernetes Secret, when the directory contains many more files than the environment declares.
+
+Scanning the directory for the declared files and reading them through `DirectorySource` is compared
+to reading every file in the directory into a dictionary, which is what copying the files
+into environment variables at container start amounts to.
+
+Run with `python -m benchmarks.bench_secrets`.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from env_config.sources import DirectorySource, _read_value
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from env_config.typing import Any
+
+FILES = (100, 1_000, 5_000)
+DECLARED = 20
+REPEAT = 10
+
+
+def best_of(func: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def read_all(directory: Path) -> dict[str, str]:
+    return {path.name: path.read_text(encoding="utf-8").removesuffix("\n") for path in directory.iterdir()}
+
+
+def read_declared(directory: Path, keys: set[str]) -> dict[str, str]:
+    source = DirectorySource(directory, keys=keys)
+    return {key: source[key] for key in keys if key in source}
+
+
+def main() -> None:
+    keys = {f"SECRET_{i}" for i in range(DECLARED)}
+
+    print(f"{DECLARED} declared settings, best of {REPEAT}")
+    print(f"{'files':>8} {'read all':>12} {'uncached':>12} {'cached':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        created = 0
+        for files in FILES:
+            for i in range(created, files):
+                (directory / f"SECRET_{i}").write_text(f"value-{i}-" + "x" * 64 + "\n", encoding="utf-8")
+            created = files
+
+            expected = read_all(directory)
+            assert read_declared(directory, keys) == {key: expected[key] for key in keys}  # noqa: S101
+
+            def uncached() -> None:
+                _read_value.cache_clear()
+                read_declared(directory, keys)
+
+            everything = best_of(lambda: read_all(directory))
+            first = best_of(uncached)
+            # Other environments sharing the directory only scan it.
+            shared = best_of(lambda: read_declared(directory, keys))
+            print(f"{files:>8} {everything * 1000:>9.3f} ms {first * 1000:>9.3f} ms {shared * 1000:>9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
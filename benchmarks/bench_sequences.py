@@ -0,0 +1,56 @@
+"""
+Measure converting large sequences of built-in scalar values, e.g., port lists or tenant IDs.
+
+Converting all items at once with a bulk converter is compared to converting the items one by one
+with the child descriptor, which is still used for custom children.
+
+Run with `python -m benchmarks.bench_sequences`.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from env_config import values
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from env_config.typing import Any
+
+ITEMS = 10_000
+REPEAT = 20
+
+
+def best_of(func: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    cases: list[tuple[str, values.Value, str]] = [
+        ("StringValue", values.StringValue(), ",".join(f" tenant-{i} " for i in range(ITEMS))),
+        ("BooleanValue", values.BooleanValue(), ",".join(("true", "no", "1", "N")[i % 4] for i in range(ITEMS))),
+        ("IntegerValue", values.IntegerValue(), ",".join(str(1024 + i) for i in range(ITEMS))),
+        ("FloatValue", values.FloatValue(), ",".join(f"{i}.5" for i in range(ITEMS))),
+        ("DecimalValue", values.DecimalValue(), ",".join(f"{i}.25" for i in range(ITEMS))),
+    ]
+
+    print(f"ListValue with {ITEMS} items, best of {REPEAT}")
+    print(f"{'child':<14} {'one by one':>12} {'bulk':>12} {'speedup':>9}")
+    for name, child, value in cases:
+        sequence = values.ListValue(child=child)
+        assert sequence.convert(value) == list(sequence.convert_items(value))  # noqa: S101
+
+        before = best_of(lambda: list(sequence.convert_items(value)))  # noqa: B023
+        after = best_of(lambda: sequence.convert(value))  # noqa: B023
+        print(f"{name:<14} {before * 1000:>9.2f} ms {after * 1000:>9.2f} ms {before / after:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
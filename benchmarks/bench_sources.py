@@ -0,0 +1,74 @@
+"""
+Measure fetching the declared settings from several sources with latency, e.g., a secrets agent
+and a sidecar service, with `env_config.aio.fetch_values`.
+
+Fetching all keys from all sources concurrently is compared to fetching the keys one at a time
+from each source in turn, which is what resolving each value from its source on access amounts to.
+
+Run with `python -m benchmarks.bench_sources`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+from env_config.aio import CallableSource, fetch_values
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection
+
+    from env_config.typing import Any
+
+SOURCES = 3
+KEYS = (10, 50)
+LATENCY = 0.005
+REPEAT = 3
+
+
+def best_of(func: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def create_source(index: int) -> CallableSource:
+    async def fetch(keys: Collection[str]) -> dict[str, str]:
+        # One round trip per request, regardless of the number of keys.
+        await asyncio.sleep(LATENCY)
+        return {key: f"{key}-{index}" for key in keys if hash(key) % SOURCES == index}
+
+    return CallableSource(fetch)
+
+
+def fetch_sequentially(sources: list[CallableSource], keys: list[str]) -> dict[str, str]:
+    values: dict[str, str] = {}
+    for key in keys:
+        for source in sources:
+            result = asyncio.run(source.fetch_many([key]))
+            if key in result:
+                values[key] = result[key]
+                break
+    return values
+
+
+def main() -> None:
+    sources = [create_source(index) for index in range(SOURCES)]
+
+    print(f"{SOURCES} sources with {LATENCY * 1000:.0f} ms latency, best of {REPEAT}")
+    print(f"{'keys':>6} {'sequential':>14} {'concurrent':>14}")
+    for count in KEYS:
+        keys = [f"SETTING_{i}" for i in range(count)]
+        assert fetch_values(sources, keys) == fetch_sequentially(sources, keys)  # noqa: S101
+
+        sequential = best_of(lambda: fetch_sequentially(sources, keys))  # noqa: B023
+        concurrent = best_of(lambda: fetch_values(sources, keys))  # noqa: B023
+        print(f"{count:>6} {sequential * 1000:>11.1f} ms {concurrent * 1000:>11.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
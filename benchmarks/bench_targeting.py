@@ -0,0 +1,54 @@
+"""
+Compare finding the settings module with `inspect.stack()` to the targeting
+layer in `env_config.targeting` at increasing call stack depths.
+
+Run with `python -m benchmarks.bench_targeting`.
+"""
+
+from __future__ import annotations
+
+import inspect
+import timeit
+from typing import TYPE_CHECKING
+
+from env_config.targeting import get_module_directory, get_target_globals
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+STACK_DEPTHS = (10, 50, 200)
+NUMBER = 200
+
+
+class Target:
+    """Stand-in for an environment class defined in this module."""
+
+
+def with_inspect_stack() -> None:
+    stack = inspect.stack()
+    stack[1].frame.f_globals  # noqa: B018
+    stack[1].filename  # noqa: B018
+
+
+def with_targeting() -> None:
+    module_globals = get_target_globals(Target)
+    get_module_directory(module_globals)
+
+
+def at_depth(depth: int, func: Callable[[], None]) -> None:
+    if depth <= 0:
+        func()
+        return
+    at_depth(depth - 1, func)
+
+
+def main() -> None:
+    print(f"{'depth':>6} {'inspect.stack()':>18} {'targeting':>12} {'speedup':>9}")
+    for depth in STACK_DEPTHS:
+        old = timeit.timeit(lambda: at_depth(depth, with_inspect_stack), number=NUMBER) / NUMBER  # noqa: B023
+        new = timeit.timeit(lambda: at_depth(depth, with_targeting), number=NUMBER) / NUMBER  # noqa: B023
+        print(f"{depth:>6} {old * 1e6:>15.1f} us {new * 1e6:>9.1f} us {old / new:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
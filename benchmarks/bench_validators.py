@@ -0,0 +1,117 @@
+"""
+Measure converting large sequences of validated values, e.g., URL allowlists.
+
+The current descriptors, which reuse their validators, are compared to replicas
+of the previous implementations, which imported and created the validator on every conversion.
+
+Run with `python -m benchmarks.bench_validators`.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from env_config import values
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from env_config.typing import Any
+
+ITEMS = 2_000
+REPEAT = 5
+
+
+class LegacyURLValue(values.StringValue):
+    __slots__ = ()
+
+    def convert(self, value: str) -> str:
+        from django.core.validators import URLValidator
+
+        URLValidator()(value)
+        return value
+
+
+class LegacyRegexValue(values.RegexValue):
+    __slots__ = ()
+
+    def convert(self, value: str) -> str:
+        from django.core.validators import RegexValidator
+
+        RegexValidator(regex=self.regex)(value)
+        return value
+
+
+class LegacyEmailValue(values.StringValue):
+    __slots__ = ()
+
+    def convert(self, value: str) -> str:
+        from django.core.validators import validate_email
+
+        validate_email(value)
+        return value
+
+
+class LegacyIPValue(values.StringValue):
+    __slots__ = ()
+
+    def convert(self, value: str) -> str:
+        from django.core.validators import validate_ipv46_address
+
+        validate_ipv46_address(value)
+        return value
+
+
+def best_of(func: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    regex = r"^[a-z]+-\d+$"
+    cases: list[tuple[str, values.Value, values.Value, str]] = [
+        (
+            "URLValue",
+            LegacyURLValue(),
+            values.URLValue(),
+            ",".join(f"https://host{i}.example.com/path" for i in range(ITEMS)),
+        ),
+        (
+            "RegexValue",
+            LegacyRegexValue(regex=regex),
+            values.RegexValue(regex=regex),
+            ",".join(f"item-{i}" for i in range(ITEMS)),
+        ),
+        (
+            "EmailValue",
+            LegacyEmailValue(),
+            values.EmailValue(),
+            ",".join(f"user{i}@example.com" for i in range(ITEMS)),
+        ),
+        (
+            "IPValue",
+            LegacyIPValue(),
+            values.IPValue(),
+            ",".join(f"10.0.{i % 256}.{i % 250}" for i in range(ITEMS)),
+        ),
+    ]
+
+    print(f"ListValue with {ITEMS} items, best of {REPEAT}")
+    print(f"{'child':<12} {'previous':>12} {'current':>12} {'speedup':>9}")
+    for name, legacy_child, current_child, value in cases:
+        legacy = values.ListValue(child=legacy_child)
+        current = values.ListValue(child=current_child)
+        assert legacy.convert(value) == current.convert(value)  # noqa: S101
+
+        before = best_of(lambda: legacy.convert(value))  # noqa: B023
+        after = best_of(lambda: current.convert(value))  # noqa: B023
+        print(f"{name:<12} {before * 1000:>9.2f} ms {after * 1000:>9.2f} ms {before / after:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
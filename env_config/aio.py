@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
+    from .typing import Callable, Collection, Mapping, Sequence
+
+
+__all__ = [
+    "AsyncSource",
+    "CallableSource",
+    "MappingSource",
+    "fetch_values",
+    "gather_values",
+]
+
+
+class AsyncSource(ABC):
+    """
+    Source of values that are fetched asynchronously, e.g., from a secrets agent over a Unix socket
+    or a sidecar HTTP endpoint. All sources of an environment are fetched from concurrently.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    async def fetch_many(self, keys: Collection[str]) -> Mapping[str, str]:
+        """
+        Fetch the values for the given keys, preferably with as few requests as possible.
+        Keys that are not defined in the source should be left out of the result.
+
+        :param keys: Keys to fetch the values for.
+        """
+
+    async def aclose(self) -> None:  # noqa: B027
+        """
+        Release resources tied to the event loop the values were fetched in, e.g., open connections.
+        Called after fetching when the values are fetched with `fetch_values`.
+        """
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class MappingSource(AsyncSource):
+    """
+    Source for values from a mapping, e.g., a `sources.DirectorySource`. The values are read
+    in a separate thread, so that reading files doesn't block fetching from other sources.
+    """
+
+    __slots__ = ("mapping",)
+
+    def __init__(self, mapping: Mapping[str, str]) -> None:
+        """
+        Create a source for the given mapping.
+
+        :param mapping: Mapping to read the values from.
+        """
+        self.mapping = mapping
+
+    async def fetch_many(self, keys: Collection[str]) -> Mapping[str, str]:
+        return await asyncio.to_thread(self.read, keys)
+
+    def read(self, keys: Collection[str]) -> dict[str, str]:
+        mapping = self.mapping
+        return {key: mapping[key] for key in keys if key in mapping}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.mapping!r})"
+
+
+class CallableSource(AsyncSource):
+    """Source for values fetched with a coroutine function, e.g., a method of an existing client."""
+
+    __slots__ = ("func",)
+
+    def __init__(self, func: Callable[[Collection[str]], Awaitable[Mapping[str, str]]]) -> None:
+        """
+        Create a source for the given coroutine function.
+
+        :param func: Coroutine function that takes the keys to fetch, and returns the defined values.
+        """
+        self.func = func
+
+    async def fetch_many(self, keys: Collection[str]) -> Mapping[str, str]:
+        return await self.func(keys)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.func!r})"
+
+
+async def gather_values(sources: Sequence[AsyncSource], keys: Collection[str]) -> dict[str, str]:
+    """
+    Fetch the given keys from all the given sources concurrently. If a key is defined in multiple sources,
+    the value from the source that comes first is used.
+
+    All sources are fetched from before any errors are raised. If fetching from some sources failed,
+    the error from the source that comes first is raised, so that the reported error doesn't depend
+    on which source responded first.
+
+    :param sources: Sources to fetch the values from, from the highest to the lowest priority.
+    :param keys: Keys to fetch the values for.
+    """
+    keys = frozenset(keys)
+    if not keys or not sources:
+        return {}
+
+    results = await asyncio.gather(*(source.fetch_many(keys) for source in sources), return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+    values: dict[str, str] = {}
+    for result in reversed(results):
+        values.update((key, value) for key, value in result.items() if key in keys)  # type: ignore[union-attr]
+    return values
+
+
+def fetch_values(sources: Sequence[AsyncSource], keys: Collection[str]) -> dict[str, str]:
+    """
+    Fetch the given keys from all the given sources concurrently in a new event loop, and close the sources.
+    See `gather_values`.
+
+    If an event loop is already running in the current thread, e.g., when the settings are imported
+    from asynchronous code, the values are fetched in a separate thread, since the running loop
+    cannot be used without returning to it.
+
+    :param sources: Sources to fetch the values from, from the highest to the lowest priority.
+    :param keys: Keys to fetch the values for.
+    """
+
+    async def fetch() -> dict[str, str]:
+        try:
+            return await gather_values(sources, keys)
+        finally:
+            await asyncio.gather(*(source.aclose() for source in sources), return_exceptions=True)
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(fetch())
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="env-config") as executor:
+        return executor.submit(asyncio.run, fetch()).result()
@@ -4,18 +4,33 @@
 import inspect
 import os
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 from django.utils.functional import classproperty
 from dotenv import dotenv_values
 from dotenv.main import find_dotenv
 
-from .constants import ENV_NAME, Undefined
+from .constants import DOTENV_PARSERS, HANDOFF_ENV_NAME, PROFILE_ENV_NAME, Undefined
+from .fields import Field, collect_fields
+from .lazy import LazySettings
+from .parallel import resolve_values_in_parallel
+from .parser import read_dotenv
+from .registry import active_environment_name, default_target_module, registry
+from .sources import DirectorySource, EnvironView, layer_sources
+from .targeting import get_caller_filename, get_module_directory, get_target_globals
 
 if TYPE_CHECKING:
+    from types import ModuleType
+
     from dotenv.main import StrPath
 
-    from .typing import Any
+    from .aio import AsyncSource
+    from .handoff import Handoff
+    from .profiling import Profiler
+    from .reload import DotenvWatcher
+    from .snapshot import Snapshot
+    from .typing import Any, Callable, Collection, Mapping, Sequence
 
 __all__ = [
     "Environment",
@@ -33,12 +48,24 @@ class Environment:
     >>>     pass
     """
 
-    def __init_subclass__(  # noqa: C901
+    # Settings defined in the environment, collected when the class is created.
+    __fields: dict[str, Field] = {}
+
+    def __init_subclass__(  # noqa: PLR0913
         cls,
         *,
         dotenv_path: StrPath | Undefined | None = Undefined,
         use_environ: bool = False,
         overrides_from: type | None = None,
+        target_module: ModuleType | str | None = None,
+        snapshot_path: StrPath | None = None,
+        lazy: bool = False,
+        max_workers: int | None = None,
+        dotenv_parser: str = "python-dotenv",
+        dotenv_projection: bool = False,
+        profile: bool = False,
+        secrets_dir: StrPath | None = None,
+        sources: Sequence[AsyncSource] = (),
     ) -> None:
         """
         When a subclass of environment is created, try to immediately load the settings
@@ -48,21 +75,120 @@ def __init_subclass__(  # noqa: C901
         :param dotenv_path: The path to the `.env` file to load. If set to `None`, the `.env` file will not be loaded.
                             By default, `python-dotenv` will try to find the `.env` file automatically.
         :param use_environ: If set to `True`, use environment variables instead of using a `.env` file.
+                            The variables are read when they are requested, without copying them.
         :param overrides_from: If set, the values from this class will be used as overrides for the values in the
                                environment.
+        :param target_module: Module, or dotted path to the module, where the settings should be set.
+                              By default, the settings are set in the module where the environment is defined.
+                              The `.env` file is also searched starting from this module's directory.
+        :param snapshot_path: If set, the resolved settings are cached to this file, and loaded from it
+                              without converting the values again on subsequent startups, as long as
+                              the inputs of the environment have not changed.
+        :param lazy: If set to `True`, the settings are not loaded when the environment is created,
+                     but when they are first accessed from the module where they are set.
+        :param max_workers: If set, value descriptors are resolved concurrently using a thread pool
+                            with this many workers when the settings are loaded.
+        :param dotenv_parser: Parser to use for the `.env` file. Either `"python-dotenv"` (default),
+                              or `"native"` for the faster built-in parser with the same syntax.
+        :param dotenv_projection: If set to `True`, only the values for the settings defined in the environment
+                                  are kept from the `.env` file or environment variables. With the native parser,
+                                  other values are not decoded at all. With `use_environ`, a snapshot of
+                                  the declared environment variables is taken when the environment is created.
+        :param profile: If set to `True`, record how much time is spent loading each setting and in each hook.
+                        The profile is available from `Environment.profiler`. Profiling can also be enabled
+                        with the `DJANGO_SETTINGS_PROFILE` environment variable.
+        :param secrets_dir: If set, values are also read from files in this directory, where the name
+                            of each file is the key, e.g., Docker secrets or mounted Kubernetes Secrets.
+                            Only the files for the settings defined in the environment are read.
+                            Values from the `.env` file or environment variables take precedence.
+        :param sources: Asynchronous sources to fetch values from, e.g., a secrets agent or a sidecar service.
+                        The values for all the settings defined in the environment are fetched
+                        from all sources concurrently before any values are converted. Values from
+                        the `.env` file or environment variables take precedence, then values from
+                        the sources in the given order, and then values from the secrets directory.
         """
+        if dotenv_parser not in DOTENV_PARSERS:
+            msg = f"Unknown dotenv parser {dotenv_parser!r}. Available parsers: {', '.join(DOTENV_PARSERS)}"
+            raise ValueError(msg)
+
         if overrides_from is not None:
-            for name, value in overrides_from.__dict__.items():
-                if name.isupper() and not name.startswith("_"):
-                    setattr(cls, name, value)
+            for name, field in collect_fields(overrides_from, inherited=False).items():
+                setattr(cls, name, field.value)
 
-        env: str | None = os.environ.get(ENV_NAME)
-        if env is None:  # pragma: no cover
-            msg = f"Environment variable {ENV_NAME!r} must be set before subclassing 'Environment'"
-            raise ValueError(msg)
+        cls.__fields = collect_fields(cls)
+        registry.add(cls)
 
         # If the environment does not match, do not load the environment or even the `.env` file.
-        if cls.__name__.casefold() != env.casefold():
+        if cls.__name__.casefold() != active_environment_name():
+            return
+
+        # Environments loaded from the registry set their settings to the module that loaded them by default.
+        if target_module is None:
+            target_module = default_target_module()
+
+        # Do name mangling to avoid overriding the attribute from a parent class.
+        # This way, we can have multiple environments with different `.env` files,
+        # and allow using values from a parent `.env` file as defaults (if desired).
+        setattr(cls, f"_{cls.__name__}__target_module", target_module)
+        setattr(cls, f"_{cls.__name__}__snapshot_path", snapshot_path)
+        setattr(cls, f"_{cls.__name__}__lazy", lazy)
+        setattr(cls, f"_{cls.__name__}__max_workers", max_workers)
+        setattr(cls, f"_{cls.__name__}__dotenv_parser", dotenv_parser)
+        setattr(cls, f"_{cls.__name__}__dotenv_projection", dotenv_projection)
+        setattr(cls, f"_{cls.__name__}__secrets_dir", secrets_dir)
+        setattr(cls, f"_{cls.__name__}__sources", tuple(sources))
+
+        # Handoffs and profiling are opt-in, so their modules are only imported when they are used.
+        profiler: Profiler | None = None
+        if profile or os.environ.get(PROFILE_ENV_NAME):
+            from .profiling import create_profiler
+
+            profiler = create_profiler(cls, enabled=profile)
+        setattr(cls, f"_{cls.__name__}__profiler", profiler)
+
+        with _profiled(profiler, "load_dotenv"):
+            cls.__load_source(dotenv_path=dotenv_path, use_environ=use_environ)
+
+        # Instrument the settings before `pre_setup`, so that values it reads are profiled as well.
+        if profiler is not None:
+            profiler.instrument(cls.__fields)
+
+        cls.__run_hook("pre_setup", overrides_from=overrides_from)
+
+        # Settings might have been added or replaced in `pre_setup`.
+        cls.__fields = collect_fields(cls)
+        if profiler is not None:
+            profiler.instrument(cls.__fields)
+
+        with _profiled(profiler, "setup"):
+            cls.setup(stack_level=2)
+
+        cls.__run_hook("post_setup", overrides_from=overrides_from)
+        if profiler is not None:
+            profiler.finish()
+
+    @classmethod
+    def __run_hook(cls, name: str, *, overrides_from: type | None) -> None:
+        """Call the given hook of the environment, and the same hook from the overrides class, if defined."""
+        with _profiled(cls.profiler, name):
+            getattr(cls, name)()
+            hook = getattr(overrides_from, name, None)
+            if callable(hook) and hasattr(hook, "__func__"):
+                hook.__func__(cls)
+
+    @classmethod
+    def __load_source(cls, *, dotenv_path: StrPath | Undefined | None, use_environ: bool) -> None:
+        """Load the values for the environment from the `.env` file or environment variables."""
+        # If the settings have been resolved in a parent process, use them instead of loading the values again.
+        handoff: Handoff | None = None
+        if os.environ.get(HANDOFF_ENV_NAME):
+            from .handoff import read_handoff
+
+            handoff = read_handoff(cls)
+        setattr(cls, f"_{cls.__name__}__handoff", handoff)
+        if handoff is not None:
+            setattr(cls, f"_{cls.__name__}__dotenv", handoff.dotenv)
+            setattr(cls, f"_{cls.__name__}__dotenv_path", handoff.dotenv_path)
             return
 
         # If set to `None` explicitly, or using environment, do not load a `.env` file.
@@ -74,48 +200,95 @@ def __init_subclass__(  # noqa: C901
         elif dotenv_path is Undefined:
             dotenv_path = None
 
-        dotenv: dict[str, str] | Undefined
+        keys: set[str] | None = None
+        if cls.dotenv_projection:
+            keys = {field.env_name for field in cls.__fields.values() if field.env_name is not None}
+
+        dotenv: Mapping[str, str] | Undefined
         if use_environ:
-            dotenv = os.environ.copy()
+            # Read environment variables through a view instead of copying them.
+            # With projection, take a snapshot of the declared values so that they don't change.
+            environ = EnvironView()
+            dotenv = environ if keys is None else environ.freeze(keys)
         elif dotenv_path is not Undefined:
-            dotenv = cls.load_dotenv(dotenv_path=dotenv_path, stack_level=2)
+            search_dir: Path | None = None
+            if dotenv_path is None:
+                # The caller of this method is `__init_subclass__`, so the environment is defined two frames up.
+                module_globals = get_target_globals(cls, target_module=cls.target_module, stack_level=2)
+                search_dir = get_module_directory(module_globals, stack_level=2)
+                # Remember where the file was searched from, so that it can be found again when reloading
+                # without inspecting the call stack, which would no longer lead to the environment.
+                setattr(cls, f"_{cls.__name__}__dotenv_search_dir", search_dir)
+            dotenv = call_load_dotenv(cls, dotenv_path=dotenv_path, search_dir=search_dir, keys=keys, stack_level=2)
         else:
             dotenv = Undefined
 
-        # Do name mangling to avoid overriding the attribute from a parent class.
-        # This way, we can have multiple environments with different `.env` files,
-        # and allow using values from a parent `.env` file as defaults (if desired).
+        dotenv = layer_sources(dotenv, cls.load_sources(skip=dotenv), cls.load_secrets())
         setattr(cls, f"_{cls.__name__}__dotenv", dotenv)
         setattr(cls, f"_{cls.__name__}__dotenv_path", dotenv_path)
 
-        cls.pre_setup()
-        if (
-            hasattr(overrides_from, "pre_setup")
-            and callable(overrides_from.pre_setup)
-            and hasattr(overrides_from.pre_setup, "__func__")
-        ):
-            overrides_from.pre_setup.__func__(cls)  # type: ignore[attr-defined]
-
-        cls.setup(stack_level=2)
-
-        cls.post_setup()
-        if (
-            hasattr(overrides_from, "post_setup")
-            and callable(overrides_from.post_setup)
-            and hasattr(overrides_from.post_setup, "__func__")
-        ):
-            overrides_from.post_setup.__func__(cls)  # type: ignore[attr-defined]
-
     @staticmethod
-    def load_dotenv(*, dotenv_path: StrPath | None = None, stack_level: int = 1) -> dict[str, str]:  # pragma: no cover
-        """Load the `.env` file and return the values."""
+    def load_dotenv(  # pragma: no cover
+        *,
+        dotenv_path: StrPath | None = None,
+        search_dir: StrPath | None = None,
+        parser: str = "python-dotenv",
+        keys: Collection[str] | None = None,
+        stack_level: int = 1,
+    ) -> dict[str, str]:
+        """
+        Load the `.env` file and return the values.
+
+        :param dotenv_path: Path to the `.env` file. If not given, the file is searched for.
+        :param search_dir: Directory to start searching the `.env` file from. If not given,
+                           the directory of the code `stack_level` frames up is used.
+        :param parser: Parser to use for the `.env` file, either `"python-dotenv"` or `"native"`.
+        :param keys: If given, only the values for these keys should be returned.
+        :param stack_level: How many frames up to look for the caller if `search_dir` is not given.
+        """
         if dotenv_path is None:
+            if search_dir is None:
+                search_dir = Path(get_caller_filename(stack_level=stack_level)).parent
             # Set the working directory to the django project directory in case called from a tool
-            stack = inspect.stack()
-            settings_dir = Path(stack[stack_level].filename).parent
-            with contextlib.chdir(path=settings_dir):
+            with contextlib.chdir(path=search_dir):
                 dotenv_path = find_dotenv(raise_error_if_not_found=True, usecwd=True)
-        return dotenv_values(dotenv_path=dotenv_path)
+        if parser == "native":
+            return read_dotenv(dotenv_path, keys=keys)
+        dotenv = dotenv_values(dotenv_path=dotenv_path)
+        if keys is None:
+            return dotenv
+        return {key: value for key, value in dotenv.items() if key in keys}
+
+    @classmethod
+    def load_sources(cls, *, skip: Mapping[str, str] | Undefined = Undefined) -> dict[str, str] | Undefined:
+        """
+        Fetch the values for the settings defined in the environment from the asynchronous sources
+        of the environment concurrently. Blocks until all sources have responded.
+
+        :param skip: Values that have already been loaded. These keys are not fetched again.
+        """
+        if not cls.sources:
+            return Undefined
+
+        from .aio import fetch_values
+
+        keys = {
+            field.env_name
+            for field in cls.__fields.values()
+            if field.env_name is not None and (skip is Undefined or field.env_name not in skip)
+        }
+        return fetch_values(cls.sources, keys)
+
+    @classmethod
+    def load_secrets(cls) -> DirectorySource | Undefined:
+        """
+        Scan the secrets directory of the environment for the files of the settings
+        defined in the environment. The files are read when the values are requested.
+        """
+        if cls.secrets_dir is None:
+            return Undefined
+        keys = {field.env_name for field in cls.__fields.values() if field.env_name is not None}
+        return DirectorySource(cls.secrets_dir, keys=keys)
 
     @classmethod
     def pre_setup(cls) -> None:
@@ -127,9 +300,13 @@ def pre_setup(cls) -> None:
     @classmethod
     def setup(cls, *, stack_level: int = 1) -> None:
         """Load settings and set them in the module globals where the environment is defined."""
+        module_globals = get_target_globals(cls, target_module=cls.target_module, stack_level=stack_level)
+        setattr(cls, f"_{cls.__name__}__target_globals", module_globals)
+        if cls.lazy:
+            LazySettings(cls, module_globals, list(cls.__fields)).install()
+            return
+
         settings = cls.load_settings()
-        stack = inspect.stack()
-        module_globals: dict[str, Any] = stack[stack_level].frame.f_globals
         module_globals.update(**settings)
 
     @classmethod
@@ -139,12 +316,188 @@ def post_setup(cls) -> None:
     @classmethod
     def load_settings(cls) -> dict[str, Any]:
         """Load the settings from the environment, validating and returning them."""
-        return {name: getattr(cls, name) for name in dir(cls) if name.isupper() and not name.startswith("_")}
+        handoff: Handoff | None = getattr(cls, f"_{cls.__name__}__handoff", None)
+        if handoff is not None:
+            return handoff.install(cls)
+
+        snapshot: Snapshot | None = None
+        if cls.snapshot_path is not None:
+            from .snapshot import Snapshot
+
+            snapshot = Snapshot(cls.snapshot_path, env=cls)
+            settings = snapshot.load()
+            if settings is not None:
+                return settings
+
+        if cls.max_workers:
+            resolve_values_in_parallel(cls, max_workers=cls.max_workers)
+
+        settings = {name: getattr(cls, name) for name in cls.__fields}
+
+        if snapshot is not None:
+            snapshot.save(settings)
+        return settings
+
+    @classmethod
+    def validate_all(cls) -> dict[str, Any]:
+        """
+        Load and validate all settings of the environment, e.g., for checking the configuration
+        during deployment when the environment is set up lazily.
+        """
+        return cls.load_settings()
+
+    @classmethod
+    def export_handoff(cls, *, kind: str = "file", path: StrPath | None = None, set_environ: bool = True) -> str:
+        """
+        Export the resolved settings of the environment, so that processes started from this process
+        (e.g., web server or task queue workers) can use them instead of resolving the settings again.
+        Returns the location of the exported settings, which is also set to the `DJANGO_SETTINGS_HANDOFF`
+        environment variable, where the environment reads it from in the started processes.
+
+        :param kind: Where to export the settings: `"file"` for a file, `"fd"` for an anonymous file
+                     inherited as a file descriptor, or `"shm"` for a `multiprocessing.shared_memory` block.
+        :param path: Path to the file if exporting to a file. If not given, a temporary file is created.
+        :param set_environ: Whether to set the location to the `DJANGO_SETTINGS_HANDOFF` environment variable.
+        """
+        from .handoff import export_handoff
+
+        return export_handoff(cls, kind=kind, path=path, set_environ=set_environ)
+
+    @classmethod
+    def reload(cls) -> dict[str, Any]:
+        """
+        Load the `.env` file of the environment again, and update the settings whose values have changed,
+        both in the module where the settings were set and in `django.conf.settings`.
+        Returns the changed settings.
+        """
+        from .reload import reload_environment
+
+        return reload_environment(cls)
+
+    @classmethod
+    def watch(
+        cls,
+        *,
+        interval: float = 1.0,
+        use_inotify: bool = True,
+        on_reload: Callable[[dict[str, Any]], None] | None = None,
+    ) -> DotenvWatcher:
+        """
+        Start watching the `.env` file of the environment in a background thread,
+        and reload the environment when the file changes.
+
+        :param interval: How often to check the file for changes, in seconds, if `inotify` is not available.
+        :param use_inotify: Use `inotify` to watch the file, if available.
+        :param on_reload: Function to call with the changed settings after the environment has been reloaded.
+        """
+        from .reload import DotenvWatcher
+
+        return DotenvWatcher(cls, interval=interval, use_inotify=use_inotify, on_reload=on_reload).start()
+
+    @classproperty
+    def fields(cls) -> MappingProxyType[str, Field]:
+        """Settings defined in the environment. Accessing these does not load any values."""
+        return MappingProxyType(cls.__fields)
 
     @classproperty
-    def dotenv(cls) -> dict[str, str] | Undefined:
+    def dotenv(cls) -> Mapping[str, str] | Undefined:
         return getattr(cls, f"_{cls.__name__}__dotenv", Undefined)
 
+    @classproperty
+    def dotenv_parser(cls) -> str:
+        return getattr(cls, f"_{cls.__name__}__dotenv_parser", "python-dotenv")
+
+    @classproperty
+    def dotenv_projection(cls) -> bool:
+        return getattr(cls, f"_{cls.__name__}__dotenv_projection", False)
+
     @classproperty
     def dotenv_path(cls) -> str | Undefined | None:
         return getattr(cls, f"_{cls.__name__}__dotenv_path", Undefined)
+
+    @classproperty
+    def lazy(cls) -> bool:
+        return getattr(cls, f"_{cls.__name__}__lazy", False)
+
+    @classproperty
+    def max_workers(cls) -> int | None:
+        return getattr(cls, f"_{cls.__name__}__max_workers", None)
+
+    @classproperty
+    def profiler(cls) -> Profiler | None:
+        return getattr(cls, f"_{cls.__name__}__profiler", None)
+
+    @classproperty
+    def secrets_dir(cls) -> StrPath | None:
+        return getattr(cls, f"_{cls.__name__}__secrets_dir", None)
+
+    @classproperty
+    def sources(cls) -> tuple[AsyncSource, ...]:
+        return getattr(cls, f"_{cls.__name__}__sources", ())
+
+    @classproperty
+    def snapshot_path(cls) -> StrPath | None:
+        return getattr(cls, f"_{cls.__name__}__snapshot_path", None)
+
+    @classproperty
+    def target_module(cls) -> ModuleType | str | None:
+        return getattr(cls, f"_{cls.__name__}__target_module", None)
+
+
+def call_load_dotenv(
+    env: type[Environment],
+    *,
+    dotenv_path: StrPath | None,
+    search_dir: StrPath | None = None,
+    keys: Collection[str] | None = None,
+    stack_level: int = 1,
+) -> Mapping[str, str]:
+    """
+    Load the `.env` file with the `load_dotenv` method of the given environment.
+
+    Overrides of `load_dotenv` written for earlier versions don't accept all the arguments,
+    so only the arguments the override accepts are passed to it. If it doesn't accept `keys`,
+    the values are filtered after loading them.
+
+    :param env: The environment to load the `.env` file for.
+    :param dotenv_path: Path to the `.env` file. If not given, the file is searched for.
+    :param search_dir: Directory to start searching the `.env` file from.
+    :param keys: If given, only the values for these keys are returned.
+    :param stack_level: How many frames up from the caller of this function the environment is defined.
+    """
+    # `load_dotenv` is called from this function, so the environment is two more frames up from it.
+    kwargs: dict[str, Any] = {
+        "dotenv_path": dotenv_path,
+        "search_dir": search_dir,
+        "parser": env.dotenv_parser,
+        "keys": keys,
+        "stack_level": stack_level + 2,
+    }
+    load_dotenv = env.load_dotenv
+    if load_dotenv is Environment.load_dotenv:
+        return load_dotenv(**kwargs)
+
+    accepted = _keyword_arguments(load_dotenv)
+    if accepted is not None:
+        kwargs = {name: value for name, value in kwargs.items() if name in accepted}
+
+    dotenv = load_dotenv(**kwargs)
+    if keys is not None and "keys" not in kwargs:
+        return {key: value for key, value in dotenv.items() if key in keys}
+    return dotenv
+
+
+def _keyword_arguments(func: Callable[..., Any]) -> frozenset[str] | None:
+    """Get the names of the keyword arguments the given function accepts, or `None` if it accepts any."""
+    parameters = inspect.signature(func).parameters.values()
+    if any(parameter.kind is parameter.VAR_KEYWORD for parameter in parameters):
+        return None
+    kinds = (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+    return frozenset(parameter.name for parameter in parameters if parameter.kind in kinds)
+
+
+def _profiled(profiler: Profiler | None, name: str) -> contextlib.AbstractContextManager[None]:
+    # Same as `profiling.profiled`, without importing the profiling module when profiling is not enabled.
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.span(name)
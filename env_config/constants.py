@@ -1,7 +1,16 @@
 from __future__ import annotations
 
 __all__ = [
+    "ARRAY_TYPECODES",
+    "DOTENV_PARSERS",
     "ENV_NAME",
+    "HANDOFF_ENV_NAME",
+    "HANDOFF_KINDS",
+    "IMPORT_MODES",
+    "JSON_BACKENDS",
+    "KV_APIS",
+    "PROFILE_ENV_NAME",
+    "SECRETS_MAX_SIZE",
     "Undefined",
 ]
 
@@ -19,3 +28,32 @@ def __bool__(self) -> bool:
 Undefined = Undefined()
 
 ENV_NAME = "DJANGO_SETTINGS_ENVIRONMENT"
+
+# Environment variable for the location of resolved settings handed off from a parent process.
+# See `handoff.export_handoff`.
+HANDOFF_ENV_NAME = "DJANGO_SETTINGS_HANDOFF"
+
+# Locations the resolved settings can be handed off in. See `handoff.export_handoff`.
+HANDOFF_KINDS = ("file", "fd", "shm")
+
+# Environment variable for enabling profiling of loading the settings. See `profiling.create_profiler`.
+PROFILE_ENV_NAME = "DJANGO_SETTINGS_PROFILE"
+
+# Parsers that can be used to parse `.env` files. See `Environment.__init_subclass__`.
+DOTENV_PARSERS = ("python-dotenv", "native")
+
+# Modes for validating import strings. See `values.ImportStringValue`.
+IMPORT_MODES = ("import", "spec", "lazy")
+
+# Typecodes of the `array` module that can be used for arrays of numbers. See `values.ArrayValue`.
+ARRAY_TYPECODES = ("b", "B", "h", "H", "i", "I", "l", "L", "q", "Q", "f", "d")
+
+# Libraries that can be used for parsing JSON. See `jsonlib.get_json_backend`.
+JSON_BACKENDS = ("auto", "orjson", "ujson", "json")
+
+# Maximum size of a file read from a secrets directory, in bytes. See `sources.DirectorySource`.
+# Same as the maximum size of a Kubernetes Secret or ConfigMap.
+SECRETS_MAX_SIZE = 1024 * 1024
+
+# APIs of key-value services values can be fetched from. See `kvstore.HttpKeyValueSource`.
+KV_APIS = ("consul", "etcd")
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import contextlib
+import threading
+from collections import defaultdict
+from types import MethodType
+from typing import TYPE_CHECKING
+
+from .errors import CircularDependencyError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from .base import Environment
+    from .typing import Any, Callable, Mapping
+
+
+__all__ = [
+    "DependencyRecorder",
+    "affected_settings",
+    "resolving",
+]
+
+
+# Settings currently being computed in this thread, for detecting circular dependencies.
+_local = threading.local()
+
+
+@contextlib.contextmanager
+def resolving(env: type[Environment], name: str) -> Iterator[None]:
+    """
+    Mark the given setting as being computed for the environment in the current thread.
+    Raises `CircularDependencyError` if the setting is already being computed.
+
+    :param env: The environment the setting is computed for.
+    :param name: The name of the setting.
+    """
+    stack: list[tuple[type[Environment], str]] = _local.__dict__.setdefault("stack", [])
+    if (env, name) in stack:
+        cycle = [item for _, item in stack[stack.index((env, name)) :]]
+        raise CircularDependencyError(env=env, cycle=[*cycle, name])
+
+    stack.append((env, name))
+    try:
+        yield
+    finally:
+        stack.pop()
+
+
+class DependencyRecorder:
+    """
+    Proxy for an environment, which records the settings read through it.
+    Classmethods of the environment are bound to the proxy, so that settings
+    read by them are recorded as well.
+    """
+
+    __slots__ = ("_dependencies", "_env", "_resolve")
+
+    def __init__(self, env: type[Environment], resolve: Callable[[str], Any] | None = None) -> None:
+        """
+        Create a recording proxy for the given environment.
+
+        :param env: The environment to proxy.
+        :param resolve: Function for getting the values of settings instead of the environment,
+                        e.g., for computing settings with values that have not been set yet.
+        """
+        self._env = env
+        self._resolve = resolve
+        self._dependencies: set[str] = set()
+
+    @property
+    def dependencies(self) -> frozenset[str]:
+        """Settings read through the proxy."""
+        return frozenset(self._dependencies)
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self._env.fields:
+            self._dependencies.add(name)
+            if self._resolve is not None:
+                return self._resolve(name)
+
+        value = getattr(self._env, name)
+        if isinstance(value, MethodType) and value.__self__ is self._env:
+            return MethodType(value.__func__, self)
+        return value
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} for {self._env.__name__}>"
+
+
+def affected_settings(
+    dependencies: Mapping[str, frozenset[str] | None],
+    changed: Iterable[str],
+) -> set[str]:
+    """
+    Find the settings affected by changes to the given settings, directly or transitively.
+
+    :param dependencies: Settings that depend on other settings, mapped to the settings they depend on.
+                         Settings whose dependencies are not known (`None`) are always affected.
+    :param changed: Settings that have changed.
+    """
+    dependents: defaultdict[str, set[str]] = defaultdict(set)
+    affected: set[str] = set()
+    for name, depends_on in dependencies.items():
+        if depends_on is None:
+            affected.add(name)
+            continue
+        for dependency in depends_on:
+            dependents[dependency].add(name)
+
+    queue = [*changed, *affected]
+    while queue:
+        for dependent in dependents[queue.pop()]:
+            if dependent not in affected:
+                affected.add(dependent)
+                queue.append(dependent)
+
+    return affected
@@ -2,16 +2,21 @@
 
 from typing import TYPE_CHECKING
 
-from env_config.constants import Undefined
+from env_config.constants import ENV_NAME, Undefined
 
 if TYPE_CHECKING:
     from env_config import Environment
+    from env_config.typing import Iterable
 
 
 __all__ = [
+    "CircularDependencyError",
     "DjangoEnvConfigError",
+    "JsonSchemaError",
     "MissingEnvValueError",
     "MissingExtraDependencyError",
+    "SourceError",
+    "UnknownEnvironmentError",
 ]
 
 
@@ -26,6 +31,8 @@ def __init__(self, *, name: str, env: type[Environment]) -> None:
         msg = f"Value {name!r} in environment {env.__name__!r}"
         if env.dotenv_path is not Undefined:
             msg += " not defined in the .env file and value does not have a default"
+        elif env.sources or env.secrets_dir is not None:
+            msg += " not defined in the sources of the environment and value does not have a default"
         else:
             msg += " needs a default value since environment does not define a `dotenv_path`"
 
@@ -34,3 +41,35 @@ def __init__(self, *, name: str, env: type[Environment]) -> None:
 
 class MissingExtraDependencyError(DjangoEnvConfigError):
     """Base class for all Django Environment Config errors."""
+
+
+class CircularDependencyError(DjangoEnvConfigError):
+    """Error raised when computed settings depend on each other in a cycle."""
+
+    def __init__(self, *, env: type[Environment], cycle: list[str]) -> None:
+        self.cycle = cycle
+        msg = f"Circular dependency between settings in environment {env.__name__!r}: {' -> '.join(cycle)}"
+        super().__init__(msg)
+
+
+class JsonSchemaError(DjangoEnvConfigError, ValueError):
+    """Error raised when a JSON value does not match its schema."""
+
+    def __init__(self, *, path: str, message: str) -> None:
+        self.path = path
+        super().__init__(f"Invalid JSON at {path!r}: {message}")
+
+
+class SourceError(DjangoEnvConfigError):
+    """Error raised when a source of values responds with an error."""
+
+
+class UnknownEnvironmentError(DjangoEnvConfigError, LookupError):
+    """Error raised when an environment is requested that has not been registered or defined."""
+
+    def __init__(self, *, name: str, known: Iterable[str]) -> None:
+        self.name = name
+        self.known = list(known)
+        msg = f"Unknown environment {name!r} (selected with {ENV_NAME!r}). "
+        msg += f"Known environments: {', '.join(self.known)}" if self.known else "No environments are known"
+        super().__init__(msg)
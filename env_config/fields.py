@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .values import Value
+
+if TYPE_CHECKING:
+    from .typing import Any
+
+
+__all__ = [
+    "Field",
+    "collect_fields",
+]
+
+
+@dataclass(frozen=True, slots=True)
+class Field:
+    """A setting defined in an environment."""
+
+    name: str
+    """Name of the setting."""
+
+    value: Any
+    """Value descriptor or plain value of the setting, as defined in the class body."""
+
+    owner: type
+    """Class where the setting is defined."""
+
+    env_name: str | None
+    """Name of the `.env` file value or environment variable the setting is loaded from, if any."""
+
+    @property
+    def is_descriptor(self) -> bool:
+        return isinstance(self.value, Value)
+
+
+def collect_fields(klass: type, *, inherited: bool = True) -> dict[str, Field]:
+    """
+    Collect the settings defined in the given class, i.e., all its upper-case attributes
+    that don't start with an underscore, without loading any values.
+
+    :param klass: The class to collect the settings from.
+    :param inherited: If set to `False`, only collect settings defined in the class itself.
+    """
+    owners = reversed(klass.__mro__) if inherited else (klass,)
+    fields: dict[str, Field] = {}
+    for owner in owners:
+        for name, value in vars(owner).items():
+            if name.startswith("_") or not name.isupper():
+                continue
+
+            env_name: str | None = None
+            if isinstance(value, Value) and not value.skip_env:
+                env_name = value.name
+
+            fields[name] = Field(name=name, value=value, owner=owner, env_name=env_name)
+
+    return fields
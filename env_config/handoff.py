@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import struct
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .constants import HANDOFF_ENV_NAME, HANDOFF_KINDS, Undefined
+from .reload import resolve_dotenv_path
+from .snapshot import compute_fingerprint
+
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
+    from dotenv.main import StrPath
+
+    from .base import Environment
+    from .typing import Any
+
+
+__all__ = [
+    "Handoff",
+    "export_handoff",
+    "read_handoff",
+]
+
+
+logger = logging.getLogger(__name__)
+
+HANDOFF_MAGIC = b"ENVCFGHO"
+HANDOFF_FORMAT = 1
+# Magic, format version, environment fingerprint, payload digest, payload length.
+HANDOFF_HEADER = struct.Struct(">8sH32s32sQ")
+
+# Shared memory blocks created by this process, kept alive until the process exits.
+_shared_memory: list[SharedMemory] = []
+
+
+@dataclass(frozen=True, slots=True)
+class Handoff:
+    """Resolved settings of an environment, handed off from a parent process."""
+
+    settings: dict[str, Any]
+    """Resolved settings of the environment."""
+
+    dotenv: dict[str, str] | Undefined
+    """Raw values read by the value descriptors from the `.env` file or environment variables."""
+
+    dotenv_path: str | Undefined | None
+    """Path to the `.env` file the environment was loaded from."""
+
+    def install(self, env: type[Environment]) -> dict[str, Any]:
+        """Set the handed off settings as the values of the environment's value descriptors."""
+        for field in env.fields.values():
+            if field.is_descriptor and field.name in self.settings:
+                field.value.set_value(env, self.settings[field.name])
+        return self.settings
+
+
+def dumps(env: type[Environment]) -> bytes:
+    """
+    Serialize the resolved settings of the given environment into a handoff blob.
+    Resolves all settings that have not been loaded yet.
+
+    :param env: The environment to serialize.
+    """
+    # Undefined values are left out, since `Undefined` cannot be pickled.
+    content: dict[str, Any] = {"settings": {name: getattr(env, name) for name in env.fields}}
+    if env.dotenv is not Undefined:
+        content["dotenv"] = {
+            field.env_name: env.dotenv[field.env_name]
+            for field in env.fields.values()
+            if field.env_name is not None and field.env_name in env.dotenv
+        }
+
+    if env.dotenv_path is not Undefined:
+        # Store the path of a searched `.env` file so that it's not searched again, e.g., when reloading.
+        try:
+            content["dotenv_path"] = str(resolve_dotenv_path(env))
+        except OSError:
+            content["dotenv_path"] = None
+
+    payload = pickle.dumps(content, protocol=pickle.HIGHEST_PROTOCOL)
+    header = HANDOFF_HEADER.pack(
+        HANDOFF_MAGIC,
+        HANDOFF_FORMAT,
+        bytes.fromhex(compute_fingerprint(env, include_fields=False)),
+        hashlib.sha256(payload).digest(),
+        len(payload),
+    )
+    return header + payload
+
+
+def loads(data: bytes | memoryview, env: type[Environment]) -> Handoff | None:
+    """
+    Deserialize a handoff blob for the given environment.
+    Returns `None` if the blob is not valid, or was created for a different environment definition.
+
+    :param data: The handoff blob.
+    :param env: The environment to deserialize the blob for.
+    """
+    if len(data) < HANDOFF_HEADER.size:
+        return None
+
+    magic, version, fingerprint, digest, length = HANDOFF_HEADER.unpack_from(data)
+    if magic != HANDOFF_MAGIC or version != HANDOFF_FORMAT:
+        return None
+    if fingerprint.hex() != compute_fingerprint(env, include_fields=False):
+        return None
+
+    payload = data[HANDOFF_HEADER.size : HANDOFF_HEADER.size + length]
+    if len(payload) != length or hashlib.sha256(payload).digest() != digest:
+        return None
+
+    content: dict[str, Any] = pickle.loads(payload)  # noqa: S301
+    return Handoff(
+        settings=content["settings"],
+        dotenv=content.get("dotenv", Undefined),
+        dotenv_path=content.get("dotenv_path", Undefined),
+    )
+
+
+def export_handoff(
+    env: type[Environment],
+    *,
+    kind: str = "file",
+    path: StrPath | None = None,
+    set_environ: bool = True,
+) -> str:
+    """
+    Export the resolved settings of the given environment, so that processes started from this process
+    can use them instead of resolving the settings again. Returns the location of the exported settings,
+    which is also set to the `DJANGO_SETTINGS_HANDOFF` environment variable (unless `set_environ=False`).
+
+    :param env: The environment to export.
+    :param kind: Where to export the settings: `"file"` for a file, `"fd"` for an anonymous file
+                 inherited as a file descriptor (must be passed to the child processes),
+                 or `"shm"` for a `multiprocessing.shared_memory` block.
+    :param path: Path to the file if exporting to a file. If not given, a temporary file is created.
+    :param set_environ: Whether to set the location to the `DJANGO_SETTINGS_HANDOFF` environment variable.
+    """
+    if kind not in HANDOFF_KINDS:
+        msg = f"Unknown handoff kind {kind!r}. Available kinds: {', '.join(HANDOFF_KINDS)}"
+        raise ValueError(msg)
+
+    data = dumps(env)
+    if kind == "file":
+        location = f"file:{_export_file(data, path)}"
+    elif kind == "fd":
+        location = f"fd:{_export_fd(data)}"
+    else:
+        location = f"shm:{_export_shared_memory(data)}"
+
+    if set_environ:
+        os.environ[HANDOFF_ENV_NAME] = location
+    return location
+
+
+def _export_file(data: bytes, path: StrPath | None) -> Path:
+    if path is None:
+        fd, name = tempfile.mkstemp(prefix="env-config-", suffix=".handoff")
+        path = Path(name)
+    else:
+        path = Path(path)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+
+    with os.fdopen(fd, "wb") as file:
+        file.write(data)
+    return path.absolute()
+
+
+def _export_fd(data: bytes) -> int:
+    memfd_create = getattr(os, "memfd_create", None)
+    if memfd_create is not None:
+        fd = memfd_create("env-config-handoff", 0)
+    else:  # pragma: no cover
+        fd, name = tempfile.mkstemp(prefix="env-config-", suffix=".handoff")
+        os.unlink(name)  # noqa: PTH108
+
+    os.write(fd, data)
+    os.set_inheritable(fd, True)  # noqa: FBT003
+    return fd
+
+
+def _export_shared_memory(data: bytes) -> str:
+    from multiprocessing.shared_memory import SharedMemory
+
+    shm = SharedMemory(create=True, size=len(data))
+    shm.buf[: len(data)] = data
+    # The block is removed when this process exits.
+    _shared_memory.append(shm)
+    return shm.name
+
+
+def read_handoff(env: type[Environment]) -> Handoff | None:
+    """
+    Read the handed off settings for the given environment from the location in
+    the `DJANGO_SETTINGS_HANDOFF` environment variable. Returns `None` if there is no handoff,
+    or if it cannot be read, or it was created for a different environment definition.
+
+    :param env: The environment to read the settings for.
+    """
+    location = os.environ.get(HANDOFF_ENV_NAME)
+    if not location:
+        return None
+
+    kind, _, target = location.partition(":")
+    try:
+        if kind == "file":
+            handoff = loads(Path(target).read_bytes(), env)
+        elif kind == "fd":
+            handoff = loads(_read_fd(int(target)), env)
+        elif kind == "shm":
+            handoff = _read_shared_memory(target, env)
+        else:
+            msg = f"Unknown handoff kind {kind!r}"
+            raise ValueError(msg)  # noqa: TRY301
+    except Exception:
+        logger.warning(f"Could not read settings handoff from {location!r}", exc_info=True)
+        return None
+
+    if handoff is None:
+        logger.warning(f"Settings handoff in {location!r} is not valid for environment {env.__name__!r}")
+    return handoff
+
+
+def _read_fd(fd: int) -> bytes:
+    # Use `pread` so that the file offset shared with other processes is not changed.
+    header = os.pread(fd, HANDOFF_HEADER.size, 0)
+    length = HANDOFF_HEADER.unpack(header)[-1] if len(header) == HANDOFF_HEADER.size else 0
+    return header + os.pread(fd, length, HANDOFF_HEADER.size)
+
+
+def _read_shared_memory(name: str, env: type[Environment]) -> Handoff | None:
+    from multiprocessing import resource_tracker
+    from multiprocessing.shared_memory import SharedMemory
+
+    shm = SharedMemory(name=name)
+    # Attaching to a block registers it to the resource tracker (before Python 3.13),
+    # which would remove the block when this process exits.
+    resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]  # noqa: SLF001
+    try:
+        return loads(bytes(shm.buf), env)
+    finally:
+        shm.close()
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import ast
+import sys
+from typing import TYPE_CHECKING
+
+from django.utils.module_loading import import_string
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from importlib.machinery import ModuleSpec
+
+    from .typing import Any, Sequence
+
+
+__all__ = [
+    "ImportString",
+    "find_module_spec",
+    "validate_import_string",
+]
+
+
+def find_module_spec(name: str) -> ModuleSpec | None:
+    """
+    Find the spec for the module with the given dotted name without executing the module or its parent packages.
+    Parent packages that have already been imported are used as is.
+
+    :param name: Dotted name of the module.
+    """
+    path: Sequence[str] | None = None
+    spec: ModuleSpec | None = None
+    parts = name.split(".")
+    for i in range(len(parts)):
+        current = ".".join(parts[: i + 1])
+        module = sys.modules.get(current)
+        if module is not None:
+            spec = getattr(module, "__spec__", None)
+            path = getattr(module, "__path__", None)
+            continue
+
+        if i > 0 and path is None:
+            # Parent is not a package, so it cannot contain submodules.
+            return None
+
+        spec = _find_spec(current, path)
+        if spec is None:
+            return None
+        path = spec.submodule_search_locations
+
+    return spec
+
+
+def _find_spec(name: str, path: Sequence[str] | None) -> ModuleSpec | None:
+    # Same lookup as the import system does, but without loading the parent packages.
+    for finder in sys.meta_path:
+        find_spec = getattr(finder, "find_spec", None)
+        if find_spec is None:
+            continue
+        spec = find_spec(name, path)
+        if spec is not None:
+            return spec
+    return None
+
+
+def validate_import_string(dotted_path: str, *, check_attribute: bool = True) -> None:
+    """
+    Validate that the given dotted path could be imported with `django.utils.module_loading.import_string`
+    without importing it. Modules that have not been imported are not executed, but their attributes can be
+    checked by statically analyzing their source code. Raises `ImportError` if the path is not importable.
+
+    :param dotted_path: Dotted path to a module attribute, e.g., `django.core.files.storage.FileSystemStorage`.
+    :param check_attribute: Whether to check that the module defines the attribute.
+    """
+    try:
+        module_path, attribute = dotted_path.rsplit(".", 1)
+    except ValueError as error:
+        msg = f"{dotted_path} doesn't look like a module path"
+        raise ImportError(msg) from error
+
+    module = sys.modules.get(module_path)
+    if module is not None:
+        if check_attribute and not hasattr(module, attribute):
+            msg = f'Module "{module_path}" does not define a "{attribute}" attribute/class'
+            raise ImportError(msg)
+        return
+
+    spec = find_module_spec(module_path)
+    if spec is None:
+        msg = f"No module named {module_path!r}"
+        raise ImportError(msg, name=module_path)
+
+    if check_attribute and not _defines_attribute(spec, attribute):
+        msg = f'Module "{module_path}" does not define a "{attribute}" attribute/class'
+        raise ImportError(msg)
+
+
+def _defines_attribute(spec: ModuleSpec, attribute: str) -> bool:
+    # Submodules of a package can be accessed as attributes once imported.
+    if spec.submodule_search_locations is not None and _find_spec(
+        f"{spec.name}.{attribute}",
+        spec.submodule_search_locations,
+    ):
+        return True
+
+    source: str | None = None
+    get_source = getattr(spec.loader, "get_source", None)
+    if get_source is not None:
+        try:
+            source = get_source(spec.name)
+        except (ImportError, OSError):
+            source = None
+
+    # Without source code (e.g., extension modules), the attribute cannot be checked statically.
+    if source is None:
+        return True
+
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return False
+
+    names = set(_defined_names(tree.body))
+    # Star imports and module level `__getattr__` can define any name.
+    return attribute in names or "*" in names or "__getattr__" in names
+
+
+def _defined_names(statements: Iterable[ast.stmt]) -> Iterable[str]:
+    """Find the names defined by module level statements, including those in conditional blocks."""
+    for node in statements:
+        if isinstance(node, ast.If | ast.For | ast.While | ast.With | ast.Try | ast.TryStar):
+            for block in ("body", "orelse", "finalbody"):
+                yield from _defined_names(getattr(node, block, ()))
+            for handler in getattr(node, "handlers", ()):
+                yield from _defined_names(handler.body)
+        else:
+            yield from _statement_names(node)
+
+
+def _statement_names(node: ast.stmt) -> Iterable[str]:
+    match node:
+        case ast.FunctionDef() | ast.AsyncFunctionDef() | ast.ClassDef():
+            yield node.name
+        case ast.Assign():
+            for target in node.targets:
+                yield from _target_names(target)
+        case ast.AnnAssign() | ast.AugAssign():
+            yield from _target_names(node.target)
+        case ast.Import():
+            for alias in node.names:
+                yield alias.asname or alias.name.split(".")[0]
+        case ast.ImportFrom():
+            for alias in node.names:
+                yield alias.asname or alias.name
+
+
+def _target_names(target: ast.expr) -> Iterable[str]:
+    match target:
+        case ast.Name():
+            yield target.id
+        case ast.Tuple() | ast.List():
+            for element in target.elts:
+                yield from _target_names(element)
+        case ast.Starred():
+            yield from _target_names(target.value)
+
+
+class ImportString(str):
+    """
+    Dotted path to a module attribute, which is imported when it's first loaded.
+    Can be used anywhere a dotted path string is expected.
+    """
+
+    def load(self) -> Any:
+        """Import the object the dotted path refers to. The object is cached after the first import."""
+        try:
+            return self.__dict__["_object"]
+        except KeyError:
+            obj = self.__dict__["_object"] = import_string(str(self))
+            return obj
+
+    def __reduce__(self) -> tuple[type[ImportString], tuple[str]]:
+        # Don't include the imported object when pickling.
+        return type(self), (str(self),)
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import importlib
+import json
+import mmap
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from .constants import JSON_BACKENDS
+from .errors import JsonSchemaError, MissingExtraDependencyError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .typing import Any, Callable, Mapping
+
+    Validator = Callable[[Any, str], None]
+
+
+__all__ = [
+    "JsonBackend",
+    "compile_schema",
+    "get_json_backend",
+    "read_json_file",
+]
+
+
+# Fast backends, in the order they are preferred when the backend is selected automatically.
+FAST_BACKENDS = ("orjson", "ujson")
+# Fast backends that can parse a `memoryview` without copying it to `bytes` first.
+BUFFER_BACKENDS = ("orjson",)
+
+
+@dataclass(frozen=True, slots=True)
+class JsonBackend:
+    """A library for parsing JSON."""
+
+    name: str
+    """Name of the library module."""
+
+    loads: Callable[[Any], Any]
+    """Function for parsing a JSON document."""
+
+    accepts_buffer: bool
+    """Whether `loads` can parse a `memoryview` without copying it."""
+
+    def parse(self, data: str | bytes | memoryview) -> Any:
+        """
+        Parse the given JSON document. Errors for invalid documents are the same as with
+        the standard library `json` module. Note that `orjson` parses integers over 64 bits as floats.
+
+        :param data: The JSON document.
+        """
+        if isinstance(data, memoryview) and not self.accepts_buffer:
+            data = data.tobytes()
+        if self.name == "json":
+            return json.loads(data)  # type: ignore[arg-type]
+
+        try:
+            return self.loads(data)
+        except ValueError:
+            # Fast backends reject some documents that `json` accepts, e.g., ones with `NaN` or `Infinity`.
+            # Parse the document again with `json`, which either accepts it or raises the same error as `json`.
+            return json.loads(data.tobytes() if isinstance(data, memoryview) else data)
+
+
+@lru_cache(maxsize=len(JSON_BACKENDS))
+def get_json_backend(name: str = "auto") -> JsonBackend:
+    """
+    Get the JSON backend with the given name.
+
+    :param name: `"orjson"`, `"ujson"` or `"json"` for the standard library `json` module.
+                 With `"auto"`, the fastest installed backend is used.
+    """
+    if name not in JSON_BACKENDS:
+        msg = f"Unknown JSON backend {name!r}. Available backends: {', '.join(JSON_BACKENDS)}"
+        raise ValueError(msg)
+
+    if name == "json":
+        return JsonBackend(name="json", loads=json.loads, accepts_buffer=False)
+
+    for backend in FAST_BACKENDS if name == "auto" else (name,):
+        try:
+            module = importlib.import_module(backend)
+        except ImportError as error:
+            if name == "auto":
+                continue
+            msg = f"The `{backend}` library is not installed. Install it to use it as the JSON backend."
+            raise MissingExtraDependencyError(msg) from error
+        return JsonBackend(name=backend, loads=module.loads, accepts_buffer=backend in BUFFER_BACKENDS)
+
+    return get_json_backend("json")
+
+
+def read_json_file(path: Path, backend: JsonBackend) -> Any:
+    """
+    Parse the given JSON file. The file is memory-mapped, so that it doesn't need to be read
+    into a separate buffer first, if the backend can parse from a buffer directly.
+
+    :param path: Path to the JSON file.
+    :param backend: Backend to parse the file with.
+    """
+    with path.open("rb") as file:
+        # Empty files cannot be memory-mapped.
+        if os.fstat(file.fileno()).st_size == 0:
+            return backend.parse(b"")
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer, memoryview(buffer) as view:
+            return backend.parse(view)
+
+
+# JSON types in schemas, mapped to the Python types they are parsed to.
+SCHEMA_TYPES: dict[str, tuple[type, ...]] = {
+    "object": (dict,),
+    "array": (list,),
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "null": (type(None),),
+}
+
+SCHEMA_KEYWORDS = frozenset(
+    {
+        "type",
+        "enum",
+        "properties",
+        "required",
+        "additionalProperties",
+        "items",
+        "minimum",
+        "maximum",
+        "minItems",
+        "maxItems",
+    }
+)
+
+
+def compile_schema(schema: Mapping[str, Any]) -> Validator:
+    """
+    Compile a schema into a function that validates parsed JSON documents.
+    Raises `JsonSchemaError` if the document is not valid, with a path to the invalid part.
+
+    Schemas are a small subset of JSON Schema. Supported keywords are `type` (a type or a list of types),
+    `enum`, `properties`, `required`, `additionalProperties` (a boolean or a schema), `items`,
+    `minimum`, `maximum`, `minItems` and `maxItems`.
+
+    :param schema: The schema.
+    """
+    unknown = set(schema) - SCHEMA_KEYWORDS
+    if unknown:
+        msg = f"Unsupported schema keywords: {', '.join(sorted(unknown))}"
+        raise ValueError(msg)
+
+    checks = _compile_checks(schema)
+    if len(checks) == 1:
+        return checks[0]
+
+    def validate(value: Any, path: str = "$") -> None:
+        for check in checks:
+            check(value, path)
+
+    return validate
+
+
+def _compile_checks(schema: Mapping[str, Any]) -> list[Validator]:
+    checks: list[Validator] = []
+
+    if "type" in schema:
+        checks.append(_check_type(schema["type"]))
+
+    if "enum" in schema:
+        checks.append(_check_enum(schema["enum"]))
+
+    if "minimum" in schema or "maximum" in schema:
+        checks.append(_check_range(schema.get("minimum"), schema.get("maximum"), "value"))
+
+    if "minItems" in schema or "maxItems" in schema:
+        checks.append(_check_range(schema.get("minItems"), schema.get("maxItems"), "length"))
+
+    if {"properties", "required", "additionalProperties"} & set(schema):
+        checks.append(_check_object(schema))
+
+    if "items" in schema:
+        checks.append(_check_items(compile_schema(schema["items"])))
+
+    return checks
+
+
+def _type_name(value: Any) -> str:
+    for name, types in SCHEMA_TYPES.items():
+        if isinstance(value, types) and (name not in {"integer", "number"} or not isinstance(value, bool)):
+            return name
+    return type(value).__name__  # pragma: no cover
+
+
+def _check_type(expected: str | list[str]) -> Validator:
+    names = [expected] if isinstance(expected, str) else list(expected)
+    unknown = [name for name in names if name not in SCHEMA_TYPES]
+    if unknown:
+        msg = f"Unsupported schema types: {', '.join(unknown)}"
+        raise ValueError(msg)
+
+    # Parsed values have exactly these types, so most values can be checked without `isinstance`.
+    # Note that `bool` is not included for integers, even though it's a subclass of `int`.
+    allowed = frozenset(python_type for name in names for python_type in SCHEMA_TYPES[name])
+
+    def check(value: Any, path: str) -> None:
+        if type(value) in allowed:
+            return
+        name = _type_name(value)
+        # Integers are also numbers.
+        if name not in names and not (name == "integer" and "number" in names):
+            msg = f"expected {' or '.join(names)}, got {name}"
+            raise JsonSchemaError(path=path, message=msg)
+
+    return check
+
+
+def _check_enum(options: list[Any]) -> Validator:
+    def check(value: Any, path: str) -> None:
+        if value not in options:
+            msg = f"expected one of {options!r}, got {value!r}"
+            raise JsonSchemaError(path=path, message=msg)
+
+    return check
+
+
+def _check_range(minimum: float | None, maximum: float | None, kind: str) -> Validator:
+    def check(value: Any, path: str) -> None:
+        if kind == "length":
+            if not isinstance(value, list):
+                return
+            value = len(value)
+        elif isinstance(value, bool) or not isinstance(value, int | float):
+            return
+
+        if minimum is not None and value < minimum:
+            msg = f"expected {kind} to be at least {minimum}, got {value}"
+            raise JsonSchemaError(path=path, message=msg)
+        if maximum is not None and value > maximum:
+            msg = f"expected {kind} to be at most {maximum}, got {value}"
+            raise JsonSchemaError(path=path, message=msg)
+
+    return check
+
+
+def _check_object(schema: Mapping[str, Any]) -> Validator:
+    properties = {name: compile_schema(subschema) for name, subschema in schema.get("properties", {}).items()}
+    required: list[str] = list(schema.get("required", []))
+    additional = schema.get("additionalProperties", True)
+    check_additional = compile_schema(additional) if isinstance(additional, dict) else None
+
+    def check(value: Any, path: str) -> None:
+        if not isinstance(value, dict):
+            return
+
+        for name in required:
+            if name not in value:
+                msg = f"missing required property {name!r}"
+                raise JsonSchemaError(path=path, message=msg)
+
+        for name, item in value.items():
+            item_path = f"{path}.{name}"
+            validate = properties.get(name, check_additional)
+            if validate is not None:
+                validate(item, item_path)
+            elif name not in properties and additional is False:
+                msg = f"unexpected property {name!r}"
+                raise JsonSchemaError(path=path, message=msg)
+
+    return check
+
+
+def _check_items(validate: Validator) -> Validator:
+    def check(value: Any, path: str) -> None:
+        if not isinstance(value, list):
+            return
+        for index, item in enumerate(value):
+            validate(item, f"{path}[{index}]")
+
+    return check
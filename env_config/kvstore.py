@@ -0,0 +1,443 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import contextlib
+import http.client
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import quote, urlsplit
+
+from .aio import AsyncSource
+from .constants import KV_APIS, Undefined
+from .errors import SourceError
+
+if TYPE_CHECKING:
+    from dotenv.main import StrPath
+
+    from .typing import Any, Collection, Mapping
+
+
+__all__ = [
+    "ConnectionPool",
+    "HttpKeyValueSource",
+    "TTLCache",
+]
+
+
+logger = logging.getLogger(__name__)
+
+# Errors from the connection that mean the server closed an idle keep-alive connection.
+STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+# Maximum number of operations in a single etcd transaction with the default `--max-txn-ops`.
+ETCD_MAX_TXN_OPS = 128
+
+
+class ConnectionPool:
+    """
+    Pool of keep-alive HTTP connections to a single server. Connections are not tied to an event loop,
+    so the same connections are reused when values are fetched again, e.g., when reloading the environment.
+    """
+
+    __slots__ = ("connection_class", "host", "idle", "lock", "max_connections", "port", "slots", "timeout")
+
+    def __init__(self, url: str, *, timeout: float = 5.0, max_connections: int = 4) -> None:
+        """
+        Create a pool for the server at the given URL. Connections are opened when needed.
+
+        :param url: URL of the server, e.g. `http://127.0.0.1:8500`.
+        :param timeout: Timeout for connecting to the server and for each response, in seconds.
+        :param max_connections: Maximum number of connections open at the same time. Requests wait
+                                for a connection if all of them are in use. Idle connections are kept open.
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in {"http", "https"} or not parts.hostname:
+            msg = f"Invalid URL {url!r}. Expected an 'http' or 'https' URL with a host."
+            raise ValueError(msg)
+        if max_connections < 1:
+            msg = f"Invalid maximum number of connections {max_connections}. Expected at least 1."
+            raise ValueError(msg)
+
+        self.connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self.host: str = parts.hostname
+        self.port: int | None = parts.port
+        self.timeout = timeout
+        self.max_connections = max_connections
+        # Each request holds a slot while it uses a connection, so that no more connections are opened
+        # than can be kept open, and the connections are reused instead of being closed after use.
+        self.slots = threading.BoundedSemaphore(max_connections)
+        self.idle: list[http.client.HTTPConnection] = []
+        self.lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: bytes | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> tuple[int, bytes]:
+        """
+        Send a request on an idle connection, or a new one if there are none, and read the response.
+        If the server has closed an idle connection, the request is sent again on a new connection.
+        Waits for a connection to become available if `max_connections` connections are in use.
+
+        :param method: HTTP method.
+        :param path: Path of the request, including the query string.
+        :param body: Body of the request.
+        :param headers: Headers of the request.
+        :returns: The status code and the body of the response.
+        """
+        with self.slots:
+            with self.lock:
+                connection = self.idle.pop() if self.idle else None
+
+            if connection is not None:
+                try:
+                    return self.send(connection, method, path, body=body, headers=headers)
+                except STALE_CONNECTION_ERRORS:
+                    pass
+
+            connection = self.connection_class(self.host, self.port, timeout=self.timeout)
+            return self.send(connection, method, path, body=body, headers=headers)
+
+    def send(
+        self,
+        connection: http.client.HTTPConnection,
+        method: str,
+        path: str,
+        *,
+        body: bytes | None,
+        headers: Mapping[str, str] | None,
+    ) -> tuple[int, bytes]:
+        try:
+            connection.request(method, path, body=body, headers=dict(headers or {}))
+            response = connection.getresponse()
+            data = response.read()
+        except BaseException:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+            return response.status, data
+
+        with self.lock:
+            if len(self.idle) < self.max_connections:
+                self.idle.append(connection)
+                return response.status, data
+        connection.close()
+        return response.status, data
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for connection in idle:
+            connection.close()
+
+
+class TTLCache:
+    """
+    Cache where entries expire a given time after they were added. When the cache is full,
+    the least recently used entries are evicted first.
+    """
+
+    __slots__ = ("entries", "lock", "max_size", "ttl")
+
+    def __init__(self, *, ttl: float, max_size: int) -> None:
+        """
+        Create an empty cache.
+
+        :param ttl: Time in seconds after which entries expire.
+        :param max_size: Maximum number of entries in the cache.
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        # Key -> (value, expiry time on the monotonic clock).
+        self.entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: str, *, now: float | None = None) -> Any:
+        """
+        Get the value for the given key, or `Undefined` if the key is not cached or has expired.
+
+        :param key: The key.
+        :param now: Current time on the monotonic clock.
+        """
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return Undefined
+            if entry[1] <= now:
+                del self.entries[key]
+                return Undefined
+            self.entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: str, value: Any, *, now: float | None = None, ttl: float | None = None) -> None:
+        """
+        Add the value for the given key, evicting the least recently used entries if the cache is full.
+
+        :param key: The key.
+        :param value: The value.
+        :param now: Current time on the monotonic clock.
+        :param ttl: Time in seconds after which the entry expires, if not the default of the cache.
+        """
+        now = time.monotonic() if now is None else now
+        expires = now + (self.ttl if ttl is None else ttl)
+        with self.lock:
+            self.entries[key] = (value, expires)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class HttpKeyValueSource(AsyncSource):
+    """
+    Source for values from an HTTP key-value service, like Consul or etcd.
+
+    The keys are fetched with as few requests as possible on pooled keep-alive connections.
+    Fetched values, and keys that are not defined, are cached for `ttl` seconds. If a `cache_path`
+    is given, the fetched values are also written to that file, which is used when the environment
+    is created again, e.g., on the next startup, as long as the file is not older than `ttl`,
+    and as the last known good values if the service cannot be reached.
+    """
+
+    __slots__ = ("api", "cache", "cache_path", "headers", "loaded_cache_file", "pool", "prefix")
+
+    def __init__(  # noqa: PLR0913
+        self,
+        url: str,
+        *,
+        api: str = "consul",
+        prefix: str = "",
+        headers: Mapping[str, str] | None = None,
+        timeout: float = 5.0,
+        max_connections: int = 4,
+        ttl: float = 60.0,
+        cache_size: int = 1024,
+        cache_path: StrPath | None = None,
+    ) -> None:
+        """
+        Create a source for the service at the given URL.
+
+        :param url: URL of the service, e.g. `http://127.0.0.1:8500`.
+        :param api: API of the service. With `"consul"`, all keys under the prefix are fetched with
+                    a single request to the Consul KV API, or each key with a separate request if there
+                    is no prefix. With `"etcd"`, the keys are fetched with
+                    transactions of the etcd v3 JSON API, with up to 128 keys in a single transaction.
+        :param prefix: Prefix added to the names of the settings to get the keys in the service, e.g. `"myapp/"`.
+        :param headers: Additional headers for the requests, e.g., for authentication.
+        :param timeout: Timeout for connecting to the service and for each response, in seconds.
+        :param max_connections: Maximum number of keep-alive connections to the service open at the same time.
+        :param ttl: Time in seconds the values are cached for.
+        :param cache_size: Maximum number of values to cache.
+        :param cache_path: If given, the values are also cached to this file.
+        """
+        if api not in KV_APIS:
+            msg = f"Unknown key-value API {api!r}. Available APIs: {', '.join(KV_APIS)}"
+            raise ValueError(msg)
+
+        self.api = api
+        self.prefix = prefix
+        self.headers: dict[str, str] = dict(headers or {})
+        self.pool = ConnectionPool(url, timeout=timeout, max_connections=max_connections)
+        self.cache = TTLCache(ttl=ttl, max_size=cache_size)
+        self.cache_path: Path | None = None if cache_path is None else Path(cache_path)
+        self.loaded_cache_file = False
+
+    async def fetch_many(self, keys: Collection[str]) -> Mapping[str, str]:
+        if not self.loaded_cache_file:
+            self.loaded_cache_file = True
+            await asyncio.to_thread(self.load_cache_file)
+
+        values: dict[str, str] = {}
+        missing: list[str] = []
+        for key in keys:
+            value = self.cache.get(key)
+            if value is Undefined:
+                missing.append(key)
+            elif value is not None:
+                values[key] = value
+
+        if missing:
+            fetched = await self.fetch_missing(missing)
+            values.update((key, value) for key, value in fetched.items() if value is not None)
+        return values
+
+    async def fetch_missing(self, keys: list[str]) -> dict[str, str | None]:
+        """
+        Fetch the given keys from the service, and cache the values. If the service cannot be reached
+        or responds with an error, use the last known good values from the cache file, if it has all the keys.
+
+        :param keys: Names of the settings to fetch.
+        """
+        try:
+            fetched = await self.request(keys)
+        except (OSError, http.client.HTTPException, SourceError):
+            last_known_good = await asyncio.to_thread(self.read_cache_file)
+            if last_known_good is None or any(key not in last_known_good for key in keys):
+                raise
+            logger.warning(f"Could not fetch values from {self}, using the last known good values", exc_info=True)
+            return {key: last_known_good[key] for key in keys}
+
+        for key in keys:
+            self.cache.set(key, fetched.get(key))
+        if self.cache_path is not None:
+            await asyncio.to_thread(self.write_cache_file)
+        return fetched
+
+    async def request(self, keys: list[str]) -> dict[str, str | None]:
+        """
+        Fetch the given keys from the service. Keys that are not defined are mapped to `None`.
+
+        :param keys: Names of the settings to fetch.
+        """
+        if self.api == "consul":
+            if self.prefix:
+                return await asyncio.to_thread(self.request_consul, keys)
+            # Without a prefix, a recursive request would download the entire store, so the keys are fetched
+            # one by one instead. The keys are split between as many threads as there can be connections,
+            # so that each thread sends its requests on the same keep-alive connection.
+            workers = min(len(keys), self.pool.max_connections)
+            chunks = [keys[i::workers] for i in range(workers)]
+            results = await asyncio.gather(*(asyncio.to_thread(self.request_consul_keys, chunk) for chunk in chunks))
+            return {key: value for result in results for key, value in result.items()}
+
+        batches = [keys[i : i + ETCD_MAX_TXN_OPS] for i in range(0, len(keys), ETCD_MAX_TXN_OPS)]
+        results = await asyncio.gather(*(asyncio.to_thread(self.request_etcd, batch) for batch in batches))
+        return {key: value for result in results for key, value in result.items()}
+
+    def request_consul(self, keys: list[str]) -> dict[str, str | None]:
+        path = f"/v1/kv/{quote(self.prefix)}?recurse=true"
+        status, data = self.pool.request("GET", path, headers=self.headers)
+        # Consul responds with 404 if there are no keys under the prefix.
+        items: list[dict[str, Any]] = [] if status == http.client.NOT_FOUND else self.parse(status, data)
+
+        wanted = set(keys)
+        values: dict[str, str | None] = dict.fromkeys(keys)
+        for item in items:
+            key = item["Key"].removeprefix(self.prefix)
+            if key in wanted and item.get("Value") is not None:
+                values[key] = base64.b64decode(item["Value"]).decode("utf-8")
+        return values
+
+    def request_consul_keys(self, keys: list[str]) -> dict[str, str | None]:
+        return {key: self.request_consul_key(key) for key in keys}
+
+    def request_consul_key(self, key: str) -> str | None:
+        status, data = self.pool.request("GET", f"/v1/kv/{quote(key)}", headers=self.headers)
+        if status == http.client.NOT_FOUND:
+            return None
+        items: list[dict[str, Any]] = self.parse(status, data)
+        for item in items:
+            if item["Key"] == key and item.get("Value") is not None:
+                return base64.b64decode(item["Value"]).decode("utf-8")
+        return None
+
+    def request_etcd(self, keys: list[str]) -> dict[str, str | None]:
+        operations = [{"request_range": {"key": _b64encode(self.prefix + key)}} for key in keys]
+        body = json.dumps({"success": operations}).encode("utf-8")
+        headers = {"Content-Type": "application/json"} | self.headers
+        status, data = self.pool.request("POST", "/v3/kv/txn", body=body, headers=headers)
+
+        values: dict[str, str | None] = dict.fromkeys(keys)
+        for response in self.parse(status, data).get("responses", []):
+            for item in response.get("response_range", {}).get("kvs", []):
+                key = base64.b64decode(item["key"]).decode("utf-8").removeprefix(self.prefix)
+                if key in values:
+                    values[key] = base64.b64decode(item.get("value", "")).decode("utf-8")
+        return values
+
+    def parse(self, status: int, data: bytes) -> Any:
+        if status != http.client.OK:
+            msg = f"Request to {self} failed with status {status}: {data[:200].decode('utf-8', 'replace')}"
+            raise SourceError(msg)
+        try:
+            return json.loads(data)
+        except ValueError as error:
+            # E.g., an HTML page from a proxy in front of the service.
+            msg = f"Request to {self} returned an invalid response: {data[:200].decode('utf-8', 'replace')}"
+            raise SourceError(msg) from error
+
+    def load_cache_file(self) -> None:
+        """Add the values from the cache file to the cache, if the file is not older than the TTL."""
+        if self.cache_path is None:
+            return
+        try:
+            age = time.time() - self.cache_path.stat().st_mtime
+        except OSError:
+            return
+        if age >= self.cache.ttl:
+            return
+
+        values = self.read_cache_file()
+        if values is None:
+            return
+        # The values expire when they would have expired had they been fetched by this process.
+        now = time.monotonic()
+        for key, value in values.items():
+            self.cache.set(key, value, now=now, ttl=self.cache.ttl - age)
+
+    def read_cache_file(self) -> dict[str, str | None] | None:
+        """Read the values from the cache file, or `None` if it doesn't exist or cannot be read."""
+        if self.cache_path is None:
+            return None
+        try:
+            with self.cache_path.open("rb") as file:
+                values = json.load(file)
+        except (OSError, ValueError):
+            return None
+        return values if isinstance(values, dict) else None
+
+    def write_cache_file(self) -> None:
+        """Write the cached values to the cache file."""
+        if self.cache_path is None:  # pragma: no cover
+            return
+        with self.cache.lock:
+            values = {key: value for key, (value, _) in self.cache.entries.items()}
+
+        # Write to a temporary file first so that a partially written file is never read.
+        # The file is only readable by the current user, since the values can be secrets.
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_path.parent, prefix=f".{self.cache_path.name}.")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as file:
+                    json.dump(values, file)
+                Path(tmp_path).replace(self.cache_path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    Path(tmp_path).unlink()
+                raise
+        except OSError:
+            logger.warning(f"Could not write the values from {self} to {self.cache_path}", exc_info=True)
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.pool.close()
+
+    def __repr__(self) -> str:
+        port = "" if self.pool.port is None else f":{self.pool.port}"
+        return f"{type(self).__name__}({self.pool.host}{port}, api={self.api!r}, prefix={self.prefix!r})"
+
+
+def _b64encode(value: str) -> str:
+    return base64.b64encode(value.encode("utf-8")).decode("ascii")
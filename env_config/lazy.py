@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base import Environment
+    from .typing import Any, Callable
+
+
+__all__ = [
+    "LazySettings",
+]
+
+
+class LazySettings:
+    """
+    Sets settings of an environment lazily to a module using module level `__getattr__` and `__dir__`
+    functions (PEP 562), so that each setting is only loaded when it's first accessed from the module.
+    """
+
+    def __init__(self, env: type[Environment], module_globals: dict[str, Any], names: list[str]) -> None:
+        self.env = env
+        self.module_globals = module_globals
+        self.pending: set[str] = set(names)
+
+        self.previous_getattr: Callable[[str], Any] | None = module_globals.get("__getattr__")
+        self.previous_dir: Callable[[], list[str]] | None = module_globals.get("__dir__")
+
+        # If another environment was set lazily to the same module, replace it instead of chaining to it.
+        previous = getattr(self.previous_getattr, "__self__", None)
+        if isinstance(previous, LazySettings):
+            self.previous_getattr = previous.previous_getattr
+            self.previous_dir = previous.previous_dir
+
+    def install(self) -> None:
+        """Install the lazy settings to the module."""
+        # Remove existing globals with the same names so that module level `__getattr__` is called for them.
+        for name in self.pending:
+            self.module_globals.pop(name, None)
+
+        self.module_globals["__getattr__"] = self.getattr
+        self.module_globals["__dir__"] = self.dir
+
+    def getattr(self, name: str) -> Any:
+        if name in self.pending:
+            value = getattr(self.env, name)
+            # Set the loaded value to the module so that later accesses don't go through this method.
+            self.module_globals[name] = value
+            self.pending.discard(name)
+            return value
+
+        if self.previous_getattr is not None:
+            return self.previous_getattr(name)
+
+        msg = f"module {self.module_globals.get('__name__')!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    def dir(self) -> list[str]:
+        names = self.previous_dir() if self.previous_dir is not None else self.module_globals
+        return sorted({*names, *self.pending})
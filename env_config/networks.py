@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import ipaddress
+import socket
+from bisect import bisect_right
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from .typing import Any
+
+
+__all__ = [
+    "IPNetworkSet",
+]
+
+
+IPAddress = ipaddress.IPv4Address | ipaddress.IPv6Address
+IPNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+
+class IPNetworkSet:
+    """
+    Immutable set of IP networks for fast membership checks, e.g., for IP allowlists.
+
+    Networks are stored as sorted, non-overlapping ranges of integers, separately for IPv4 and IPv6.
+    Overlapping and adjacent networks are merged, so checking if an address is in the set
+    takes O(log n) time using binary search.
+    """
+
+    __slots__ = ("_v4_ends", "_v4_starts", "_v6_ends", "_v6_starts")
+
+    def __init__(self, networks: Iterable[str | IPAddress | IPNetwork] = (), *, strict: bool = True) -> None:
+        """
+        Create a set of the given networks.
+
+        :param networks: Networks in CIDR notation (e.g. `10.0.0.0/8`), or single addresses.
+        :param strict: If `True`, raise a `ValueError` for networks with host bits set (e.g. `10.0.0.1/8`).
+                       Otherwise, the host bits are ignored.
+        """
+        v4: list[tuple[int, int]] = []
+        v6: list[tuple[int, int]] = []
+        for item in networks:
+            network = ipaddress.ip_network(item, strict=strict)
+            ranges = v4 if network.version == 4 else v6  # noqa: PLR2004
+            ranges.append((int(network.network_address), int(network.broadcast_address)))
+
+        self._v4_starts, self._v4_ends = _collapse(v4)
+        self._v6_starts, self._v6_ends = _collapse(v6)
+
+    def contains(self, address: str | IPAddress) -> bool:
+        """
+        Check if the given address is in any of the networks in the set.
+        IPv4-mapped IPv6 addresses (e.g. `::ffff:10.0.0.1`) are checked against the IPv4 networks.
+        Returns `False` for strings that are not valid IP addresses.
+
+        :param address: The address to check.
+        """
+        if isinstance(address, str):
+            parsed = _parse_address(address)
+            if parsed is None:
+                return False
+            value, version = parsed
+        else:
+            value, version = int(address), address.version
+
+        # IPv4-mapped IPv6 addresses are in `::ffff:0:0/96`.
+        if version == 6 and value >> 32 == 0xFFFF:  # noqa: PLR2004
+            value, version = value & 0xFFFFFFFF, 4
+
+        if version == 4:  # noqa: PLR2004
+            starts, ends = self._v4_starts, self._v4_ends
+        else:
+            starts, ends = self._v6_starts, self._v6_ends
+
+        index = bisect_right(starts, value) - 1
+        return index >= 0 and value <= ends[index]
+
+    def __contains__(self, address: object) -> bool:
+        if not isinstance(address, str | ipaddress.IPv4Address | ipaddress.IPv6Address):
+            return False
+        return self.contains(address)
+
+    @property
+    def networks(self) -> list[IPNetwork]:
+        """The networks in the set, with overlapping and adjacent networks merged."""
+        networks: list[IPNetwork] = []
+        for starts, ends, address_class in (
+            (self._v4_starts, self._v4_ends, ipaddress.IPv4Address),
+            (self._v6_starts, self._v6_ends, ipaddress.IPv6Address),
+        ):
+            for start, end in zip(starts, ends, strict=True):
+                networks.extend(ipaddress.summarize_address_range(address_class(start), address_class(end)))
+        return networks
+
+    def __iter__(self) -> Iterator[IPNetwork]:
+        return iter(self.networks)
+
+    def __len__(self) -> int:
+        """Number of non-overlapping address ranges in the set."""
+        return len(self._v4_starts) + len(self._v6_starts)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IPNetworkSet):
+            return NotImplemented
+        return self.__getstate__() == other.__getstate__()
+
+    def __hash__(self) -> int:
+        return hash(tuple(map(tuple, self.__getstate__())))
+
+    def __getstate__(self) -> tuple[list[int], ...]:
+        return self._v4_starts, self._v4_ends, self._v6_starts, self._v6_ends
+
+    def __setstate__(self, state: tuple[list[int], ...]) -> None:
+        self._v4_starts, self._v4_ends, self._v6_starts, self._v6_ends = state
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}([{', '.join(repr(str(network)) for network in self.networks)}])"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (), self.__getstate__()
+
+
+def _parse_address(address: str) -> tuple[int, int] | None:
+    """Parse the given IP address to an integer and IP version, or return `None` if it's not valid."""
+    # `inet_pton` is much faster than `ipaddress`, and accepts a subset of the same syntax.
+    try:
+        if ":" in address:
+            return int.from_bytes(socket.inet_pton(socket.AF_INET6, address), "big"), 6
+        return int.from_bytes(socket.inet_pton(socket.AF_INET, address), "big"), 4
+    except (OSError, ValueError):
+        pass
+
+    # Fall back to `ipaddress` for the rest, e.g., IPv6 addresses with a scope ID.
+    try:
+        parsed = ipaddress.ip_address(address)
+    except ValueError:
+        return None
+    return int(parsed), parsed.version
+
+
+def _collapse(ranges: list[tuple[int, int]]) -> tuple[list[int], list[int]]:
+    """Merge overlapping and adjacent ranges, and return the starts and ends of the merged ranges."""
+    starts: list[int] = []
+    ends: list[int] = []
+    for start, end in sorted(ranges):
+        if ends and start <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
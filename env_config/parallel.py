@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from .base import Environment
+    from .typing import Any
+
+
+__all__ = [
+    "resolve_values_in_parallel",
+]
+
+
+def resolve_values_in_parallel(env: type[Environment], *, max_workers: int) -> None:
+    """
+    Resolve the value descriptors of the given environment concurrently on a thread pool,
+    so that the values are cached in the descriptors when the settings are loaded.
+
+    All values are resolved before any errors are raised. If resolving some values failed,
+    the error for the value that comes first in the same order as settings are loaded
+    is raised, so that the reported error doesn't depend on thread scheduling.
+    """
+    futures: list[Future[Any]] = []
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="env-config") as executor:
+        futures.extend(
+            executor.submit(field.value.__get__, None, env) for field in env.fields.values() if field.is_descriptor
+        )
+
+    for future in futures:
+        future.result()
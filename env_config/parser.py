@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from dotenv.main import StrPath
+
+    from .typing import Collection
+
+
+__all__ = [
+    "parse_dotenv",
+    "read_dotenv",
+]
+
+
+logger = logging.getLogger(__name__)
+
+# Patterns for the grammar supported by `python-dotenv`. These match the ones in `dotenv.parser`,
+# but the parser below uses them directly on the file contents without intermediate objects.
+_multiline_whitespace = re.compile(r"\s*", re.MULTILINE)
+_whitespace = re.compile(r"[^\S\r\n]*")
+_export = re.compile(r"(?:export[^\S\r\n]+)?")
+_single_quoted_key = re.compile(r"'([^']+)'")
+_unquoted_key = re.compile(r"([^=\#\s]+)")
+_equal_sign = re.compile(r"(=[^\S\r\n]*)")
+_single_quoted_value = re.compile(r"'((?:\\.|[^'\\])*)'", re.DOTALL)
+_double_quoted_value = re.compile(r'"((?:\\.|[^"\\])*)"', re.DOTALL)
+_unquoted_value = re.compile(r"([^\r\n]*)")
+_inline_comment = re.compile(r"\s+#.*")
+_comment = re.compile(r"(?:[^\S\r\n]*#[^\r\n]*)?")
+_end_of_line = re.compile(r"[^\S\r\n]*(?:\r\n|\n|\r|$)")
+_rest_of_line = re.compile(r"[^\r\n]*(?:\r|\n|\r\n)?")
+_double_quote_escapes = re.compile(r"\\[\\'\"abfnrtv]")
+_single_quote_escapes = re.compile(r"\\[\\']")
+_posix_variable = re.compile(r"\$\{(?P<name>[^\}:]*)(?::-(?P<default>[^\}]*))?\}")
+
+# Most lines are simple `KEY=value` pairs, which can be parsed with a single match.
+# Anything more complex (quotes, comments, `export`, surrounding whitespace) uses the full grammar.
+_simple_binding = re.compile(r"([A-Za-z_][A-Za-z0-9_.]*)=(?:([^\s'\"#][^\r\n#]*))?(?:\r\n|\n|\r|\Z)")
+
+_escapes = {
+    "\\\\": "\\",
+    "\\'": "'",
+    '\\"': '"',
+    "\\a": "\a",
+    "\\b": "\b",
+    "\\f": "\f",
+    "\\n": "\n",
+    "\\r": "\r",
+    "\\t": "\t",
+    "\\v": "\v",
+}
+
+
+class ParseError(Exception):
+    """Error raised when a statement in a `.env` file cannot be parsed."""
+
+    def __init__(self, pos: int) -> None:
+        self.pos = pos
+        super().__init__(pos)
+
+
+def _match(pattern: re.Pattern[str], text: str, pos: int) -> re.Match[str]:
+    match = pattern.match(text, pos)
+    if match is None:
+        # Parsing continues after the rest of the line from the position where the error happened.
+        raise ParseError(pos)
+    return match
+
+
+def _decode(value: str, quote: str) -> str:
+    """Decode the escapes in a value parsed with the given quote character (empty if unquoted)."""
+    if not quote or "\\" not in value:
+        return value
+    pattern = _single_quote_escapes if quote == "'" else _double_quote_escapes
+    return pattern.sub(lambda match: _escapes[match.group(0)], value)
+
+
+def _parse_value(text: str, pos: int) -> tuple[str, str, int]:
+    char = text[pos : pos + 1]
+    if char == "'":
+        match = _match(_single_quoted_value, text, pos)
+        return match.group(1), char, match.end()
+    if char == '"':
+        match = _match(_double_quoted_value, text, pos)
+        return match.group(1), char, match.end()
+    if char in {"", "\n", "\r"}:
+        return "", "", pos
+
+    match = _unquoted_value.match(text, pos)
+    value = match.group(1)
+    if "#" in value:
+        value = _inline_comment.sub("", value)
+    return value.rstrip(), "", match.end()
+
+
+def _parse_binding(text: str, pos: int) -> tuple[str | None, str | None, str, int]:
+    """
+    Parse a single statement starting from the given position, returning its key, value,
+    the quote character of the value and the end position. Escapes in the value are not decoded.
+    """
+    pos = _export.match(text, pos).end()
+
+    char = text[pos : pos + 1]
+    key: str | None
+    if char == "#":
+        key = None
+    elif char == "'":
+        match = _match(_single_quoted_key, text, pos)
+        key, pos = match.group(1), match.end()
+    else:
+        match = _match(_unquoted_key, text, pos)
+        key, pos = match.group(1), match.end()
+
+    pos = _whitespace.match(text, pos).end()
+
+    value: str | None = None
+    quote = ""
+    if text[pos : pos + 1] == "=":
+        match = _equal_sign.match(text, pos)
+        pos = match.end()
+        # If there is whitespace after `=` and the value starts with `#`,
+        # the value is empty and the rest of the line is an inline comment.
+        if len(match.group(1)) > 1 and text[pos : pos + 1] == "#":
+            value = ""
+        else:
+            value, quote, pos = _parse_value(text, pos)
+
+    pos = _comment.match(text, pos).end()
+    pos = _match(_end_of_line, text, pos).end()
+    return key, value, quote, pos
+
+
+def _parse_skipped(text: str, entry: int | str | None) -> str | None:
+    """Parse the value of a skipped statement, which is either its position in the text, or its resolved value."""
+    if not isinstance(entry, int):
+        return entry
+    match = _simple_binding.match(text, entry)
+    if match is not None:
+        return (match.group(2) or "").rstrip()
+    _, value, quote, _ = _parse_binding(text, entry)
+    return None if value is None else _decode(value, quote)
+
+
+def _interpolate(
+    value: str,
+    values: dict[str, str | None],
+    text: str = "",
+    skipped: dict[str, int | str | None] | None = None,
+) -> str:
+    if "${" not in value:
+        return value
+
+    def resolve(match: re.Match[str]) -> str:
+        name: str = match.group("name")
+        if name in values:
+            result = values[name]
+        elif skipped and name in skipped:
+            # Values that were skipped are parsed again only when they are referenced.
+            result = _parse_skipped(text, skipped[name])
+        else:
+            result = os.environ.get(name, match.group("default") or "")
+        return result or ""
+
+    return _posix_variable.sub(resolve, value)
+
+
+def parse_dotenv(
+    text: str,
+    *,
+    interpolate: bool = True,
+    keys: Collection[str] | None = None,
+) -> dict[str, str | None]:
+    """
+    Parse the contents of a `.env` file.
+
+    Supports the same syntax as `python-dotenv`: `export` prefixes, single and double-quoted
+    keys and values with escapes, multiline quoted values, inline comments, keys without values,
+    and POSIX variable expansion (`${NAME}` and `${NAME:-default}`) using the values defined
+    earlier in the file or the environment.
+
+    :param text: The contents of the `.env` file.
+    :param interpolate: Whether to expand variables in values.
+    :param keys: If given, only return the values for these keys. Values for other keys are not
+                 decoded or interpolated, unless they are referenced by a returned value.
+    """
+    text = text.removeprefix("\ufeff")
+    length = len(text)
+    values: dict[str, str | None] = {}
+    # Keys not included in the projection, mapped to the position of their statement in the text,
+    # or to their value if it had to be interpolated in order.
+    skipped: dict[str, int | str | None] = {}
+
+    pos = 0
+    while pos < length:
+        pos = _multiline_whitespace.match(text, pos).end()
+        if pos >= length:
+            break
+
+        key: str | None
+        value: str | None
+        quote = ""
+        start = pos
+        match = _simple_binding.match(text, pos)
+        if match is not None:
+            key, value, pos = match.group(1), (match.group(2) or "").rstrip(), match.end()
+        else:
+            try:
+                key, value, quote, pos = _parse_binding(text, pos)
+            except ParseError as error:
+                line = text.count("\n", 0, start) + 1
+                logger.warning(f"Could not parse statement starting at line {line}")
+                pos = _rest_of_line.match(text, error.pos).end()
+                continue
+
+        if key is None:
+            continue
+
+        if keys is not None and key not in keys:
+            # Values that depend on other values must be interpolated in order.
+            # Others are parsed again later if they are referenced.
+            if interpolate and value is not None and "${" in value:
+                skipped[key] = _interpolate(_decode(value, quote), values, text, skipped)
+            else:
+                skipped[key] = start
+            continue
+
+        if value is not None:
+            value = _decode(value, quote)
+            if interpolate:
+                value = _interpolate(value, values, text, skipped)
+
+        values[key] = value
+
+    return values
+
+
+def read_dotenv(
+    dotenv_path: StrPath,
+    *,
+    interpolate: bool = True,
+    keys: Collection[str] | None = None,
+) -> dict[str, str | None]:
+    """
+    Read and parse the `.env` file in the given path in a single pass.
+    If the file doesn't exist, an empty dict is returned, like in `python-dotenv`.
+
+    :param dotenv_path: Path to the `.env` file.
+    :param interpolate: Whether to expand variables in values.
+    :param keys: If given, only return the values for these keys.
+    """
+    try:
+        with open(dotenv_path, encoding="utf-8") as file:  # noqa: PTH123
+            text = file.read()
+    except (FileNotFoundError, IsADirectoryError):
+        return {}
+    return parse_dotenv(text, interpolate=interpolate, keys=keys)
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import atexit
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+from weakref import ref
+
+from .constants import PROFILE_ENV_NAME
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from dotenv.main import StrPath
+
+    from .base import Environment
+    from .fields import Field
+    from .typing import Any, Callable
+    from .values import Value
+
+
+__all__ = [
+    "Profiler",
+    "SettingProfile",
+    "create_profiler",
+    "profiled",
+]
+
+
+# Values of the `DJANGO_SETTINGS_PROFILE` environment variable that don't enable profiling.
+PROFILE_DISABLED = ("", "0", "false")
+# Values of the `DJANGO_SETTINGS_PROFILE` environment variable that write the report to stderr.
+PROFILE_STDERR = ("1", "true", "stderr")
+
+
+@dataclass(slots=True)
+class SettingProfile:
+    """Profile of loading a single setting."""
+
+    name: str
+    """Name of the setting."""
+
+    calls: int = 0
+    """How many times the setting was accessed from the environment."""
+
+    hits: int = 0
+    """How many of the accesses returned an already loaded value."""
+
+    total_ns: int = 0
+    """Time spent accessing the setting, including loading the value."""
+
+    load_ns: int = 0
+    """Time spent in `get_for_environment`, including converting the value."""
+
+    convert_ns: int = 0
+    """Time spent in `convert`."""
+
+
+class Profiler:
+    """
+    Records how much time is spent loading each setting of an environment,
+    and in the hooks called when the environment is created.
+
+    Value descriptors are instrumented by replacing their class with a subclass that times
+    `__get__`, `get_for_environment` and `convert`, so descriptors that are not profiled
+    don't have any additional overhead.
+    """
+
+    def __init__(self, env: type[Environment], *, output: str | None = None) -> None:
+        """
+        Create a profiler for the given environment.
+
+        :param env: The environment to profile.
+        :param output: Where to write the profile when the environment has been set up:
+                       `"stderr"` for writing the report to stderr, a path ending in `.json`
+                       for a Chrome trace, or any other path for the report. If not given,
+                       the profile is only available from `Environment.profiler`.
+        """
+        self.env = env
+        self.output = output
+        self.settings: dict[str, SettingProfile] = {}
+        self.hooks: dict[str, int] = {}
+        self.events: list[dict[str, Any]] = []
+        self.origin = time.perf_counter_ns()
+        self.lock = threading.Lock()
+        # How many profiled `get_for_environment` calls are in progress in the current thread.
+        # Conversions are only recorded inside them, since `convert` doesn't know the environment.
+        self.local = threading.local()
+
+        # Names of the settings of the instrumented descriptors, by descriptor id.
+        self.names: dict[int, str] = {}
+        self.instrumented: list[tuple[Value, type[Value]]] = []
+        self.profiled_types: dict[type[Value], type[Value]] = {}
+
+    @contextlib.contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """
+        Time the code in the context as a step of setting up the environment, e.g., a hook.
+
+        :param name: Name of the step.
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            with self.lock:
+                self.hooks[name] = self.hooks.get(name, 0) + end - start
+                self.events.append(self._event(name, "hook", start, end))
+
+    def instrument(self, fields: dict[str, Field]) -> None:
+        """
+        Instrument the value descriptors of the given fields.
+
+        :param fields: Fields of the profiled environment.
+        """
+        for field in fields.values():
+            if not field.is_descriptor or id(field.value) in self.names:
+                continue
+            self.names[id(field.value)] = field.name
+            self.instrumented.append((field.value, type(field.value)))
+            field.value.__class__ = self._profiled_type(type(field.value))
+
+    def restore(self) -> None:
+        """Restore the original classes of the instrumented value descriptors."""
+        for descriptor, original in self.instrumented:
+            descriptor.__class__ = original
+        self.instrumented.clear()
+        self.names.clear()
+
+    def finish(self) -> None:
+        """
+        Called when the environment has been set up. Stops profiling and writes the profile
+        to the output, unless the environment is lazy, in which case settings are profiled
+        until the process exits.
+        """
+        if self.env.lazy:
+            if self.output is not None:
+                atexit.register(self.write)
+            return
+
+        self.restore()
+        if self.output is not None:
+            self.write()
+
+    def write(self) -> None:
+        """Write the profile to the output given when the profiler was created."""
+        if self.output is None:  # pragma: no cover
+            return
+        if self.output.casefold() in PROFILE_STDERR:
+            sys.stderr.write(self.report())
+        elif self.output.endswith(".json"):
+            self.write_chrome_trace(self.output)
+        else:
+            Path(self.output).write_text(self.report(), encoding="utf-8")
+
+    def report(self, *, limit: int | None = None) -> str:
+        """
+        Create a text report of the profile, with the settings sorted by the time spent loading them.
+
+        :param limit: If given, include only this many of the slowest settings.
+        """
+        with self.lock:
+            hooks = dict(self.hooks)
+            settings = sorted(self.settings.values(), key=lambda item: item.total_ns, reverse=True)
+
+        width = max((len(item.name) for item in settings), default=0)
+        width = max(width, *(len(name) for name in hooks), len("setting"))
+
+        lines = [f"Settings profile for environment {self.env.__name__!r}", ""]
+        lines.append(f"{'step':<{width}}  {'time (ms)':>10}")
+        lines.extend(f"{name:<{width}}  {duration / 1e6:>10.3f}" for name, duration in hooks.items())
+        lines.append("")
+        lines.append(
+            f"{'setting':<{width}}  {'calls':>6}  {'hits':>6}"
+            f"  {'total (ms)':>10}  {'load (ms)':>10}  {'convert (ms)':>12}",
+        )
+        lines.extend(
+            f"{item.name:<{width}}  {item.calls:>6}  {item.hits:>6}  {item.total_ns / 1e6:>10.3f}"
+            f"  {item.load_ns / 1e6:>10.3f}  {item.convert_ns / 1e6:>12.3f}"
+            for item in settings[:limit]
+        )
+        return "\n".join(lines) + "\n"
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """
+        Create a trace of the profile in the Chrome trace event format,
+        which can be viewed with, e.g., `chrome://tracing` or Perfetto.
+        """
+        with self.lock:
+            events = list(self.events)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: StrPath) -> None:
+        """
+        Write a trace of the profile in the Chrome trace event format to the given file.
+
+        :param path: Path to the file.
+        """
+        with Path(path).open("w", encoding="utf-8") as file:
+            json.dump(self.chrome_trace(), file)
+
+    def record(self, descriptor: Value, phase: str, start: int, *, hit: bool = False) -> None:
+        """
+        Record a call to an instrumented method of a value descriptor.
+
+        :param descriptor: The value descriptor.
+        :param phase: The instrumented method: `"get"`, `"get_for_environment"` or `"convert"`.
+        :param start: When the call started, from `time.perf_counter_ns`.
+        :param hit: Whether the call returned an already loaded value.
+        """
+        end = time.perf_counter_ns()
+        name = self.names.get(id(descriptor), descriptor.name)
+        with self.lock:
+            profile = self.settings.get(name)
+            if profile is None:
+                profile = self.settings[name] = SettingProfile(name=name)
+
+            if phase == "get":
+                profile.calls += 1
+                profile.hits += hit
+                profile.total_ns += end - start
+            elif phase == "get_for_environment":
+                profile.load_ns += end - start
+            else:
+                profile.convert_ns += end - start
+
+            # Accesses to loaded values would only clutter the trace.
+            if not hit:
+                self.events.append(self._event(name, phase, start, end))
+
+    def _event(self, name: str, category: str, start: int, end: int) -> dict[str, Any]:
+        return {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self.origin) / 1000,
+            "dur": (end - start) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+
+    def _profiled_type(self, cls: type[Value]) -> type[Value]:
+        profiled = self.profiled_types.get(cls)
+        if profiled is not None:
+            return profiled
+
+        profiler = self
+        get = cls.__get__
+        get_for_environment = cls.get_for_environment
+        convert = cls.convert
+
+        def __get__(descriptor: Value, instance: Environment | None, env: type[Environment]) -> Any:  # noqa: N807
+            if env is not profiler.env:
+                return get(descriptor, instance, env)
+            hit = ref(env) in descriptor.value_by_environment
+            start = time.perf_counter_ns()
+            try:
+                return get(descriptor, instance, env)
+            finally:
+                profiler.record(descriptor, "get", start, hit=hit)
+
+        def _get_for_environment(descriptor: Value, env: type[Environment]) -> Any:
+            if env is not profiler.env:
+                return get_for_environment(descriptor, env)
+            depth = profiler.local.__dict__.get("depth", 0)
+            profiler.local.depth = depth + 1
+            start = time.perf_counter_ns()
+            try:
+                return get_for_environment(descriptor, env)
+            finally:
+                profiler.record(descriptor, "get_for_environment", start)
+                profiler.local.depth = depth
+
+        def _convert(descriptor: Value, value: Any) -> Any:
+            if not profiler.local.__dict__.get("depth", 0):
+                return convert(descriptor, value)
+            start = time.perf_counter_ns()
+            try:
+                return convert(descriptor, value)
+            finally:
+                profiler.record(descriptor, "convert", start)
+
+        # Keep the module and name of the original class, so that the instrumented descriptors
+        # look the same, e.g., when computing the fingerprint for a snapshot.
+        namespace: dict[str, Callable[..., Any] | str | tuple[()]] = {
+            "__slots__": (),
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "__get__": __get__,
+            "get_for_environment": _get_for_environment,
+            "convert": _convert,
+        }
+        profiled = self.profiled_types[cls] = type(cls.__name__, (cls,), namespace)
+        return profiled
+
+
+def create_profiler(env: type[Environment], *, enabled: bool = False) -> Profiler | None:
+    """
+    Create a profiler for the given environment, if profiling is enabled with the argument
+    or the `DJANGO_SETTINGS_PROFILE` environment variable.
+
+    :param env: The environment to profile.
+    :param enabled: Whether to profile the environment even if the environment variable is not set.
+    """
+    output: str | None = os.environ.get(PROFILE_ENV_NAME, "")
+    if output.casefold() in PROFILE_DISABLED:
+        output = None
+    if output is None and not enabled:
+        return None
+    return Profiler(env, output=output)
+
+
+def profiled(profiler: Profiler | None, name: str) -> contextlib.AbstractContextManager[None]:
+    """
+    Time the code in the context as a step of setting up the environment, if profiling is enabled.
+
+    :param profiler: The profiler of the environment, if any.
+    :param name: Name of the step.
+    """
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.span(name)
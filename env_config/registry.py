@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import os
+import sys
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from weakref import WeakValueDictionary
+
+from .constants import ENV_NAME
+from .errors import UnknownEnvironmentError
+from .targeting import resolve_module
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from .base import Environment
+
+
+__all__ = [
+    "EnvironmentRegistry",
+    "active_environment_name",
+    "default_target_module",
+    "registry",
+]
+
+
+# Module where environments created while the active environment is loaded from the registry
+# set their settings, unless they set a `target_module` themselves.
+_default_target_module: ContextVar[ModuleType | str | None] = ContextVar("default_target_module", default=None)
+
+
+@lru_cache(maxsize=32)
+def _normalize(name: str) -> str:
+    return name.casefold()
+
+
+def active_environment_name() -> str:
+    """
+    Get the normalized name of the environment selected with the `DJANGO_SETTINGS_ENVIRONMENT`
+    environment variable. Names are compared case-insensitively.
+    """
+    return _normalize(_selected_environment())
+
+
+def _selected_environment() -> str:
+    name = os.environ.get(ENV_NAME)
+    if name is None:  # pragma: no cover
+        msg = f"Environment variable {ENV_NAME!r} must be set before subclassing 'Environment'"
+        raise ValueError(msg)
+    return name
+
+
+def default_target_module() -> ModuleType | str | None:
+    """Get the module where environments should set their settings if they don't set a `target_module`."""
+    return _default_target_module.get()
+
+
+class EnvironmentRegistry:
+    """
+    Maps names of environments to the environment classes, and to the modules where they are defined.
+
+    Environment classes are added to the registry when they are created. Modules registered
+    for environments are only imported when the environment is requested, so that only the
+    definition of the active environment needs to be evaluated when the settings are loaded.
+
+    >>> registry.register("production", "myproject.environments.production")
+    >>> registry.register("development", "myproject.environments.development")
+    >>> registry.load_active()
+    """
+
+    __slots__ = ("classes", "modules")
+
+    def __init__(self) -> None:
+        # Normalized name -> environment class. Classes are referenced weakly,
+        # so that the registry doesn't keep discarded environments alive.
+        self.classes: WeakValueDictionary[str, type[Environment]] = WeakValueDictionary()
+        # Normalized name -> (name, dotted path to the module defining the environment).
+        self.modules: dict[str, tuple[str, str]] = {}
+
+    def register(self, name: str, module: str) -> None:
+        """
+        Register the module where the environment with the given name is defined.
+        The module is imported when the environment is requested.
+
+        :param name: Name of the environment class. Names are case-insensitive.
+        :param module: Dotted path to the module.
+        """
+        self.modules[_normalize(name)] = (name, module)
+
+    def add(self, env: type[Environment]) -> None:
+        """
+        Add the given environment class to the registry. Called when an environment class is created.
+        Replaces earlier classes with the same name.
+
+        :param env: The environment class.
+        """
+        self.classes[_normalize(env.__name__)] = env
+
+    def get(self, name: str) -> type[Environment]:
+        """
+        Get the environment class with the given name, importing the module registered for it if needed.
+        Raises `UnknownEnvironmentError` if the environment is not known.
+
+        :param name: Name of the environment. Names are case-insensitive.
+        """
+        key = _normalize(name)
+        env = self.classes.get(key)
+        if env is not None:
+            return env
+
+        if key not in self.modules:
+            raise UnknownEnvironmentError(name=name, known=self.names())
+
+        module = self.modules[key][1]
+        env = _find_environment(resolve_module(module), key)
+        if env is None:
+            msg = f"Module {module!r} does not define environment {name!r}"
+            raise ImportError(msg, name=module)
+
+        self.add(env)
+        return env
+
+    def load_active(self, *, target_module: ModuleType | str | None = None) -> type[Environment]:
+        """
+        Load the environment selected with the `DJANGO_SETTINGS_ENVIRONMENT` environment variable,
+        importing only the module registered for it. Raises `UnknownEnvironmentError`
+        if the environment is not known.
+
+        :param target_module: Module, or dotted path to the module, where the settings of the environment
+                              are set, unless it sets a `target_module` itself. By default, the module
+                              calling this method, e.g., the settings module.
+        """
+        if target_module is None:
+            target_module = sys._getframe(1).f_globals["__name__"]  # noqa: SLF001
+
+        token = _default_target_module.set(target_module)
+        try:
+            return self.get(_selected_environment())
+        finally:
+            _default_target_module.reset(token)
+
+    def names(self) -> list[str]:
+        """Names of the known environments, both registered and defined."""
+        names = {key: name for key, (name, _) in self.modules.items()}
+        names |= {key: env.__name__ for key, env in self.classes.items()}
+        return sorted(names.values(), key=_normalize)
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str):
+            return False
+        key = _normalize(name)
+        return key in self.classes or key in self.modules
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(self.names())})"
+
+
+def _find_environment(module: ModuleType, key: str) -> type[Environment] | None:
+    from .base import Environment
+
+    for value in vars(module).values():
+        if isinstance(value, type) and issubclass(value, Environment) and _normalize(value.__name__) == key:
+            return value
+    return None
+
+
+registry = EnvironmentRegistry()
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from dotenv.main import find_dotenv
+
+from .base import call_load_dotenv
+from .constants import Undefined
+from .sources import layer_sources
+from .targeting import get_module_directory, get_target_globals
+from .values import ComputedValue
+
+if TYPE_CHECKING:
+    from .base import Environment
+    from .typing import Any, Callable, Mapping, Self
+
+
+__all__ = [
+    "DotenvWatcher",
+    "reload_environment",
+    "resolve_dotenv_path",
+]
+
+
+logger = logging.getLogger(__name__)
+
+# Only one reload can be in progress at a time, so that concurrent reloads don't interleave.
+_reload_lock = threading.RLock()
+
+
+def resolve_dotenv_path(env: type[Environment]) -> Path:
+    """
+    Get the path to the `.env` file the environment was loaded from.
+
+    :param env: The environment to get the path for.
+    """
+    if env.dotenv_path is Undefined:
+        msg = f"Environment {env.__name__!r} does not load a `.env` file"
+        raise ValueError(msg)
+
+    if env.dotenv_path is not None:
+        return Path(env.dotenv_path).absolute()
+
+    # The `.env` file was searched for starting from the directory of the target module.
+    search_dir: Path | None = getattr(env, f"_{env.__name__}__dotenv_search_dir", None)
+    if search_dir is None:
+        search_dir = get_module_directory(_get_target_globals(env))
+    with contextlib.chdir(path=search_dir):
+        return Path(find_dotenv(raise_error_if_not_found=True, usecwd=True))
+
+
+def reload_environment(env: type[Environment]) -> dict[str, Any]:
+    """
+    Load the `.env` file of the environment again, and update the settings whose values have changed.
+    Only value descriptors whose raw values have changed are converted again, and only the computed
+    settings that depend on them are computed again. The updated settings
+    are set to the module where the settings were set, and to `django.conf.settings` if it's configured
+    from that module. The `django.core.signals.setting_changed` signal is sent for each updated setting.
+
+    If converting any of the changed values fails, no settings are updated and the error is raised.
+
+    :param env: The environment to reload.
+    :returns: The settings that changed, mapped to their new values.
+    """
+    with _reload_lock:
+        path = resolve_dotenv_path(env)
+        keys: set[str] | None = None
+        if env.dotenv_projection:
+            keys = {field.env_name for field in env.fields.values() if field.env_name is not None}
+
+        old_dotenv: Mapping[str, str] = env.dotenv
+        new_dotenv = call_load_dotenv(env, dotenv_path=path, keys=keys)
+        # Values are fetched from the sources again, and the secrets directory is scanned again,
+        # so that replaced files are read again.
+        new_dotenv = layer_sources(new_dotenv, env.load_sources(skip=new_dotenv), env.load_secrets())
+
+        changed = [
+            field
+            for field in env.fields.values()
+            if field.is_descriptor
+            and field.env_name is not None
+            and old_dotenv.get(field.env_name, Undefined) != new_dotenv.get(field.env_name, Undefined)
+        ]
+        if not changed:
+            setattr(env, f"_{env.__name__}__dotenv", new_dotenv)
+            return {}
+
+        setattr(env, f"_{env.__name__}__dotenv", new_dotenv)
+        try:
+            settings = {field.name: field.value.get_for_environment(env) for field in changed}
+            # Computed settings that depend on the changed settings need to be computed again.
+            settings |= ComputedValue.recompute(env, settings)
+        except Exception:
+            setattr(env, f"_{env.__name__}__dotenv", old_dotenv)
+            raise
+
+        for name, value in settings.items():
+            env.fields[name].value.set_value(env, value)
+
+        _update_settings(env, settings)
+        return settings
+
+
+def _update_settings(env: type[Environment], settings: dict[str, Any]) -> None:
+    from django.conf import settings as django_settings
+    from django.core.signals import setting_changed
+
+    module_globals = _get_target_globals(env)
+    for name, value in settings.items():
+        # Lazy settings that have not been accessed yet are loaded from the environment when accessed.
+        if not env.lazy or name in module_globals:
+            module_globals[name] = value
+
+    # Only update Django's settings if they were loaded from the module the environment sets its settings to.
+    update_django = False
+    if django_settings.configured:
+        update_django = getattr(django_settings, "SETTINGS_MODULE", None) == module_globals.get("__name__")
+
+    for name, value in settings.items():
+        if update_django:
+            setattr(django_settings, name, value)
+        setting_changed.send(sender=env, setting=name, value=value, enter=True)
+
+
+def _get_target_globals(env: type[Environment]) -> dict[str, Any]:
+    """
+    Get the globals the settings of the environment were set to when it was loaded. The call stack at reload
+    time doesn't lead to the environment, so it can only be used for environments whose module can be imported.
+    """
+    module_globals: dict[str, Any] | None = getattr(env, f"_{env.__name__}__target_globals", None)
+    if module_globals is None:
+        module_globals = get_target_globals(env, target_module=env.target_module)
+    return module_globals
+
+
+class DotenvWatcher:
+    """
+    Watches the `.env` file of an environment in a background thread,
+    and reloads the environment when the file changes.
+
+    Uses `inotify` on Linux, and polls the file's status on other platforms.
+    """
+
+    def __init__(
+        self,
+        env: type[Environment],
+        *,
+        interval: float = 1.0,
+        use_inotify: bool = True,
+        on_reload: Callable[[dict[str, Any]], None] | None = None,
+    ) -> None:
+        """
+        Create a watcher for the `.env` file of the given environment.
+
+        :param env: The environment to reload when its `.env` file changes.
+        :param interval: How often to check the file for changes, in seconds, if polling.
+        :param use_inotify: Use `inotify` to watch the file, if available.
+        :param on_reload: Function to call with the changed settings after the environment has been reloaded.
+        """
+        self.env = env
+        self.path = resolve_dotenv_path(env)
+        self.interval = interval
+        self.on_reload = on_reload
+        self.stopped = threading.Event()
+        self.last_stat = self._stat()
+        self.inotify: _Inotify | None = _Inotify.create(self.path) if use_inotify else None
+        self.thread = threading.Thread(target=self.run, name=f"env-config-watcher-{env.__name__}", daemon=True)
+
+    @property
+    def backend(self) -> str:
+        return "inotify" if self.inotify is not None else "poll"
+
+    def start(self) -> Self:
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.stopped.set()
+        if self.inotify is not None:
+            self.inotify.wake()
+        if self.thread.is_alive() and self.thread is not threading.current_thread():
+            self.thread.join()
+        if self.inotify is not None:
+            self.inotify.close()
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+    def run(self) -> None:
+        wait = self._wait_inotify if self.inotify is not None else self._wait_poll
+        while not self.stopped.is_set():
+            if not wait():
+                continue
+            try:
+                settings = reload_environment(self.env)
+            except Exception:
+                logger.exception(f"Could not reload environment {self.env.__name__!r}")
+                continue
+            if settings and self.on_reload is not None:
+                self.on_reload(settings)
+
+    def _wait_poll(self) -> bool:
+        """Wait until the file changes or the watcher is stopped. Returns whether the file changed."""
+        while not self.stopped.wait(self.interval):
+            current = self._stat()
+            if current != self.last_stat:
+                self.last_stat = current
+                return True
+        return False
+
+    def _wait_inotify(self) -> bool:
+        """Wait until the file changes or the watcher is stopped. Returns whether the file changed."""
+        return self.inotify.wait(timeout=None)  # type: ignore[union-attr]
+
+    def _stat(self) -> tuple[int, int, int] | None:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+class _Inotify:
+    """Minimal `inotify` bindings for watching a single file through its directory."""
+
+    # See `inotify(7)`.
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    EVENT = struct.Struct("iIII")
+
+    def __init__(self, fd: int, path: Path) -> None:
+        self.fd = fd
+        self.name = os.fsencode(path.name)
+        # Pipe for waking up the thread waiting for events when the watcher is stopped.
+        self.wake_read, self.wake_write = os.pipe()
+
+    @classmethod
+    def create(cls, path: Path) -> _Inotify | None:
+        """Create an `inotify` instance watching the given file, or return `None` if not available."""
+        if not sys.platform.startswith("linux"):  # pragma: no cover
+            return None
+
+        # Only imported when watching, since importing `ctypes` is relatively slow.
+        import ctypes
+        import ctypes.util
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        except OSError:  # pragma: no cover
+            return None
+
+        fd = libc.inotify_init1(cls.IN_NONBLOCK | cls.IN_CLOEXEC)
+        if fd < 0:  # pragma: no cover
+            return None
+
+        # Watch the directory, since editors and deployment tools often replace the file instead of writing to it.
+        mask = cls.IN_MODIFY | cls.IN_CLOSE_WRITE | cls.IN_MOVED_TO | cls.IN_CREATE | cls.IN_DELETE
+        if libc.inotify_add_watch(fd, os.fsencode(path.parent), mask) < 0:  # pragma: no cover
+            os.close(fd)
+            return None
+
+        return cls(fd, path)
+
+    def wait(self, timeout: float | None) -> bool:
+        """Wait for changes to the file. Returns whether the file changed."""
+        readable, _, _ = select.select([self.fd, self.wake_read], [], [], timeout)
+        if self.wake_read in readable or self.fd not in readable:
+            return False
+
+        changed = self._read_events()
+        # Multiple events are usually generated for a single change, so wait for them to settle.
+        while select.select([self.fd], [], [], 0.05)[0]:
+            changed = self._read_events() or changed
+        return changed
+
+    def _read_events(self) -> bool:
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:  # pragma: no cover
+            return False
+
+        changed = False
+        offset = 0
+        while offset < len(data):
+            _, _, _, length = self.EVENT.unpack_from(data, offset)
+            offset += self.EVENT.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            changed = changed or name == self.name
+        return changed
+
+    def wake(self) -> None:
+        with contextlib.suppress(OSError):
+            os.write(self.wake_write, b"\0")
+
+    def close(self) -> None:
+        for fd in (self.fd, self.wake_read, self.wake_write):
+            with contextlib.suppress(OSError):
+                os.close(fd)
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .constants import Undefined
+
+if TYPE_CHECKING:
+    from dotenv.main import StrPath
+
+    from .base import Environment
+    from .typing import Any
+
+
+__all__ = [
+    "Snapshot",
+    "compute_fingerprint",
+]
+
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = 1
+
+
+@cache
+def get_library_version() -> str:
+    # Importing `importlib.metadata` is slow, so it's only imported when snapshots are used.
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("django-environment-config")
+    except PackageNotFoundError:  # pragma: no cover
+        return "unknown"
+
+
+def get_source_stat(obj: object) -> str:
+    """Get the modification time and size of the file of the module where the given object is defined."""
+    module = sys.modules.get(getattr(obj, "__module__", ""))
+    filename: str | None = getattr(module, "__file__", None)
+    if filename is None:
+        return ""
+    try:
+        stat = Path(filename).stat()
+    except OSError:  # pragma: no cover
+        return ""
+    return f"{filename}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def compute_fingerprint(env: type[Environment], *, include_fields: bool = True) -> str:
+    """
+    Compute a fingerprint for the inputs of the given environment.
+
+    The fingerprint includes the library version, the environment's definition (its name,
+    value descriptors, and the source files of the classes and descriptors involved),
+    and the raw values read by the value descriptors from the `.env` file or environment.
+
+    :param env: The environment to compute the fingerprint for.
+    :param include_fields: If set to `False`, the value descriptors and their raw values
+                           are not included, so the fingerprint can be computed before
+                           the `.env` file has been loaded.
+    """
+    hasher = hashlib.sha256()
+
+    def update(*parts: object) -> None:
+        for part in parts:
+            hasher.update(repr(part).encode())
+            hasher.update(b"\0")
+
+    update(SNAPSHOT_FORMAT, get_library_version(), env.__module__, env.__qualname__)
+    for klass in env.__mro__:
+        update(get_source_stat(klass))
+
+    if not include_fields:
+        return hasher.hexdigest()
+
+    dotenv = env.dotenv
+    for field in env.fields.values():
+        if not field.is_descriptor:
+            continue
+        raw = Undefined if dotenv is Undefined or field.env_name is None else dotenv.get(field.env_name, Undefined)
+        # Defaults are converted like raw values, so they can have other inputs as well.
+        converted = field.value.default if raw is Undefined else raw
+        stamp = field.value.get_input_stamp(converted) if isinstance(converted, str) else None
+        update(
+            field.name, type(field.value).__qualname__, get_source_stat(type(field.value)), field.env_name, raw, stamp
+        )
+
+    return hasher.hexdigest()
+
+
+class Snapshot:
+    """
+    Snapshot of the resolved settings of an environment stored in a local cache file.
+
+    The snapshot is only used if it was created from the same inputs, as determined by
+    `compute_fingerprint`. Since the snapshot is stored using `pickle`, the cache file
+    should only be writable by trusted users.
+    """
+
+    def __init__(self, path: StrPath, *, env: type[Environment]) -> None:
+        self.path = Path(path)
+        self.env = env
+        self.fingerprint = compute_fingerprint(env)
+
+    def load(self) -> dict[str, Any] | None:
+        """
+        Load the settings from the snapshot, and set them as the values of the environment's value descriptors.
+        Returns `None` if the snapshot doesn't exist, cannot be read, or was created from different inputs.
+        """
+        try:
+            with self.path.open("rb") as file:
+                data = pickle.load(file)  # noqa: S301
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning(f"Could not read settings snapshot from '{self.path}'", exc_info=True)
+            return None
+
+        if not isinstance(data, dict) or data.get("fingerprint") != self.fingerprint:
+            return None
+
+        # Only the values of the value descriptors are taken from the snapshot. Plain values are not
+        # part of the fingerprint, e.g., `os.environ.get(...)` in the class body, so they are read from the class.
+        resolved: dict[str, Any] = data["settings"]
+        fields = self.env.fields.values()
+        if any(field.is_descriptor and field.name not in resolved for field in fields):
+            return None
+
+        settings: dict[str, Any] = {}
+        for field in fields:
+            if field.is_descriptor:
+                field.value.set_value(self.env, resolved[field.name])
+                settings[field.name] = resolved[field.name]
+            else:
+                settings[field.name] = getattr(self.env, field.name)
+        return settings
+
+    def save(self, settings: dict[str, Any]) -> None:
+        """
+        Save the values of the value descriptors from the given settings to the snapshot.
+        If the values cannot be pickled, the snapshot is not saved.
+        """
+        fields = self.env.fields
+        resolved = {name: value for name, value in settings.items() if name in fields and fields[name].is_descriptor}
+        # Converting the values can change their inputs, e.g., `PathValue` can create the directory,
+        # so the snapshot is stored with the inputs as they are after converting.
+        self.fingerprint = compute_fingerprint(self.env)
+        try:
+            data = pickle.dumps({"fingerprint": self.fingerprint, "settings": resolved})
+        except Exception:
+            logger.warning(f"Could not create settings snapshot for environment {self.env.__name__!r}", exc_info=True)
+            return
+
+        # Write to a temporary file first so that a partially written snapshot is never read.
+        # The snapshot is only a cache, so failing to write it must not prevent loading the settings.
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+            try:
+                with os.fdopen(fd, "wb") as file:
+                    file.write(data)
+                Path(tmp_path).replace(self.path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    Path(tmp_path).unlink()
+                raise
+        except OSError:
+            logger.warning(
+                f"Could not write settings snapshot for environment {self.env.__name__!r} to {str(self.path)!r}",
+                exc_info=True,
+            )
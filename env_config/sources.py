@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import os
+from collections import ChainMap
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from .constants import SECRETS_MAX_SIZE, Undefined
+from .typing import Mapping
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from dotenv.main import StrPath
+
+    from .typing import Collection
+
+
+__all__ = [
+    "DirectorySource",
+    "EnvironView",
+    "layer_sources",
+]
+
+
+class EnvironView(Mapping[str, str]):
+    """
+    Read-through view to the environment variables of the process.
+
+    Unlike a copy of `os.environ`, nothing is copied when the view is created,
+    and values are only looked up (and decoded) when they are requested.
+    Changes to the environment variables are visible through the view.
+    """
+
+    __slots__ = ("environ",)
+
+    def __init__(self, environ: Mapping[str, str] | None = None) -> None:
+        """
+        Create a view to the environment variables.
+
+        :param environ: Mapping to read the values from. Uses `os.environ` by default.
+        """
+        self.environ: Mapping[str, str] = os.environ if environ is None else environ
+
+    def __getitem__(self, key: str) -> str:
+        return self.environ[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.environ
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.environ)
+
+    def __len__(self) -> int:
+        return len(self.environ)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    def freeze(self, keys: Collection[str]) -> dict[str, str]:
+        """
+        Take a snapshot of the values for the given keys that are currently set,
+        so that later changes to the environment variables are not visible.
+
+        :param keys: Keys to include in the snapshot.
+        """
+        environ = self.environ
+        return {key: environ[key] for key in keys if key in environ}
+
+
+class DirectorySource(Mapping[str, str]):
+    """
+    Values read from a directory where each file is a single value, and the name of the file is its key,
+    e.g., Docker secrets in `/run/secrets` or a Kubernetes Secret or ConfigMap mounted as a volume.
+
+    The directory is scanned once when the source is created, and the status of the matching files
+    is kept from the scan. Files are only read when their values are requested. The contents are cached
+    by the identity and modification time of the file, so environments sharing the same directory
+    read each file only once, but files that have been replaced are read again.
+    """
+
+    __slots__ = ("entries", "max_size", "path")
+
+    def __init__(
+        self,
+        path: StrPath,
+        *,
+        keys: Collection[str] | None = None,
+        max_size: int = SECRETS_MAX_SIZE,
+    ) -> None:
+        """
+        Scan the directory for the files to read values from.
+
+        Hidden files and directories are skipped, e.g., the `..data` directory Kubernetes uses
+        for updating mounted volumes atomically. Symbolic links are followed.
+
+        :param path: Path to the directory.
+        :param keys: If given, only the files with these names are included.
+        :param max_size: Maximum size of a file in bytes. Reading a larger file raises a `ValueError`.
+        """
+        self.path: str = os.fspath(path)
+        self.max_size = max_size
+        # Key -> (path, device, inode, modification time, size) from the scan.
+        self.entries: dict[str, tuple[str, int, int, int, int]] = {}
+
+        with os.scandir(self.path) as scan:
+            for entry in scan:
+                name = entry.name
+                if name.startswith(".") or (keys is not None and name not in keys):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError:  # pragma: no cover
+                    # Broken symbolic links, or files removed during the scan.
+                    continue
+                self.entries[name] = (entry.path, stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def __getitem__(self, key: str) -> str:
+        path, device, inode, mtime_ns, size = self.entries[key]
+        if size > self.max_size:
+            msg = f"File {path!r} is larger than the maximum size of {self.max_size} bytes"
+            raise ValueError(msg)
+        return _read_value(path, device, inode, mtime_ns, size)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.path!r})"
+
+
+@lru_cache(maxsize=1024)
+def _read_value(path: str, device: int, inode: int, mtime_ns: int, size: int) -> str:
+    """
+    Read the value from the given file. The status of the file is part of the cache key,
+    so a file that has been replaced since it was read is read again.
+    """
+    with open(path, "rb") as file:  # noqa: PTH123
+        data = file.read(size)
+    # Files usually end with a newline, which is not part of the value.
+    return data.decode("utf-8").removesuffix("\n").removesuffix("\r")
+
+
+def layer_sources(*sources: Mapping[str, str] | Undefined) -> Mapping[str, str] | Undefined:
+    """
+    Combine the given sources into a single source, where values are looked up from the sources
+    in the given order. Undefined sources are skipped.
+
+    :param sources: The sources, from the highest to the lowest priority.
+    """
+    defined = [source for source in sources if source is not Undefined]
+    if not defined:
+        return Undefined
+    if len(defined) == 1:
+        return defined[0]
+    return ChainMap(*defined)  # type: ignore[arg-type]
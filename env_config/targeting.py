@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import importlib
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .typing import Any
+
+
+__all__ = [
+    "get_caller_filename",
+    "get_module_directory",
+    "get_target_globals",
+    "resolve_module",
+]
+
+
+def resolve_module(module: ModuleType | str) -> ModuleType:
+    """Resolve the given module or dotted module path to a module object, importing it if needed."""
+    if isinstance(module, ModuleType):
+        return module
+
+    try:
+        return sys.modules[module]
+    except KeyError:
+        return importlib.import_module(module)
+
+
+def get_target_globals(
+    env: type,
+    *,
+    target_module: ModuleType | str | None = None,
+    stack_level: int = 1,
+) -> dict[str, Any]:
+    """
+    Find the globals of the module where the settings of the given environment should be set.
+
+    Uses the explicitly given `target_module` if set, and otherwise the module the environment
+    was defined in. Only if that module cannot be found from `sys.modules` (e.g., when the class
+    was created with `exec` using custom globals) is the call stack consulted, and then only
+    a single frame is looked up instead of inspecting the whole stack.
+
+    :param env: The environment class to find the target module for.
+    :param target_module: Module, or dotted path to the module, where the settings should be set.
+    :param stack_level: How many frames up from the caller of this function to look as the last resort.
+    """
+    if target_module is not None:
+        return resolve_module(target_module).__dict__
+
+    module = sys.modules.get(env.__module__)
+    if module is not None:
+        return module.__dict__
+
+    return sys._getframe(stack_level + 1).f_globals  # noqa: SLF001
+
+
+def get_caller_filename(*, stack_level: int = 1) -> str:
+    """Get the filename of the code `stack_level` frames up from the caller of this function."""
+    return sys._getframe(stack_level + 1).f_code.co_filename  # noqa: SLF001
+
+
+def get_module_directory(module_globals: dict[str, Any], *, stack_level: int = 1) -> Path:
+    """
+    Get the directory of the module with the given globals.
+    Falls back to the file of the code `stack_level` frames up, if the module doesn't have a file.
+    """
+    filename: str | None = module_globals.get("__file__")
+    if filename is None:
+        filename = get_caller_filename(stack_level=stack_level + 1)
+    return Path(filename).parent
@@ -1,24 +1,28 @@
 from __future__ import annotations
 
 import sys
-from collections.abc import Callable, Generator, Mapping, Sequence
+from collections.abc import Callable, Collection, Generator, Iterable, Iterator, Mapping, Sequence
 from typing import Any, Generic, ParamSpec, TypedDict, TypeVar
 
 if sys.version_info >= (3, 12):  # pragma: no cover
-    from typing import Unpack
+    from typing import Self, Unpack
 else:  # pragma: no cover
-    from typing_extensions import Unpack
+    from typing_extensions import Self, Unpack
 
 __all__ = [
     "Any",
     "CacheConfig",
     "Callable",
+    "Collection",
     "DBConfig",
     "DBConfigExtra",
     "Generator",
     "Generic",
+    "Iterable",
+    "Iterator",
     "Mapping",
     "ParamSpec",
+    "Self",
     "Sequence",
     "TypeVar",
     "Unpack",
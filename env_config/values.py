@@ -1,33 +1,67 @@
 from __future__ import annotations
 
-import json
+import contextlib
+import itertools
+import logging
+import math
+import sys
+import threading
+import time
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from array import array
+from dataclasses import dataclass, replace
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
+from weakref import ref
 
 from django.utils.module_loading import import_string
 
-from .constants import Undefined
+from .constants import ARRAY_TYPECODES, IMPORT_MODES, JSON_BACKENDS, Undefined
+from .dependencies import DependencyRecorder, affected_settings, resolving
 from .errors import MissingEnvValueError, MissingExtraDependencyError
-from .typing import Any, CacheConfig, DBConfig, DBConfigExtra, Generator, Generic, Mapping, Sequence, TypeVar, Unpack
+from .imports import ImportString, validate_import_string
+from .jsonlib import compile_schema, get_json_backend, read_json_file
+from .networks import IPNetworkSet
+from .typing import (
+    Any,
+    CacheConfig,
+    Callable,
+    DBConfig,
+    DBConfigExtra,
+    Generator,
+    Generic,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+    TypeVar,
+    Unpack,
+)
 
 if TYPE_CHECKING:
+    from .aio import AsyncSource
     from .base import Environment
 
 
 __all__ = [
+    "ArrayValue",
     "BooleanValue",
     "CacheURLValue",
+    "ComputedValue",
     "DatabaseURLValue",
     "DecimalValue",
     "DictValue",
+    "DynamicStats",
+    "DynamicValue",
     "EmailValue",
     "FloatValue",
+    "IPNetworkSetValue",
     "IPValue",
     "ImportStringValue",
     "IntegerValue",
+    "JsonFileValue",
     "JsonValue",
     "ListValue",
     "MappingValue",
@@ -45,8 +79,25 @@
 
 T = TypeVar("T")
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=128)
+def get_validator(path: str, **kwargs: Any) -> Callable[[str], None]:
+    """
+    Import a validator from the given dotted path once, and reuse it for all conversions.
+    Validator classes are instantiated with the given keyword arguments.
+
+    :param path: Dotted path to the validator function or class, e.g., `django.core.validators.URLValidator`.
+    :param kwargs: Keyword arguments for instantiating a validator class.
+    """
+    validator = import_string(path)
+    return validator(**kwargs) if isinstance(validator, type) else validator
+
 
 class Value(ABC, Generic[T]):
+    __slots__ = ("default", "name", "skip_env", "value_by_environment")
+
     def __init__(
         self,
         *,
@@ -66,7 +117,10 @@ def __init__(
 
         # Use a map to store the value per environment so that we can have
         # different values for environments what inherit from each other.
-        self.value_by_environment: dict[type[Environment], Any] = defaultdict(lambda: Undefined)
+        # Environments are referenced weakly so that values don't keep discarded environments alive.
+        # A weak reference compares equal to another weak reference to the same environment,
+        # so values can be looked up with `ref(env)`, which doesn't allocate if a reference already exists.
+        self.value_by_environment: dict[ref[type[Environment]], Any] = {}
         super().__init__()
 
     def __set_name__(self, env: type[Environment], name: str) -> None:
@@ -76,11 +130,33 @@ def __set_name__(self, env: type[Environment], name: str) -> None:
 
     def __get__(self, _: Environment | None, env: type[Environment]) -> T:
         """Called when accessing the field on the class or an instance of the class."""
-        if self.value_by_environment[env] is not Undefined:
-            return self.value_by_environment[env]
+        value = self.value_by_environment.get(ref(env), Undefined)
+        if value is Undefined:
+            value = self.get_for_environment(env)
+            self.set_value(env, value)
+        return value
 
-        self.value_by_environment[env] = self.get_for_environment(env)
-        return self.value_by_environment[env]
+    def set_value(self, env: type[Environment], value: T) -> None:
+        """Set the value of this field for the given environment."""
+        self.value_by_environment[ref(env, self._remove_environment)] = value
+
+    def clear_value(self, env: type[Environment]) -> None:
+        """Clear the value of this field for the given environment, so that it's loaded again on next access."""
+        self.value_by_environment.pop(ref(env), None)
+
+    def _remove_environment(self, env_ref: ref[type[Environment]]) -> None:
+        # Called when an environment is garbage collected. Dead references only compare equal to themselves.
+        self.value_by_environment.pop(env_ref, None)
+
+    def get_input_stamp(self, value: str) -> Any:
+        """
+        Get a stamp for inputs of the converted value other than the raw value, which changes
+        when the inputs change, e.g., the modification time of a file that the raw value points to.
+        Used to check if a settings snapshot is still valid.
+
+        :param value: The raw value from the `.env` file or environment.
+        """
+        return None
 
     def get_for_environment(self, env: type[Environment]) -> T:
         value = self.default if env.dotenv is Undefined or self.skip_env else env.dotenv.get(self.name, self.default)
@@ -101,6 +177,8 @@ def convert(self, value: str | T) -> T:  # pragma: no cover
 class StringValue(Value[str]):
     """Parses env variables into a string value."""
 
+    __slots__ = ()
+
     def convert(self, value: str) -> str:
         return value
 
@@ -108,14 +186,14 @@ def convert(self, value: str) -> str:
 class BooleanValue(Value[bool]):
     """Parses env variables into a boolean value."""
 
+    __slots__ = ()
+
     def convert(self, value: str | bool) -> bool:  # noqa: FBT001
         if isinstance(value, bool):
             return value
-        normalized_value = value.strip().lower()
-        if normalized_value in ("yes", "y", "true", "1"):
-            return True
-        if normalized_value in ("no", "n", "false", "0", ""):
-            return False
+        result = BOOLEAN_VALUES.get(value.strip().lower())
+        if result is not None:
+            return result
         msg = f"Cannot interpret {value!r} as a boolean value"
         raise ValueError(msg)
 
@@ -123,6 +201,8 @@ def convert(self, value: str | bool) -> bool:  # noqa: FBT001
 class IntegerValue(Value[int]):
     """Parses env variables into an integer value."""
 
+    __slots__ = ()
+
     def convert(self, value: str | int) -> int:
         return int(value)
 
@@ -130,6 +210,8 @@ def convert(self, value: str | int) -> int:
 class PositiveIntegerValue(IntegerValue):
     """Parses env variables into an integer value, and validates that the value is positive."""
 
+    __slots__ = ()
+
     def convert(self, value: str | int) -> int:
         val = super().convert(value)
         if val < 0:
@@ -141,13 +223,17 @@ def convert(self, value: str | int) -> int:
 class FloatValue(Value[float]):
     """Parses env variables into a float value."""
 
+    __slots__ = ()
+
     def convert(self, value: str | float) -> float:
         return float(value)
 
 
-class DecimalValue(Value[Decimal], Decimal):
+class DecimalValue(Value[Decimal]):
     """Parses env variables into a Decimal value."""
 
+    __slots__ = ()
+
     def convert(self, value: str | Decimal) -> Decimal:
         return Decimal(value)
 
@@ -155,12 +241,77 @@ def convert(self, value: str | Decimal) -> Decimal:
 class ImportStringValue(Value[str]):
     """Parses env variables into a string value, and validates that the value is an importable string."""
 
+    __slots__ = ("check_attribute", "mode")
+
+    def __init__(
+        self,
+        *,
+        default: str | None = Undefined,
+        env_name: str | Undefined | None = Undefined,
+        mode: str = "import",
+        check_attribute: bool = True,
+    ) -> None:
+        """
+        Value descriptor for an importable dotted path.
+
+        :param default: The default value to use if the environment variable is not set.
+        :param env_name: The name of the environment variable to use. If not given, the name of the field is used.
+                         Set this to `None` to skip loading the value from the environment.
+        :param mode: How to validate the dotted path. `"import"` (default) imports the path.
+                     `"spec"` only checks that the module can be found, without executing it.
+                     `"lazy"` validates like `"spec"`, but returns an `ImportString`, which imports
+                     the path when its `load` method is first called.
+        :param check_attribute: With `"spec"` and `"lazy"` modes, check that the module defines the attribute
+                                by analyzing its source code, if the module hasn't been imported yet.
+        """
+        if mode not in IMPORT_MODES:
+            msg = f"Unknown import mode {mode!r}. Available modes: {', '.join(IMPORT_MODES)}"
+            raise ValueError(msg)
+
+        self.mode = mode
+        self.check_attribute = check_attribute
+        super().__init__(default=default, env_name=env_name)
+
     def convert(self, value: str) -> str:
-        import_string(value)
+        if self.mode == "import":
+            import_string(value)
+            return value
+
+        validate_import_string(value, check_attribute=self.check_attribute)
+        if self.mode == "lazy":
+            return ImportString(value)
         return value
 
 
+# Interpretations of boolean values, after stripping whitespace and lower-casing them.
+BOOLEAN_VALUES: dict[str, bool] = {
+    "yes": True,
+    "y": True,
+    "true": True,
+    "1": True,
+    "no": False,
+    "n": False,
+    "false": False,
+    "0": False,
+    "": False,
+}
+
+# Converters for converting all items of a sequence at once, for children of these exact types.
+# Items are skipped if empty, and otherwise converted like the child would convert the stripped item.
+# `int`, `float` and `Decimal` ignore surrounding whitespace, so the items don't need to be stripped for them.
+# Subclasses are not included, since they may convert values differently.
+BULK_CONVERTERS: dict[type[Value], Callable[[list[str]], list[Any]]] = {
+    StringValue: lambda items: [item.strip() for item in items if item],
+    BooleanValue: lambda items: [BOOLEAN_VALUES[item.strip().lower()] for item in items if item],
+    IntegerValue: lambda items: list(map(int, filter(None, items))),
+    FloatValue: lambda items: list(map(float, filter(None, items))),
+    DecimalValue: lambda items: list(map(Decimal, filter(None, items))),
+}
+
+
 class SequenceValue(Value, ABC, Generic[T]):
+    __slots__ = ("child", "delimiter")
+
     def __init__(
         self,
         child: Value[T] | None = None,
@@ -173,7 +324,18 @@ def __init__(
         self.delimiter = delimiter
         super().__init__(default=default, env_name=env_name)
 
-    def iterate(self, value: str | Sequence[Any]) -> Generator[T, None, None]:
+    def iterate(self, value: str | Sequence[Any]) -> Iterable[T]:
+        if isinstance(value, str):
+            convert_items = BULK_CONVERTERS.get(type(self.child))
+            if convert_items is not None:
+                # If converting some item fails, convert the items one by one,
+                # so that the error is the same as without the bulk converter.
+                with contextlib.suppress(Exception):
+                    return convert_items(value.split(self.delimiter))
+
+        return self.convert_items(value)
+
+    def convert_items(self, value: str | Sequence[Any]) -> Generator[T, None, None]:
         seq = value.split(self.delimiter) if isinstance(value, str) else value
         for item in seq:
             if not item:
@@ -185,6 +347,8 @@ def iterate(self, value: str | Sequence[Any]) -> Generator[T, None, None]:
 class ListValue(SequenceValue):
     """Parses env variables like `item1,item2,item3` into a list."""
 
+    __slots__ = ()
+
     def convert(self, value: str | list[Any]) -> list[Any]:
         return list(self.iterate(value))
 
@@ -192,6 +356,8 @@ def convert(self, value: str | list[Any]) -> list[Any]:
 class TupleValue(SequenceValue):
     """Parses env variables like `item1,item2,item3` into a tuple."""
 
+    __slots__ = ()
+
     def convert(self, value: str | tuple[Any, ...]) -> tuple[Any, ...]:
         return tuple(self.iterate(value))
 
@@ -199,11 +365,102 @@ def convert(self, value: str | tuple[Any, ...]) -> tuple[Any, ...]:
 class SetValue(SequenceValue):
     """Parses env variables like `item1,item2,item3` into a set."""
 
+    __slots__ = ()
+
     def convert(self, value: str | set[str]) -> set[Any]:
         return set(self.iterate(value))
 
 
+class ArrayValue(Value[array]):
+    """
+    Parses env variables like `1,2,3` into an `array.array` of the given type, which stores the numbers
+    in a single packed buffer instead of as separate objects, like in a list or a tuple.
+    """
+
+    __slots__ = ("delimiter", "typecode")
+
+    def __init__(
+        self,
+        typecode: str = "q",
+        *,
+        default: array | Sequence[float] | None = Undefined,
+        env_name: str | Undefined | None = Undefined,
+        delimiter: str = ",",
+    ) -> None:
+        """
+        Value descriptor for an array of numbers.
+
+        :param typecode: Typecode of the `array` module for the type of the items, e.g., `"q"` for signed
+                         64-bit integers, `"H"` for unsigned 16-bit integers, or `"d"` for double precision floats.
+        :param default: The default value to use if the environment variable is not set.
+        :param env_name: The name of the environment variable to use. If not given, the name of the field is used.
+                         Set this to `None` to skip loading the value from the environment.
+        :param delimiter: The delimiter to use when splitting the string into items.
+        """
+        if typecode not in ARRAY_TYPECODES:
+            msg = f"Unsupported array typecode {typecode!r}. Available typecodes: {', '.join(ARRAY_TYPECODES)}"
+            raise ValueError(msg)
+
+        self.typecode = typecode
+        self.delimiter = delimiter
+        super().__init__(default=default, env_name=env_name)
+
+    def convert(self, value: str | array | Sequence[float]) -> array:
+        if isinstance(value, array) and value.typecode == self.typecode:
+            return value
+
+        items = self.parse_items(value) if isinstance(value, str) else value
+        if self.typecode == "f":
+            # Floats that don't fit in single precision would become infinite without an error.
+            items = array("d", items)
+            self.check_bounds(items)
+            return array(self.typecode, items)
+
+        try:
+            return array(self.typecode, items)
+        except OverflowError:
+            # Raise an error with the invalid value and the range of the typecode instead.
+            self.check_bounds(self.parse_items(value) if isinstance(value, str) else value)
+            raise  # pragma: no cover
+
+    def parse_items(self, value: str) -> Iterator[float]:
+        """Parse the numbers from the given string, skipping empty items."""
+        # `int` and `float` ignore surrounding whitespace, so the items don't need to be stripped.
+        parse = float if self.typecode in "fd" else int
+        return map(parse, filter(None, value.split(self.delimiter)))
+
+    def check_bounds(self, items: Iterable[float]) -> None:
+        """Check that the given numbers can be stored in the array, and raise a `ValueError` if not."""
+        minimum, maximum = array_bounds(self.typecode)
+        for item in items:
+            if isinstance(item, float) and not math.isfinite(item):
+                continue
+            if not minimum <= item <= maximum:
+                msg = f"Value {item} is out of range for array typecode {self.typecode!r} ({minimum} to {maximum})"
+                raise ValueError(msg)
+
+
+def array_bounds(typecode: str) -> tuple[float, float]:
+    """
+    Get the smallest and largest number that can be stored in an array with the given typecode.
+
+    :param typecode: Typecode of the `array` module.
+    """
+    if typecode == "d":
+        return -sys.float_info.max, sys.float_info.max
+    if typecode == "f":
+        maximum = (2 - 2**-23) * 2**127
+        return -maximum, maximum
+
+    bits = array(typecode).itemsize * 8
+    if typecode.isupper():
+        return 0, 2**bits - 1
+    return -(2 ** (bits - 1)), 2 ** (bits - 1) - 1
+
+
 class MappingValue(Value, ABC, Generic[T]):
+    __slots__ = ("child", "item_delimiter", "kv_delimiter")
+
     def __init__(
         self,
         child: Value[T] | None = None,
@@ -239,6 +496,8 @@ def iterate(self, value: str | Mapping[str, Any]) -> Generator[tuple[str, Any],
 class DictValue(MappingValue):
     """Parses env variables like `key1=value1;key2=value2` into a dict."""
 
+    __slots__ = ()
+
     def convert(self, value: str | dict[str, Any]) -> dict[str, Any]:
         return dict(self.iterate(value))
 
@@ -246,45 +505,147 @@ def convert(self, value: str | dict[str, Any]) -> dict[str, Any]:
 class JsonValue(Value[dict | list]):
     """Parses env variables from a json string to a python list or dict."""
 
+    __slots__ = ("backend", "schema", "validator")
+
+    def __init__(
+        self,
+        *,
+        default: dict | list | None = Undefined,
+        env_name: str | Undefined | None = Undefined,
+        backend: str = "json",
+        schema: Mapping[str, Any] | None = None,
+    ) -> None:
+        """
+        Value descriptor for a JSON value.
+
+        :param default: The default value to use if the environment variable is not set.
+        :param env_name: The name of the environment variable to use. If not given, the name of the field is used.
+                         Set this to `None` to skip loading the value from the environment.
+        :param backend: Library to parse the JSON with: `"json"` (default) for the standard library, `"orjson"`,
+                        `"ujson"`, or `"auto"` for the fastest installed one. Note that the other backends
+                        may parse large integers differently than the standard library.
+        :param schema: If given, validate the parsed value against this schema. See `jsonlib.compile_schema`.
+        """
+        if backend not in JSON_BACKENDS:
+            msg = f"Unknown JSON backend {backend!r}. Available backends: {', '.join(JSON_BACKENDS)}"
+            raise ValueError(msg)
+
+        self.backend = backend
+        self.schema = schema
+        self.validator = compile_schema(schema) if schema is not None else None
+        super().__init__(default=default, env_name=env_name)
+
+    def convert(self, value: str | list | dict) -> list | dict:
+        if not isinstance(value, list | dict):
+            value = get_json_backend(self.backend).parse(value)
+        return self.validate(value)
+
+    def validate(self, value: list | dict) -> list | dict:
+        """Validate the parsed value against the schema, if any."""
+        if self.validator is not None:
+            self.validator(value, "$")
+        return value
+
+
+class JsonFileValue(JsonValue):
+    """Parses the JSON file in the path given in env variables to a python list or dict."""
+
+    __slots__ = ()
+
     def convert(self, value: str | list | dict) -> list | dict:
         if isinstance(value, list | dict):
-            return value
-        return json.loads(value)
+            return self.validate(value)
+
+        path = Path(value).absolute()
+        try:
+            result = read_json_file(path, get_json_backend(self.backend))
+        except FileNotFoundError:
+            msg = f"JSON file '{path}' does not exist"
+            raise ValueError(msg) from None
+        return self.validate(result)
+
+    def get_input_stamp(self, value: str) -> Any:
+        try:
+            stat = Path(value).stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
 
 
 class EmailValue(StringValue):
     """Parses env variables into a string value, and validates that it's a valid email address."""
 
-    def convert(self, value: str) -> str:
-        from django.core.validators import validate_email
+    __slots__ = ()
 
-        validate_email(value)
+    def convert(self, value: str) -> str:
+        get_validator("django.core.validators.validate_email")(value)
         return value
 
 
 class URLValue(StringValue):
     """Parses env variables into a string value, and validates that it's a valid URL."""
 
-    def convert(self, value: str) -> str:
-        from django.core.validators import URLValidator
+    __slots__ = ()
 
-        URLValidator()(value)
+    def convert(self, value: str) -> str:
+        get_validator("django.core.validators.URLValidator")(value)
         return value
 
 
 class IPValue(StringValue):
     """Parses env variables into a string value, and validates that it's a valid IP address."""
 
-    def convert(self, value: str) -> str:
-        from django.core.validators import validate_ipv46_address
+    __slots__ = ()
 
-        validate_ipv46_address(value)
+    def convert(self, value: str) -> str:
+        get_validator("django.core.validators.validate_ipv46_address")(value)
         return value
 
 
+class IPNetworkSetValue(Value[IPNetworkSet]):
+    """
+    Parses env variables like `10.0.0.0/8,192.168.1.1,2001:db8::/32` into a set of IP networks,
+    which can be used to check if an address is in any of the networks in O(log n) time.
+    """
+
+    __slots__ = ("delimiter", "strict")
+
+    def __init__(
+        self,
+        *,
+        default: IPNetworkSet | Iterable[str] | None = Undefined,
+        env_name: str | Undefined | None = Undefined,
+        delimiter: str = ",",
+        strict: bool = True,
+    ) -> None:
+        """
+        Value descriptor for a set of IP networks.
+
+        :param default: The default value to use if the environment variable is not set.
+        :param env_name: The name of the environment variable to use. If not given, the name of the field is used.
+                         Set this to `None` to skip loading the value from the environment.
+        :param delimiter: The delimiter to use when splitting the string into networks.
+        :param strict: If `True`, networks with host bits set (e.g. `10.0.0.1/8`) are invalid.
+                       Otherwise, the host bits are ignored.
+        """
+        self.delimiter = delimiter
+        self.strict = strict
+        super().__init__(default=default, env_name=env_name)
+
+    def convert(self, value: str | IPNetworkSet | Iterable[str]) -> IPNetworkSet:
+        if isinstance(value, IPNetworkSet):
+            return value
+        items = value.split(self.delimiter) if isinstance(value, str) else value
+        return IPNetworkSet(
+            (item.strip() if isinstance(item, str) else item for item in items if item), strict=self.strict
+        )
+
+
 class RegexValue(StringValue):
     """Parses env variables into a string value, and validates that it matches the given regex."""
 
+    __slots__ = ("regex",)
+
     def __init__(
         self,
         *,
@@ -296,15 +657,15 @@ def __init__(
         super().__init__(default=default, env_name=env_name)
 
     def convert(self, value: str) -> str:
-        from django.core.validators import RegexValidator
-
-        RegexValidator(regex=self.regex)(value)
+        get_validator("django.core.validators.RegexValidator", regex=self.regex)(value)
         return value
 
 
 class PathValue(StringValue):
     """Parses env variable into a string value, and can optionally validate that the path exists."""
 
+    __slots__ = ("check_exists", "create_if_missing", "mode")
+
     def __init__(
         self,
         *,
@@ -329,10 +690,18 @@ def convert(self, value: str) -> str:
 
         return str(path)
 
+    def get_input_stamp(self, value: str) -> Any:
+        # Relative paths are resolved from the working directory, and the path is checked or created
+        # when converting, so the value must be converted again if either has changed.
+        path = Path(value).absolute()
+        return str(path), path.exists()
+
 
 class DatabaseURLValue(Value[DBConfig | str]):
     """Load a database configuration from a URL."""
 
+    __slots__ = ("db_alias", "params")
+
     def __init__(
         self,
         *,
@@ -366,6 +735,8 @@ def convert(self, value: str | DBConfig) -> dict[str, DBConfig]:
 class CacheURLValue(Value[CacheConfig | str]):
     """Load a cache configuration from a URL."""
 
+    __slots__ = ("cache_alias",)
+
     def __init__(
         self,
         *,
@@ -392,3 +763,241 @@ def convert(self, value: str | CacheConfig) -> dict[str, CacheConfig]:
 
         config = parse(value)
         return {self.cache_alias: config}
+
+
+@dataclass(slots=True)
+class DynamicStats:
+    """Counters for accesses to a `DynamicValue`."""
+
+    hits: int = 0
+    """Accesses served from the cache before the value expired."""
+
+    stale_hits: int = 0
+    """Accesses served from the cache after the value expired, which started a refresh."""
+
+    misses: int = 0
+    """Accesses for which there was no cached value, so the value was loaded before returning it."""
+
+    refreshes: int = 0
+    """Refreshes that loaded the value again successfully."""
+
+    errors: int = 0
+    """Refreshes that failed. The previous value is still used."""
+
+
+class DynamicValue(Value[T]):
+    """
+    Wraps a value descriptor, so that its value is loaded again from its source after it expires,
+    e.g., for kill switches and tunables that should change without restarting the process.
+
+    Expired values are refreshed with stale-while-revalidate semantics: the expired value is returned
+    immediately, and the value is loaded again on a background thread, so accessing the setting
+    never waits for a refresh. Only the first access, when there is no value yet, loads the value
+    before returning it.
+    """
+
+    __slots__ = ("child", "counters", "hit_counter", "hit_reads", "lock", "refreshing", "source", "ttl")
+
+    def __init__(
+        self,
+        child: Value[T],
+        *,
+        ttl: float = 30.0,
+        source: AsyncSource | Mapping[str, str] | None = None,
+        default: T | None = Undefined,
+        env_name: str | Undefined | None = Undefined,
+    ) -> None:
+        """
+        Value descriptor for a setting that is refreshed at runtime.
+
+        :param child: Value descriptor for converting the value, e.g., `BooleanValue()`.
+        :param ttl: Time in seconds after which the value is refreshed when it's accessed.
+        :param source: Where to load the value from when it's refreshed. Can be an asynchronous source
+                       (see `aio.AsyncSource`), or a mapping, e.g., `sources.EnvironView`. By default, the value
+                       is loaded from the values of the environment, which only change with `use_environ`
+                       without projection, or when the environment is reloaded.
+        :param default: The default value to use if the value is not defined in the source.
+        :param env_name: The name of the value in the source. If not given, the name of the field is used.
+        """
+        self.child = child
+        self.ttl = ttl
+        self.source = source
+        # Accesses other than hits are rare, so they are counted while holding the lock. Hits are counted
+        # with `next` on an `itertools.count`, which is atomic, so that the fast path doesn't need the lock.
+        self.counters = DynamicStats()
+        self.hit_counter = itertools.count()
+        self.hit_reads = 0
+        self.refreshing: set[ref[type[Environment]]] = set()
+        self.lock = threading.Lock()
+        super().__init__(default=default, env_name=env_name)
+
+    def __get__(self, _: Environment | None, env: type[Environment]) -> T:
+        # Values are stored with the time on the monotonic clock when they expire.
+        entry: tuple[T, float] | Undefined = self.value_by_environment.get(ref(env), Undefined)
+        if entry is Undefined:
+            with self.lock:
+                self.counters.misses += 1
+            value = self.get_for_environment(env)
+            self.set_value(env, value)
+            return value
+
+        value, expires = entry
+        if time.monotonic() < expires:
+            next(self.hit_counter)
+        else:
+            with self.lock:
+                self.counters.stale_hits += 1
+            self.start_refresh(env)
+        return value
+
+    @property
+    def stats(self) -> DynamicStats:
+        """Counts of the accesses to the value so far."""
+        with self.lock:
+            # A count cannot be read without advancing it, so earlier reads are subtracted.
+            hits = next(self.hit_counter) - self.hit_reads
+            self.hit_reads += 1
+            return replace(self.counters, hits=hits)
+
+    def set_value(self, env: type[Environment], value: T) -> None:
+        super().set_value(env, (value, time.monotonic() + self.ttl))
+
+    def get_for_environment(self, env: type[Environment]) -> T:
+        if self.source is None:
+            return super().get_for_environment(env)
+
+        if isinstance(self.source, Mapping):
+            value = self.source.get(self.name, self.default)
+        else:
+            from .aio import fetch_values
+
+            value = fetch_values([self.source], [self.name]).get(self.name, self.default)
+
+        if value is Undefined:
+            raise MissingEnvValueError(name=self.name, env=env)
+        if value is None:
+            return None
+        return self.convert(value)
+
+    def convert(self, value: str | T) -> T:
+        return self.child.convert(value)
+
+    def start_refresh(self, env: type[Environment]) -> threading.Thread | None:
+        """
+        Start refreshing the value for the given environment on a background thread,
+        unless it's already being refreshed. Returns the started thread.
+
+        :param env: The environment to refresh the value for.
+        """
+        env_ref = ref(env)
+        with self.lock:
+            if env_ref in self.refreshing:
+                return None
+            self.refreshing.add(env_ref)
+
+        thread = threading.Thread(target=self.refresh, args=(env,), name=f"env-config-{self.name}", daemon=True)
+        try:
+            thread.start()
+        except BaseException:
+            with self.lock:
+                self.refreshing.discard(env_ref)
+            raise
+        return thread
+
+    def refresh(self, env: type[Environment]) -> None:
+        """
+        Load the value for the given environment again. If loading the value fails, the error is logged,
+        and the previous value is used until it expires again.
+
+        :param env: The environment to refresh the value for.
+        """
+        env_ref = ref(env)
+        try:
+            value = self.get_for_environment(env)
+        except Exception:
+            with self.lock:
+                self.counters.errors += 1
+            logger.warning(f"Could not refresh setting {self.name!r} of environment {env.__name__!r}", exc_info=True)
+            entry = self.value_by_environment.get(env_ref, Undefined)
+            if entry is not Undefined:
+                self.set_value(env, entry[0])
+        else:
+            self.set_value(env, value)
+            with self.lock:
+                self.counters.refreshes += 1
+        finally:
+            with self.lock:
+                self.refreshing.discard(env_ref)
+
+
+class ComputedValue(Value[T]):
+    """
+    Computes a setting from other settings of the environment using the given function.
+    The settings read by the function are recorded, so that only the affected settings
+    are computed again when some settings change, e.g., when the environment is reloaded.
+    """
+
+    __slots__ = ("dependencies_by_environment", "func")
+
+    def __init__(self, func: Callable[[type[Environment]], T]) -> None:
+        """
+        Value descriptor for a computed setting. Can also be used as a decorator.
+
+        :param func: Function that returns the value for the setting. Receives the environment
+                     (through a proxy that records the settings read from it) as its only argument.
+        """
+        self.func = func
+        self.dependencies_by_environment: dict[ref[type[Environment]], frozenset[str]] = {}
+        super().__init__(env_name=None)
+
+    def get_for_environment(self, env: type[Environment]) -> T:
+        return self.compute(env)
+
+    def convert(self, value: T) -> T:
+        return value
+
+    def compute(self, env: type[Environment], *, resolve: Callable[[str], Any] | None = None) -> T:
+        """
+        Compute the value for the given environment, and record the settings it depends on.
+
+        :param env: The environment to compute the value for.
+        :param resolve: Function for getting the values of other settings instead of the environment.
+        """
+        with resolving(env, self.name):
+            recorder = DependencyRecorder(env, resolve)
+            value = self.func(recorder)  # type: ignore[arg-type]
+
+        self.dependencies_by_environment[ref(env, self._remove_environment)] = recorder.dependencies
+        return value
+
+    def dependencies(self, env: type[Environment]) -> frozenset[str] | None:
+        """Settings the value depends on in the given environment, or `None` if it hasn't been computed yet."""
+        return self.dependencies_by_environment.get(ref(env))
+
+    def _remove_environment(self, env_ref: ref[type[Environment]]) -> None:
+        super()._remove_environment(env_ref)
+        self.dependencies_by_environment.pop(env_ref, None)
+
+    @staticmethod
+    def recompute(env: type[Environment], changed: Mapping[str, Any]) -> dict[str, Any]:
+        """
+        Compute the computed settings affected by the given changes again, in dependency order.
+        The new values are not set to the environment.
+
+        :param env: The environment to compute the settings for.
+        :param changed: Settings that have changed, mapped to their new values.
+        """
+        computed: dict[str, ComputedValue] = {
+            name: field.value for name, field in env.fields.items() if isinstance(field.value, ComputedValue)
+        }
+        dependencies = {name: value.dependencies(env) for name, value in computed.items()}
+        affected = affected_settings(dependencies, changed)
+        values = dict(changed)
+
+        def resolve(name: str) -> Any:
+            # Compute affected settings on demand, so that dependencies are always computed first.
+            if name not in values and name in affected:
+                values[name] = computed[name].compute(env, resolve=resolve)
+            return values[name] if name in values else getattr(env, name)
+
+        return {name: resolve(name) for name in computed if name in affected}
@@ -63,5 +63,16 @@ def tests(session: nox.Session, django: str) -> None:
     session.run("coverage", "run", "-m", "pytest", external="error")
 
 
+@nox.session(python=python_versions()[-1], reuse_venv=True)
+def benchmarks(session: nox.Session) -> None:
+    env = {
+        "POETRY_VIRTUALENVS_PATH": str(Path(session.virtualenv.bin).parent),
+    }
+
+    session.run_install("poetry", "install", "--all-extras", external=True, env=env)
+
+    session.run("python", "-m", "benchmarks.bench_startup", *session.posargs, external="error")
+
+
 if __name__ == "__main__":
     nox.main()
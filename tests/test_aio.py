@@ -0,0 +1,206 @@
+import asyncio
+import json
+import re
+import threading
+
+import pytest
+
+from env_config import Environment, values
+from env_config.aio import AsyncSource, CallableSource, MappingSource, fetch_values, gather_values
+from env_config.errors import MissingEnvValueError
+from tests.helpers import set_dotenv
+
+
+class StandInServer:
+    """
+    Local stand-in for a key-value service, e.g., a secrets agent.
+    Reads a JSON list of keys per line, and responds with a JSON object of the defined values.
+    """
+
+    def __init__(self, data, *, delay=0.0):
+        self.data = data
+        self.delay = delay
+        self.requests = []
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.server = None
+
+    async def handle(self, reader, writer):
+        while line := await reader.readline():
+            keys = json.loads(line)
+            self.requests.append(keys)
+            await asyncio.sleep(self.delay)
+            response = {key: self.data[key] for key in keys if key in self.data}
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+        writer.close()
+
+    def __enter__(self):
+        self.thread.start()
+        start = asyncio.start_server(self.handle, host="127.0.0.1", port=0)
+        self.server = asyncio.run_coroutine_threadsafe(start, self.loop).result()
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    def __exit__(self, *args):
+        self.server.close()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+class ServerSource(AsyncSource):
+    def __init__(self, port):
+        self.port = port
+        self.connection = None
+        self.closed = 0
+
+    async def fetch_many(self, keys):
+        if self.connection is None:
+            self.connection = await asyncio.open_connection("127.0.0.1", self.port)
+        reader, writer = self.connection
+        writer.write(json.dumps(sorted(keys)).encode() + b"\n")
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    async def aclose(self):
+        self.closed += 1
+        if self.connection is not None:
+            self.connection[1].close()
+            await self.connection[1].wait_closed()
+            self.connection = None
+
+
+class BarrierSource(AsyncSource):
+    """Source that only responds once all sources sharing the barrier have been fetched from."""
+
+    def __init__(self, data, barrier):
+        self.data = data
+        self.barrier = barrier
+
+    async def fetch_many(self, keys):
+        await asyncio.wait_for(self.barrier.wait(), timeout=5)
+        return {key: self.data[key] for key in keys if key in self.data}
+
+
+class FailingSource(AsyncSource):
+    def __init__(self, error, *, delay=0.0):
+        self.error = error
+        self.delay = delay
+
+    async def fetch_many(self, keys):
+        await asyncio.sleep(self.delay)
+        raise self.error
+
+
+def test_fetch_values():
+    async def fetch(keys):
+        return {"FOO": "callable", "BAR": "callable"}
+
+    sources = [MappingSource({"FOO": "mapping"}), CallableSource(fetch)]
+    # Values from the source given first are used.
+    assert fetch_values(sources, {"FOO", "BAR", "BAZ"}) == {"FOO": "mapping", "BAR": "callable"}
+
+
+def test_fetch_values__only_requested_keys():
+    async def fetch(keys):
+        return {"FOO": "1", "OTHER": "2"}
+
+    assert fetch_values([CallableSource(fetch)], ["FOO"]) == {"FOO": "1"}
+
+
+def test_fetch_values__nothing_to_fetch():
+    source = FailingSource(ValueError("not fetched"))
+    assert fetch_values([source], []) == {}
+    assert fetch_values([], ["FOO"]) == {}
+
+
+def test_fetch_values__concurrent():
+    async def fetch():
+        barrier = asyncio.Barrier(3)
+        sources = [BarrierSource({"FOO": "1"}, barrier), BarrierSource({"BAR": "2"}, barrier)]
+        task = asyncio.create_task(gather_values(sources, ["FOO", "BAR"]))
+        # If the sources were fetched from one at a time, the barrier would never be passed.
+        await asyncio.wait_for(barrier.wait(), timeout=5)
+        return await task
+
+    assert asyncio.run(fetch()) == {"FOO": "1", "BAR": "2"}
+
+
+def test_fetch_values__error():
+    first = ValueError("first")
+    second = ValueError("second")
+    # The error of the first source is raised, even if it fails last.
+    sources = [FailingSource(first, delay=0.05), FailingSource(second), MappingSource({"FOO": "1"})]
+    with pytest.raises(ValueError, match="first"):
+        fetch_values(sources, ["FOO"])
+
+
+def test_fetch_values__running_loop():
+    async def fetch():
+        return fetch_values([MappingSource({"FOO": "1"})], ["FOO"])
+
+    assert asyncio.run(fetch()) == {"FOO": "1"}
+
+
+def test_fetch_values__server():
+    with StandInServer({"FOO": "1", "BAR": "2", "OTHER": "3"}, delay=0.01) as server:
+        source = ServerSource(server.port)
+        assert fetch_values([source], ["FOO", "BAR", "BAZ"]) == {"FOO": "1", "BAR": "2"}
+
+        # All keys are fetched with a single request, and the connection is closed after fetching.
+        assert server.requests == [["BAR", "BAZ", "FOO"]]
+        assert source.closed == 1
+        assert source.connection is None
+
+
+def test_mapping_source__repr():
+    assert repr(MappingSource({})) == "MappingSource({})"
+
+
+@set_dotenv("Test", FOO="dotenv")
+def test_environment__sources():
+    with StandInServer({"FOO": "server", "BAR": "server", "BAZ": "1"}) as server:
+
+        class Test(Environment, sources=[MappingSource({"BAR": "mapping"}), ServerSource(server.port)]):
+            FOO = values.StringValue()
+            BAR = values.StringValue()
+            BAZ = values.IntegerValue()
+            FIZZ = values.StringValue(default="fizz")
+
+        # Values already defined in the `.env` file are not fetched.
+        assert server.requests == [["BAR", "BAZ", "FIZZ"]]
+
+    assert Test.FOO == "dotenv"
+    assert Test.BAR == "mapping"
+    assert Test.BAZ == 1
+    assert Test.FIZZ == "fizz"
+    assert len(Test.sources) == 2
+
+
+@set_dotenv("Test")
+def test_environment__sources__no_dotenv():
+    source = MappingSource({"FOO": "mapping"})
+
+    class Test(Environment, dotenv_path=None, sources=[source]):
+        FOO = values.StringValue()
+
+    assert Test.FOO == "mapping"
+    assert Test.sources == (source,)
+
+
+@set_dotenv("Test")
+def test_environment__sources__missing():
+    msg = "Value 'FOO' in environment 'Test' not defined in the sources of the environment"
+    with pytest.raises(MissingEnvValueError, match=re.escape(msg)):
+
+        class Test(Environment, dotenv_path=None, sources=[MappingSource({})]):
+            FOO = values.StringValue()
+
+
+@set_dotenv("Test")
+def test_environment__sources__error():
+    with pytest.raises(ConnectionError, match="unavailable"):
+
+        class Test(Environment, sources=[FailingSource(ConnectionError("unavailable"))]):
+            FOO = values.StringValue()
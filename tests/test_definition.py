@@ -1,4 +1,8 @@
+import os
 import re
+import sys
+from types import ModuleType
+from unittest.mock import patch
 
 import pytest
 
@@ -6,6 +10,7 @@
 from env_config.constants import Undefined
 from env_config.decorators import classproperty
 from env_config.errors import MissingEnvValueError
+from env_config.sources import EnvironView
 from tests.helpers import set_dotenv, set_environ
 
 
@@ -194,3 +199,319 @@ class Test(Environment):
         FOO = values.StringValue(default="foo", env_name=None)
 
     assert Test.FOO == "foo"
+
+
+@set_dotenv("Test", FOO="bar")
+def test_environment__target_module():
+    module = ModuleType("target")
+
+    class Test(Environment, target_module=module):
+        FOO = values.StringValue()
+
+    assert Test.target_module is module
+    assert module.FOO == "bar"
+
+
+@set_dotenv("Test", FOO="bar")
+def test_environment__target_module__dotted_path():
+    module = ModuleType("tests.example_target")
+    sys.modules[module.__name__] = module
+    try:
+
+        class Test(Environment, target_module="tests.example_target"):
+            FOO = values.StringValue()
+
+    finally:
+        sys.modules.pop(module.__name__)
+
+    assert module.FOO == "bar"
+
+
+@set_dotenv("Test", FOO="bar")
+def test_environment__set_globals__module_not_in_sys_modules():
+    namespace = {"__name__": "not_a_module", "Environment": Environment, "values": values}
+    exec("class Test(Environment):\n    FOO = values.StringValue()\n", namespace)  # noqa: S102
+
+    assert namespace["FOO"] == "bar"
+
+
+@set_environ("Test")
+def test_environment__module_not_in_sys_modules__dotenv_search_dir(tmp_path):
+    # The environment is compiled as `a/settings.py`, and executed from a helper in `b/`,
+    # so the `.env` file must be found from the directory of the environment, not the helper.
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    (tmp_path / "a" / ".env").write_text("FOO=a\n", encoding="utf-8")
+    (tmp_path / "b" / ".env").write_text("FOO=b\n", encoding="utf-8")
+
+    settings = compile("class Test(Environment):\n    FOO = values.StringValue()\n", str(tmp_path / "a" / "settings.py"), "exec")
+    helper = compile("def load(code, namespace):\n    exec(code, namespace)\n", str(tmp_path / "b" / "helper.py"), "exec")
+    helper_namespace = {}
+    exec(helper, helper_namespace)  # noqa: S102
+
+    namespace = {"__name__": "not_a_module", "Environment": Environment, "values": values}
+    helper_namespace["load"](settings, namespace)
+
+    assert namespace["FOO"] == "a"
+    assert namespace["Test"].dotenv == {"FOO": "a"}
+
+
+def test_environment__load_dotenv__search_dir(tmp_path):
+    (tmp_path / ".env").write_text("FOO=bar\n", encoding="utf-8")
+
+    assert Environment.load_dotenv(search_dir=tmp_path) == {"FOO": "bar"}
+
+
+@set_environ("Test")
+def test_environment__load_dotenv__override_with_earlier_signature():
+    calls = []
+
+    class Test(Environment, dotenv_projection=True):
+        FOO = values.StringValue()
+
+        @staticmethod
+        def load_dotenv(*, dotenv_path=None, stack_level=1):
+            calls.append((dotenv_path, sys._getframe(stack_level).f_code.co_name))
+            return {"FOO": "foo", "OTHER": "other"}
+
+    # Only the arguments the override accepts are passed, and `stack_level` leads to where the environment
+    # is defined. Since the override doesn't accept `keys`, the values are filtered after loading.
+    assert calls == [(None, "test_environment__load_dotenv__override_with_earlier_signature")]
+    assert Test.dotenv == {"FOO": "foo"}
+    assert Test.FOO == "foo"
+
+
+@set_environ("Test")
+def test_environment__load_dotenv__override_with_kwargs(tmp_path):
+    calls = []
+
+    class Test(Environment, dotenv_path=tmp_path / ".env", dotenv_parser="native"):
+        @staticmethod
+        def load_dotenv(**kwargs):
+            calls.append(kwargs)
+            return {"FOO": "foo"}
+
+    assert calls == [
+        {
+            "dotenv_path": tmp_path / ".env",
+            "search_dir": None,
+            "parser": "native",
+            "keys": None,
+            "stack_level": 4,
+        },
+    ]
+    assert Test.dotenv == {"FOO": "foo"}
+
+
+@set_dotenv("Test", FOO="1")
+def test_environment__lazy():
+    module = ModuleType("target")
+
+    with patch.object(values.IntegerValue, "convert", side_effect=int) as convert:
+
+        class Test(Environment, target_module=module, lazy=True):
+            FOO = values.IntegerValue()
+
+        assert convert.call_count == 0
+        assert "FOO" not in vars(module)
+        assert "FOO" in dir(module)
+
+        assert module.FOO == 1
+        assert module.FOO == 1
+
+    assert convert.call_count == 1
+    assert vars(module)["FOO"] == 1
+
+
+@set_dotenv("Test")
+def test_environment__lazy__error_on_access():
+    module = ModuleType("target")
+
+    class Test(Environment, target_module=module, lazy=True):
+        FOO = values.IntegerValue()
+
+    with pytest.raises(MissingEnvValueError):
+        module.FOO  # noqa: B018
+
+    with pytest.raises(MissingEnvValueError):
+        Test.validate_all()
+
+
+@set_dotenv("Test", FOO="1")
+def test_environment__lazy__existing_module_getattr():
+    module = ModuleType("target")
+    module.FOO = 0
+    module.__getattr__ = lambda name: f"{name}!"
+
+    class Test(Environment, target_module=module, lazy=True):
+        FOO = values.IntegerValue()
+
+    assert module.FOO == 1
+    assert module.BAR == "BAR!"
+
+    class Test(Environment, target_module=module, lazy=True):
+        BAZ = values.IntegerValue(default=2)
+
+    assert module.BAZ == 2
+    assert module.BAR == "BAR!"
+
+
+@set_dotenv("Test")
+def test_environment__lazy__missing_attribute():
+    module = ModuleType("target")
+
+    class Test(Environment, target_module=module, lazy=True):
+        FOO = values.IntegerValue(default=1)
+
+    with pytest.raises(AttributeError, match=re.escape("module 'target' has no attribute 'BAR'")):
+        module.BAR  # noqa: B018
+
+
+@set_dotenv("Test", FOO="1")
+def test_environment__validate_all():
+    class Test(Environment, target_module=ModuleType("target"), lazy=True):
+        FOO = values.IntegerValue()
+
+    assert Test.validate_all() == {"FOO": 1}
+
+
+@set_dotenv("Prod", FOO="1")
+def test_environment__fields():
+    class Mixin:
+        BAR = "bar"
+        not_a_setting = None
+
+    class Common(Environment):
+        FOO = values.IntegerValue()
+        BAZ = values.StringValue(default="baz", env_name=None)
+
+    class Test(Mixin, Common):
+        FIZZ = values.StringValue(env_name="BUZZ")
+        _PRIVATE = None
+
+    assert list(Test.fields) == ["FOO", "BAZ", "BAR", "FIZZ"]
+
+    assert Test.fields["FOO"].value is vars(Common)["FOO"]
+    assert Test.fields["FOO"].owner is Common
+    assert Test.fields["FOO"].env_name == "FOO"
+    assert Test.fields["FOO"].is_descriptor is True
+
+    assert Test.fields["BAZ"].env_name is None
+    assert Test.fields["FIZZ"].env_name == "BUZZ"
+
+    assert Test.fields["BAR"].value == "bar"
+    assert Test.fields["BAR"].owner is Mixin
+    assert Test.fields["BAR"].env_name is None
+    assert Test.fields["BAR"].is_descriptor is False
+
+
+@set_dotenv("Test", FOO="1")
+def test_environment__fields__overrides_from():
+    class Overrides:
+        FOO = 2
+
+    class Test(Environment, overrides_from=Overrides):
+        FOO = values.IntegerValue()
+
+    assert Test.fields["FOO"].value == 2
+    assert Test.fields["FOO"].owner is Test
+
+
+@set_dotenv("Test", FOO="1")
+def test_environment__fields__added_in_pre_setup():
+    class Test(Environment):
+        FOO = values.IntegerValue()
+
+        @classmethod
+        def pre_setup(cls):
+            cls.BAR = "bar"
+
+    assert list(Test.fields) == ["FOO", "BAR"]
+    assert globals()["BAR"] == "bar"
+
+
+@pytest.mark.parametrize("parser", ["python-dotenv", "native"])
+def test_environment__dotenv_parser(tmp_path, parser):
+    path = tmp_path / ".env"
+    path.write_text("export FOO='bar baz'\nBAR=${FOO}!  # comment\n", encoding="utf-8")
+
+    with set_environ("Test"):
+
+        class Test(Environment, dotenv_path=path, dotenv_parser=parser):
+            FOO = values.StringValue()
+            BAR = values.StringValue()
+
+    assert Test.dotenv_parser == parser
+    assert Test.dotenv == {"FOO": "bar baz", "BAR": "bar baz!"}
+    assert Test.BAR == "bar baz!"
+
+
+@set_dotenv("Test")
+def test_environment__dotenv_parser__unknown():
+    msg = "Unknown dotenv parser 'foo'. Available parsers: python-dotenv, native"
+    with pytest.raises(ValueError, match=re.escape(msg)):
+
+        class Test(Environment, dotenv_parser="foo"):
+            pass
+
+
+@pytest.mark.parametrize("parser", ["python-dotenv", "native"])
+def test_environment__dotenv_projection(tmp_path, parser):
+    path = tmp_path / ".env"
+    path.write_text("FOO=1\nBAR=${FOO}2\nDB=sqlite://\nOTHER=3\n", encoding="utf-8")
+
+    with set_environ("Test"):
+
+        class Test(Environment, dotenv_path=path, dotenv_parser=parser, dotenv_projection=True):
+            FOO = values.IntegerValue()
+            BAR = values.IntegerValue()
+            DATABASE = values.StringValue(env_name="DB")
+            SKIPPED = values.StringValue(env_name=None, default="x")
+            PLAIN = "plain"
+
+    assert Test.dotenv_projection is True
+    assert Test.dotenv == {"FOO": "1", "BAR": "12", "DB": "sqlite://"}
+    assert Test.BAR == 12
+
+
+def test_environment__dotenv_projection__use_environ():
+    with set_environ("Test", FOO="1", BAR="2"):
+
+        class Test(Environment, use_environ=True, dotenv_projection=True):
+            FOO = values.IntegerValue()
+            MISSING = values.IntegerValue(default=3)
+
+    assert Test.dotenv == {"FOO": "1"}
+    assert Test.FOO == 1
+    assert Test.MISSING == 3
+
+
+@set_dotenv("Test", FOO="1")
+def test_environment__dotenv_projection__disabled_by_default():
+    class Test(Environment):
+        pass
+
+    assert Test.dotenv_projection is False
+
+
+@set_environ("Test", FOO="bar")
+def test_environment__use_environ__read_through():
+    class Test(Environment, use_environ=True, lazy=True):
+        FOO = values.StringValue()
+
+    assert isinstance(Test.dotenv, EnvironView)
+    assert Test.dotenv["FOO"] == "bar"
+
+    # Values are read from the environment when the setting is first loaded.
+    os.environ["FOO"] = "baz"
+    assert Test.FOO == "baz"
+
+
+@set_environ("Test", FOO="bar")
+def test_environment__use_environ__frozen_with_projection():
+    class Test(Environment, use_environ=True, dotenv_projection=True, lazy=True):
+        FOO = values.StringValue()
+
+    os.environ["FOO"] = "baz"
+    assert Test.dotenv == {"FOO": "bar"}
+    assert Test.FOO == "bar"
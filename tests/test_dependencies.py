@@ -0,0 +1,30 @@
+import pytest
+
+from env_config.dependencies import affected_settings
+
+
+@pytest.mark.parametrize(
+    ("changed", "affected"),
+    [
+        ([], set()),
+        (["A"], {"B", "C", "D"}),
+        (["E"], {"D"}),
+        (["F"], set()),
+    ],
+)
+def test_affected_settings(changed, affected):
+    dependencies = {
+        "B": frozenset({"A"}),
+        "C": frozenset({"B"}),
+        "D": frozenset({"C", "E"}),
+    }
+    assert affected_settings(dependencies, changed) == affected
+
+
+def test_affected_settings__unknown_dependencies():
+    dependencies = {
+        "B": None,
+        "C": frozenset({"B"}),
+        "D": frozenset({"E"}),
+    }
+    assert affected_settings(dependencies, []) == {"B", "C"}
@@ -0,0 +1,169 @@
+import os
+import subprocess
+import sys
+import textwrap
+from unittest.mock import patch
+
+import pytest
+
+from env_config import Environment, values
+from env_config.constants import HANDOFF_ENV_NAME
+from env_config.handoff import HANDOFF_HEADER, dumps, loads, read_handoff
+from tests.helpers import set_dotenv
+
+
+@pytest.fixture(autouse=True)
+def clear_handoff():
+    yield
+    os.environ.pop(HANDOFF_ENV_NAME, None)
+
+
+def create_environment():
+    class Test(Environment):
+        FOO = values.IntegerValue()
+        BAR = values.ListValue(child=values.URLValue())
+        BAZ = values.ComputedValue(lambda cls: cls.FOO * 2)
+        PLAIN = "plain"
+
+    return Test
+
+
+@pytest.mark.parametrize("kind", ["file", "fd", "shm"])
+def test_handoff(kind):
+    with set_dotenv("Test", FOO="1", BAR="https://example.com"):
+        Test = create_environment()
+
+    location = Test.export_handoff(kind=kind)
+    assert location.startswith(f"{kind}:")
+    assert os.environ[HANDOFF_ENV_NAME] == location
+
+    with set_dotenv("Test") as load_dotenv, patch.object(values.IntegerValue, "convert") as convert:
+        Test = create_environment()
+
+    # The `.env` file is not loaded, and values are not converted again.
+    assert load_dotenv.call_count == 0
+    assert convert.call_count == 0
+    assert Test.FOO == 1
+    assert Test.BAR == ["https://example.com"]
+    assert Test.BAZ == 2
+    assert Test.dotenv == {"FOO": "1", "BAR": "https://example.com"}
+    assert globals()["BAZ"] == 2
+
+
+def test_handoff__file_path(tmp_path):
+    path = tmp_path / "settings.handoff"
+    with set_dotenv("Test", FOO="1", BAR=""):
+        Test = create_environment()
+
+    assert Test.export_handoff(path=path, set_environ=False) == f"file:{path}"
+    assert HANDOFF_ENV_NAME not in os.environ
+    assert loads(path.read_bytes(), Test).settings == {"FOO": 1, "BAR": [], "BAZ": 2, "PLAIN": "plain"}
+
+
+def test_handoff__different_environment(caplog):
+    with set_dotenv("Test", FOO="1", BAR=""):
+        Test = create_environment()
+
+    Test.export_handoff()
+
+    with set_dotenv("Test", FOO="2") as load_dotenv:
+
+        class Test(Environment):
+            FOO = values.IntegerValue()
+
+    assert load_dotenv.call_count == 1
+    assert Test.FOO == 2
+    assert "is not valid for environment 'Test'" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda data: data[:10],
+        lambda data: b"X" + data[1:],
+        lambda data: data[:-1],
+        lambda data: data[:-1] + bytes([data[-1] ^ 1]),
+    ],
+)
+def test_handoff__invalid(tmp_path, corrupt):
+    with set_dotenv("Test", FOO="1", BAR=""):
+        Test = create_environment()
+
+    assert loads(corrupt(dumps(Test)), Test) is None
+
+
+@pytest.mark.parametrize("location", ["file:/does/not/exist", "fd:not-a-number", "foo:bar"])
+def test_handoff__cannot_read(location, caplog):
+    with set_dotenv("Test", FOO="1", BAR=""):
+        Test = create_environment()
+
+    os.environ[HANDOFF_ENV_NAME] = location
+    assert read_handoff(Test) is None
+    assert f"Could not read settings handoff from {location!r}" in caplog.text
+
+
+def test_handoff__unknown_kind():
+    with set_dotenv("Test", FOO="1", BAR=""):
+        Test = create_environment()
+
+    with pytest.raises(ValueError, match="Unknown handoff kind 'foo'. Available kinds: file, fd, shm"):
+        Test.export_handoff(kind="foo")
+
+
+def test_handoff__header_size():
+    assert HANDOFF_HEADER.size == 82
+
+
+def test_handoff__child_process(tmp_path):
+    module = tmp_path / "env_config_handoff_settings.py"
+    module.write_text(
+        textwrap.dedent(
+            """
+            from env_config import Environment, values
+
+            class Test(Environment, dotenv_path=__file__.replace(".py", ".env")):
+                FOO = values.IntegerValue()
+
+                @classmethod
+                def load_dotenv(cls, **kwargs):
+                    print("loaded")
+                    return Environment.load_dotenv(**kwargs)
+            """,
+        ),
+        encoding="utf-8",
+    )
+    (tmp_path / "env_config_handoff_settings.env").write_text("FOO=1\n", encoding="utf-8")
+
+    environ = {**os.environ, "DJANGO_SETTINGS_ENVIRONMENT": "Test", "PYTHONPATH": os.pathsep.join(sys.path)}
+    script = "import env_config_handoff_settings as s; print(s.FOO)"
+
+    sys.path.insert(0, str(tmp_path))
+    try:
+        with patch.dict(os.environ, {"DJANGO_SETTINGS_ENVIRONMENT": "Test"}):
+            import env_config_handoff_settings
+
+            fd = int(env_config_handoff_settings.Test.export_handoff(kind="fd", set_environ=False).split(":")[1])
+    finally:
+        sys.path.remove(str(tmp_path))
+        del sys.modules["env_config_handoff_settings"]
+
+    environ["PYTHONPATH"] = os.pathsep.join([str(tmp_path), *sys.path])
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script],
+        env={**environ, HANDOFF_ENV_NAME: f"fd:{fd}"},
+        pass_fds=[fd],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    os.close(fd)
+    assert result.stdout == "1\n"
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script],
+        env=environ,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout == "loaded\n1\n"
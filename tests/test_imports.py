@@ -0,0 +1,132 @@
+import pickle
+import sys
+
+import pytest
+
+from env_config.imports import ImportString, find_module_spec, validate_import_string
+
+PACKAGE = "env_config_imports_test"
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    """Create a package, which fails if any of its modules are executed."""
+    root = tmp_path / PACKAGE
+    (root / "sub").mkdir(parents=True)
+    (root / "__init__.py").write_text("raise RuntimeError('executed')\n", encoding="utf-8")
+    (root / "sub" / "__init__.py").write_text("raise RuntimeError('executed')\n", encoding="utf-8")
+    (root / "sub" / "module.py").write_text(
+        "raise RuntimeError('executed')\n"
+        "import os.path\n"
+        "from json import loads as load_json\n"
+        "CONSTANT = 1\n"
+        "FIRST, (SECOND, *REST) = 1, (2, 3)\n"
+        "TYPED: int = 1\n"
+        "def function(): pass\n"
+        "class Class: pass\n"
+        "try:\n"
+        "    from fast import Backend\n"
+        "except ImportError:\n"
+        "    class Backend: pass\n"
+        "if True:\n"
+        "    CONDITIONAL = 1\n"
+        "else:\n"
+        "    OTHER = 1\n",
+        encoding="utf-8",
+    )
+    (root / "sub" / "dynamic.py").write_text("def __getattr__(name): ...\n", encoding="utf-8")
+    (root / "sub" / "star.py").write_text("from os.path import *\n", encoding="utf-8")
+    (root / "sub" / "broken.py").write_text("def (\n", encoding="utf-8")
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield root
+    for name in list(sys.modules):
+        if name.startswith(PACKAGE):
+            del sys.modules[name]
+
+
+def test_find_module_spec(package):
+    spec = find_module_spec(f"{PACKAGE}.sub.module")
+    assert spec is not None
+    assert spec.origin == str(package / "sub" / "module.py")
+    assert PACKAGE not in sys.modules
+
+
+def test_find_module_spec__imported_parent():
+    spec = find_module_spec("env_config.values")
+    assert spec is not None
+    assert spec.name == "env_config.values"
+
+
+@pytest.mark.parametrize("name", [f"{PACKAGE}.missing", f"{PACKAGE}.sub.module.nested", "missing_package.module"])
+def test_find_module_spec__missing(package, name):
+    assert find_module_spec(name) is None
+
+
+@pytest.mark.parametrize(
+    "attribute",
+    [
+        "CONSTANT",
+        "FIRST",
+        "SECOND",
+        "REST",
+        "TYPED",
+        "function",
+        "Class",
+        "os",
+        "load_json",
+        "Backend",
+        "CONDITIONAL",
+        "OTHER",
+    ],
+)
+def test_validate_import_string(package, attribute):
+    validate_import_string(f"{PACKAGE}.sub.module.{attribute}")
+    assert PACKAGE not in sys.modules
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        f"{PACKAGE}.sub.module",
+        f"{PACKAGE}.sub.dynamic.anything",
+        f"{PACKAGE}.sub.star.anything",
+    ],
+)
+def test_validate_import_string__dynamic(package, path):
+    validate_import_string(path)
+    assert PACKAGE not in sys.modules
+
+
+@pytest.mark.parametrize(
+    ("path", "msg"),
+    [
+        ("foo", "foo doesn't look like a module path"),
+        (f"{PACKAGE}.missing.Class", f"No module named '{PACKAGE}.missing'"),
+        (f"{PACKAGE}.sub.module.Missing", f'Module "{PACKAGE}.sub.module" does not define a "Missing" attribute/class'),
+        (f"{PACKAGE}.sub.broken.Class", f'Module "{PACKAGE}.sub.broken" does not define a "Class" attribute/class'),
+        ("env_config.values.Missing", 'Module "env_config.values" does not define a "Missing" attribute/class'),
+    ],
+)
+def test_validate_import_string__invalid(package, path, msg):
+    with pytest.raises(ImportError, match=msg):
+        validate_import_string(path)
+
+
+def test_validate_import_string__no_attribute_check(package):
+    validate_import_string(f"{PACKAGE}.sub.module.Missing", check_attribute=False)
+
+
+def test_import_string():
+    path = ImportString("env_config.base.Environment")
+
+    from env_config.base import Environment
+
+    assert path == "env_config.base.Environment"
+    assert path.load() is Environment
+    assert path.load() is Environment
+
+    copy = pickle.loads(pickle.dumps(path))
+    assert type(copy) is ImportString
+    assert copy == path
+    assert "_object" not in copy.__dict__
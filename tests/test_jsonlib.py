@@ -0,0 +1,155 @@
+import json
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from env_config.errors import JsonSchemaError, MissingExtraDependencyError
+from env_config.jsonlib import compile_schema, get_json_backend, read_json_file
+
+orjson = pytest.importorskip("orjson")
+
+
+@pytest.fixture(autouse=True)
+def clear_backends():
+    get_json_backend.cache_clear()
+    yield
+    get_json_backend.cache_clear()
+
+
+def test_get_json_backend__auto():
+    assert get_json_backend().name == "orjson"
+    assert get_json_backend().accepts_buffer is True
+
+
+def test_get_json_backend__auto__fallback():
+    with patch.dict(sys.modules, {"orjson": None, "ujson": None}):
+        backend = get_json_backend()
+
+    assert backend.name == "json"
+    assert backend.loads is json.loads
+
+
+def test_get_json_backend__not_installed():
+    with (
+        patch.dict(sys.modules, {"ujson": None}),
+        pytest.raises(MissingExtraDependencyError, match="The `ujson` library is not installed"),
+    ):
+        get_json_backend("ujson")
+
+
+def test_get_json_backend__unknown():
+    with pytest.raises(ValueError, match="Unknown JSON backend 'foo'. Available backends: auto, orjson, ujson, json"):
+        get_json_backend("foo")
+
+
+@pytest.mark.parametrize("name", ["orjson", "json"])
+@pytest.mark.parametrize(
+    "document",
+    [
+        '{"foo": [1, 2.5, "bar", null, true]}',
+        "[NaN, Infinity, -Infinity]",
+        '{"foo": 1, "foo": 2}',
+    ],
+)
+def test_json_backend__same_as_json(name, document):
+    result = get_json_backend(name).parse(document)
+    assert json.dumps(result) == json.dumps(json.loads(document))
+    assert json.dumps(get_json_backend(name).parse(memoryview(document.encode()))) == json.dumps(result)
+
+
+@pytest.mark.parametrize("name", ["orjson", "json"])
+@pytest.mark.parametrize("document", ['{"foo":}', "", "[1,]", "[1] x"])
+def test_json_backend__same_errors_as_json(name, document):
+    with pytest.raises(json.JSONDecodeError) as expected:
+        json.loads(document)
+
+    with pytest.raises(type(expected.value), match=str(expected.value).replace("(", r"\(").replace(")", r"\)")):
+        get_json_backend(name).parse(document)
+
+
+@pytest.mark.parametrize("name", ["orjson", "json"])
+def test_read_json_file(tmp_path, name):
+    path = tmp_path / "data.json"
+    path.write_text('{"routes": [{"path": "/", "port": 8000}]}', encoding="utf-8")
+    assert read_json_file(path, get_json_backend(name)) == {"routes": [{"path": "/", "port": 8000}]}
+
+
+def test_read_json_file__empty(tmp_path):
+    path = tmp_path / "data.json"
+    path.touch()
+    with pytest.raises(json.JSONDecodeError):
+        read_json_file(path, get_json_backend())
+
+
+SCHEMA = {
+    "type": "object",
+    "required": ["routes"],
+    "additionalProperties": False,
+    "properties": {
+        "routes": {
+            "type": "array",
+            "minItems": 1,
+            "items": {
+                "type": "object",
+                "required": ["port"],
+                "additionalProperties": {"type": "string"},
+                "properties": {
+                    "port": {"type": "integer", "minimum": 1, "maximum": 65535},
+                    "weight": {"type": ["number", "null"]},
+                    "method": {"enum": ["GET", "POST"]},
+                },
+            },
+        },
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"routes": [{"port": 80}]},
+        {"routes": [{"port": 80, "weight": 0.5, "method": "GET", "path": "/"}]},
+        {"routes": [{"port": 80, "weight": None}, {"port": 443, "weight": 1}]},
+    ],
+)
+def test_compile_schema__valid(value):
+    compile_schema(SCHEMA)(value, "$")
+
+
+@pytest.mark.parametrize(
+    ("value", "message"),
+    [
+        ([], "Invalid JSON at '$': expected object, got array"),
+        ({}, "Invalid JSON at '$': missing required property 'routes'"),
+        ({"routes": [{"port": 1}], "other": 1}, "Invalid JSON at '$': unexpected property 'other'"),
+        ({"routes": []}, "Invalid JSON at '$.routes': expected length to be at least 1, got 0"),
+        ({"routes": [{"port": "80"}]}, "Invalid JSON at '$.routes[0].port': expected integer, got string"),
+        ({"routes": [{"port": True}]}, "Invalid JSON at '$.routes[0].port': expected integer, got boolean"),
+        ({"routes": [{"port": 1.5}]}, "Invalid JSON at '$.routes[0].port': expected integer, got number"),
+        ({"routes": [{"port": 0}]}, "Invalid JSON at '$.routes[0].port': expected value to be at least 1, got 0"),
+        ({"routes": [{"port": 1}, {}]}, "Invalid JSON at '$.routes[1]': missing required property 'port'"),
+        ({"routes": [{"port": 1, "weight": "1"}]}, "expected number or null, got string"),
+        ({"routes": [{"port": 1, "method": "PUT"}]}, "expected one of ['GET', 'POST'], got 'PUT'"),
+        ({"routes": [{"port": 1, "path": 1}]}, "Invalid JSON at '$.routes[0].path': expected string, got integer"),
+    ],
+)
+def test_compile_schema__invalid(value, message):
+    with pytest.raises(JsonSchemaError) as error:
+        compile_schema(SCHEMA)(value, "$")
+
+    assert message in str(error.value)
+    assert isinstance(error.value, ValueError)
+
+
+@pytest.mark.parametrize(
+    ("schema", "message"),
+    [
+        ({"type": "object", "pattern": "x"}, "Unsupported schema keywords: pattern"),
+        ({"type": "map"}, "Unsupported schema types: map"),
+        ({"items": {"format": "date"}}, "Unsupported schema keywords: format"),
+    ],
+)
+def test_compile_schema__unsupported(schema, message):
+    with pytest.raises(ValueError, match=message):
+        compile_schema(schema)
@@ -0,0 +1,396 @@
+import base64
+import json
+import logging
+import os
+import re
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+import pytest
+
+from env_config import Environment, values
+from env_config.aio import fetch_values
+from env_config.constants import Undefined
+from env_config.errors import SourceError
+from env_config.kvstore import ConnectionPool, HttpKeyValueSource, TTLCache
+from tests.helpers import set_dotenv
+
+
+def b64(value):
+    return base64.b64encode(value.encode()).decode()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # The headers and the body are written separately, which would delay responses on keep-alive connections.
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def respond(self, status, data):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # Close the connection without telling the client, like a server closing an idle connection.
+        self.close_connection = self.server.close_connections
+
+    def do_GET(self):
+        server = self.server
+        server.record(self)
+        if server.status != 200:
+            return self.respond(server.status, {"error": "unavailable"})
+
+        if server.html:
+            body = b"<html><body>Sign in</body></html>"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return None
+
+        url = urlsplit(self.path)
+        prefix = unquote(url.path.removeprefix("/v1/kv/"))
+        recurse = "recurse=true" in url.query
+        items = [
+            {"Key": key, "Value": None if value is None else b64(value)}
+            for key, value in server.data.items()
+            if (key.startswith(prefix) if recurse else key == prefix)
+        ]
+        if not items:
+            return self.respond(404, [])
+        return self.respond(200, items)
+
+    def do_POST(self):
+        server = self.server
+        server.record(self)
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if server.status != 200:
+            return self.respond(server.status, {"error": "unavailable"})
+
+        responses = []
+        for operation in request["success"]:
+            key = base64.b64decode(operation["request_range"]["key"]).decode()
+            value = server.data.get(key)
+            kvs = [] if value is None else [{"key": b64(key), "value": b64(value)}]
+            responses.append({"response_range": {"kvs": kvs}})
+        return self.respond(200, {"succeeded": True, "responses": responses})
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Local stand-in for a Consul or etcd key-value service."""
+
+    daemon_threads = True
+
+    def __init__(self, data):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.data = data
+        self.status = 200
+        self.html = False
+        self.close_connections = False
+        self.requests = []
+        self.clients = set()
+        self.lock = threading.Lock()
+
+    def record(self, handler):
+        with self.lock:
+            self.requests.append((handler.command, handler.path, dict(handler.headers)))
+            self.clients.add(handler.client_address)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+
+
+@pytest.fixture
+def server():
+    with StandInServer({"myapp/FOO": "foo", "myapp/BAR": "1", "myapp/EMPTY": None, "other/BAZ": "baz"}) as server:
+        yield server
+
+
+def test_ttl_cache():
+    cache = TTLCache(ttl=10, max_size=2)
+    cache.set("FOO", "foo", now=0)
+    cache.set("BAR", None, now=0)
+
+    assert cache.get("FOO", now=5) == "foo"
+    assert cache.get("BAR", now=5) is None
+    assert cache.get("BAZ", now=5) is Undefined
+    # Entries expire after the TTL.
+    assert cache.get("FOO", now=10) is Undefined
+    assert len(cache) == 1
+
+    cache.set("FOO", "foo", now=0, ttl=100)
+    assert cache.get("FOO", now=50) == "foo"
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_ttl_cache__eviction():
+    cache = TTLCache(ttl=10, max_size=2)
+    cache.set("FOO", "foo", now=0)
+    cache.set("BAR", "bar", now=0)
+    # Using an entry makes it the most recently used.
+    cache.get("FOO", now=0)
+    cache.set("BAZ", "baz", now=0)
+
+    assert cache.get("BAR", now=0) is Undefined
+    assert cache.get("FOO", now=0) == "foo"
+    assert cache.get("BAZ", now=0) == "baz"
+
+
+def test_connection_pool__reuses_connections(server):
+    pool = ConnectionPool(server.url)
+    for _ in range(3):
+        status, _ = pool.request("GET", "/v1/kv/myapp/?recurse=true")
+        assert status == 200
+
+    assert len(server.requests) == 3
+    assert len(server.clients) == 1
+    assert len(pool.idle) == 1
+    pool.close()
+    assert pool.idle == []
+
+
+def test_connection_pool__closed_connection(server):
+    server.close_connections = True
+    pool = ConnectionPool(server.url)
+    pool.request("GET", "/v1/kv/myapp/?recurse=true")
+    assert len(pool.idle) == 1
+
+    # The request is sent again on a new connection.
+    status, _ = pool.request("GET", "/v1/kv/myapp/?recurse=true")
+    assert status == 200
+    assert len(server.requests) == 2
+    assert len(server.clients) == 2
+    pool.close()
+
+
+def test_connection_pool__max_connections(server):
+    pool = ConnectionPool(server.url, max_connections=2)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        statuses = list(executor.map(lambda _: pool.request("GET", "/v1/kv/myapp/FOO")[0], range(40)))
+
+    assert statuses == [200] * 40
+    # Requests wait for a connection instead of opening more, and the connections are kept open.
+    assert len(server.clients) <= 2
+    assert len(pool.idle) == len(server.clients)
+    pool.close()
+
+
+def test_connection_pool__invalid_max_connections():
+    msg = "Invalid maximum number of connections 0. Expected at least 1."
+    with pytest.raises(ValueError, match=re.escape(msg)):
+        ConnectionPool("http://127.0.0.1:8500", max_connections=0)
+
+
+def test_connection_pool__invalid_url():
+    msg = "Invalid URL 'ftp://example.com'. Expected an 'http' or 'https' URL with a host."
+    with pytest.raises(ValueError, match=re.escape(msg)):
+        ConnectionPool("ftp://example.com")
+
+
+@pytest.mark.parametrize("api", ["consul", "etcd"])
+def test_http_source(server, api):
+    source = HttpKeyValueSource(server.url, api=api, prefix="myapp/", headers={"X-Consul-Token": "token"})
+    assert fetch_values([source], ["FOO", "BAR", "EMPTY", "MISSING", "BAZ"]) == {"FOO": "foo", "BAR": "1"}
+
+    # All keys are fetched with a single request.
+    assert len(server.requests) == 1
+    assert server.requests[0][2]["X-Consul-Token"] == "token"
+    source.close()
+
+
+def test_http_source__etcd_batches(server):
+    source = HttpKeyValueSource(server.url, api="etcd", prefix="myapp/")
+    keys = ["FOO"] + [f"KEY_{i}" for i in range(300)]
+    assert fetch_values([source], keys) == {"FOO": "foo"}
+
+    # Transactions have at most 128 operations.
+    assert len(server.requests) == 3
+    source.close()
+
+
+def test_http_source__no_keys_under_prefix(server):
+    source = HttpKeyValueSource(server.url, prefix="unknown/")
+    assert fetch_values([source], ["FOO"]) == {}
+    source.close()
+
+
+def test_http_source__consul_without_prefix(server):
+    source = HttpKeyValueSource(server.url)
+    keys = ["myapp/FOO", "myapp/EMPTY", "myapp/MISSING", "other/BAZ"]
+    assert fetch_values([source], keys) == {"myapp/FOO": "foo", "other/BAZ": "baz"}
+
+    # Each key is fetched separately instead of fetching the entire store.
+    assert len(server.requests) == 4
+    assert all("recurse" not in path for _, path, _ in server.requests)
+    source.close()
+
+
+def test_http_source__consul_without_prefix__connections(server):
+    source = HttpKeyValueSource(server.url, max_connections=2)
+    keys = ["myapp/FOO"] + [f"KEY_{i}" for i in range(100)]
+    assert fetch_values([source], keys) == {"myapp/FOO": "foo"}
+
+    # The requests are sent on at most `max_connections` connections, which are reused.
+    assert len(server.requests) == 101
+    assert len(server.clients) <= 2
+    assert len(source.pool.idle) == len(server.clients)
+    source.close()
+
+
+def test_http_source__ttl_cache(server):
+    source = HttpKeyValueSource(server.url, prefix="myapp/", ttl=60)
+    assert fetch_values([source], ["FOO", "MISSING"]) == {"FOO": "foo"}
+    server.data["myapp/FOO"] = "changed"
+    server.data["myapp/MISSING"] = "added"
+
+    # Cached values, and keys that were not defined, are not fetched again before they expire.
+    assert fetch_values([source], ["FOO", "MISSING"]) == {"FOO": "foo"}
+    assert len(server.requests) == 1
+
+    # Only keys that are not cached are fetched.
+    assert fetch_values([source], ["FOO", "BAR"]) == {"FOO": "foo", "BAR": "1"}
+    assert len(server.requests) == 2
+
+    source.cache.clear()
+    assert fetch_values([source], ["FOO", "MISSING"]) == {"FOO": "changed", "MISSING": "added"}
+    # The connection is reused between event loops.
+    assert len(server.clients) == 1
+    source.close()
+
+
+def test_http_source__error(server):
+    server.status = 500
+    source = HttpKeyValueSource(server.url, prefix="myapp/")
+    with pytest.raises(SourceError, match="failed with status 500"):
+        fetch_values([source], ["FOO"])
+    source.close()
+
+
+@pytest.mark.parametrize("prefix", ["myapp/", ""])
+def test_http_source__invalid_response(server, prefix):
+    server.html = True
+    source = HttpKeyValueSource(server.url, prefix=prefix)
+    with pytest.raises(SourceError, match="returned an invalid response: <html>"):
+        fetch_values([source], ["FOO"])
+    source.close()
+
+
+def test_http_source__cache_file(server, tmp_path):
+    path = tmp_path / "cache" / "kv.json"
+    source = HttpKeyValueSource(server.url, prefix="myapp/", cache_path=path)
+    assert fetch_values([source], ["FOO", "MISSING"]) == {"FOO": "foo"}
+    source.close()
+
+    assert json.loads(path.read_text()) == {"FOO": "foo", "MISSING": None}
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    # A new source, e.g., on the next startup, uses the cache file without making requests.
+    server.data["myapp/FOO"] = "changed"
+    source = HttpKeyValueSource(server.url, prefix="myapp/", cache_path=path)
+    assert fetch_values([source], ["FOO", "MISSING"]) == {"FOO": "foo"}
+    assert len(server.requests) == 1
+
+    # Keys that are not in the cache file are fetched.
+    assert fetch_values([source], ["FOO", "BAR"]) == {"FOO": "foo", "BAR": "1"}
+    assert len(server.requests) == 2
+    assert json.loads(path.read_text()) == {"FOO": "foo", "MISSING": None, "BAR": "1"}
+    source.close()
+
+
+def test_http_source__cache_file_expired(server, tmp_path):
+    path = tmp_path / "kv.json"
+    path.write_text(json.dumps({"FOO": "cached"}))
+    old = time.time() - 120
+    os.utime(path, (old, old))
+
+    source = HttpKeyValueSource(server.url, prefix="myapp/", cache_path=path, ttl=60)
+    assert fetch_values([source], ["FOO"]) == {"FOO": "foo"}
+    assert len(server.requests) == 1
+    source.close()
+
+
+def test_http_source__last_known_good(server, tmp_path, caplog):
+    path = tmp_path / "kv.json"
+    path.write_text(json.dumps({"FOO": "cached", "MISSING": None}))
+    old = time.time() - 120
+    os.utime(path, (old, old))
+    server.status = 503
+
+    source = HttpKeyValueSource(server.url, prefix="myapp/", cache_path=path, ttl=60)
+    with caplog.at_level(logging.WARNING, logger="env_config.kvstore"):
+        assert fetch_values([source], ["FOO", "MISSING"]) == {"FOO": "cached"}
+    assert "using the last known good values" in caplog.text
+
+    # Responses that are not valid JSON, e.g., from a proxy, also use the last known good values.
+    server.status = 200
+    server.html = True
+    assert fetch_values([source], ["FOO"]) == {"FOO": "cached"}
+
+    # Keys without a last known good value cannot be loaded.
+    with pytest.raises(SourceError):
+        fetch_values([source], ["FOO", "BAR"])
+    source.close()
+
+
+def test_http_source__unreachable(tmp_path):
+    path = tmp_path / "kv.json"
+    path.write_text(json.dumps({"FOO": "cached"}))
+    os.utime(path, (0, 0))
+
+    # Nothing listens on the port of a closed server.
+    with StandInServer({}) as server:
+        url = server.url
+
+    source = HttpKeyValueSource(url, cache_path=path, timeout=1)
+    assert fetch_values([source], ["FOO"]) == {"FOO": "cached"}
+
+    source = HttpKeyValueSource(url, timeout=1)
+    with pytest.raises(OSError):
+        fetch_values([source], ["FOO"])
+
+
+def test_http_source__unknown_api():
+    msg = "Unknown key-value API 'redis'. Available APIs: consul, etcd"
+    with pytest.raises(ValueError, match=re.escape(msg)):
+        HttpKeyValueSource("http://127.0.0.1:8500", api="redis")
+
+
+def test_http_source__repr():
+    source = HttpKeyValueSource("http://127.0.0.1:8500", prefix="myapp/")
+    assert repr(source) == "HttpKeyValueSource(127.0.0.1:8500, api='consul', prefix='myapp/')"
+
+
+@set_dotenv("Test")
+def test_environment__http_source(server):
+    source = HttpKeyValueSource(server.url, prefix="myapp/")
+
+    class Test(Environment, dotenv_path=None, sources=[source]):
+        FOO = values.StringValue()
+        BAR = values.IntegerValue()
+        BAZ = values.StringValue(default="baz")
+
+    assert Test.FOO == "foo"
+    assert Test.BAR == 1
+    assert Test.BAZ == "baz"
+    assert len(server.requests) == 1
+    source.close()
@@ -0,0 +1,100 @@
+import ipaddress
+import pickle
+import random
+
+import pytest
+
+from env_config.networks import IPNetworkSet
+
+
+def test_ip_network_set__contains():
+    networks = IPNetworkSet(["10.0.0.0/8", "192.168.1.1", "2001:db8::/32", "::1"])
+
+    assert "10.0.0.0" in networks
+    assert "10.255.255.255" in networks
+    assert "11.0.0.0" not in networks
+    assert "9.255.255.255" not in networks
+    assert "192.168.1.1" in networks
+    assert "192.168.1.2" not in networks
+    assert "2001:db8::1" in networks
+    assert "2001:db9::" not in networks
+    assert "::1" in networks
+    assert "::2" not in networks
+    assert ipaddress.ip_address("10.1.2.3") in networks
+
+
+def test_ip_network_set__ipv4_mapped():
+    networks = IPNetworkSet(["10.0.0.0/8"])
+    assert "::ffff:10.0.0.1" in networks
+    assert "::ffff:11.0.0.1" not in networks
+    assert ipaddress.ip_address("::ffff:10.0.0.1") in networks
+
+
+def test_ip_network_set__scoped_ipv6():
+    networks = IPNetworkSet(["fe80::/10"])
+    assert "fe80::1%eth0" in networks
+    assert "fe80::1%" not in networks
+
+
+@pytest.mark.parametrize("address", ["", "foo", "10.0.0.256", "10.0.0.0/8", None, 1])
+def test_ip_network_set__not_an_address(address):
+    assert address not in IPNetworkSet(["0.0.0.0/0", "::/0"])
+
+
+def test_ip_network_set__collapsed():
+    networks = IPNetworkSet(["10.0.0.0/9", "10.128.0.0/9", "10.1.0.0/16", "10.0.0.1", "192.168.0.0/24"])
+    assert len(networks) == 2
+    assert networks.networks == [ipaddress.ip_network("10.0.0.0/8"), ipaddress.ip_network("192.168.0.0/24")]
+    assert list(networks) == networks.networks
+
+
+def test_ip_network_set__empty():
+    networks = IPNetworkSet()
+    assert not networks
+    assert len(networks) == 0
+    assert "10.0.0.1" not in networks
+
+
+def test_ip_network_set__strict():
+    with pytest.raises(ValueError, match="has host bits set"):
+        IPNetworkSet(["10.0.0.1/8"])
+
+    assert IPNetworkSet(["10.0.0.1/8"], strict=False) == IPNetworkSet(["10.0.0.0/8"])
+
+
+def test_ip_network_set__invalid():
+    with pytest.raises(ValueError, match="does not appear to be an IPv4 or IPv6 network"):
+        IPNetworkSet(["foo"])
+
+
+def test_ip_network_set__pickle():
+    networks = IPNetworkSet(["10.0.0.0/8", "2001:db8::/32"])
+    assert pickle.loads(pickle.dumps(networks)) == networks
+    assert hash(pickle.loads(pickle.dumps(networks))) == hash(networks)
+
+
+def test_ip_network_set__repr():
+    assert repr(IPNetworkSet(["10.0.0.0/8", "::1"])) == "IPNetworkSet(['10.0.0.0/8', '::1/128'])"
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_ip_network_set__same_as_linear_scan(seed):
+    rng = random.Random(seed)
+    networks = [
+        ipaddress.ip_network((rng.getrandbits(32) >> 8 << 8, rng.randint(8, 32)), strict=False) for _ in range(200)
+    ]
+    networks += [
+        ipaddress.ip_network((rng.getrandbits(128), rng.randint(16, 128)), strict=False) for _ in range(200)
+    ]
+    network_set = IPNetworkSet(networks)
+
+    addresses = [ipaddress.IPv4Address(rng.getrandbits(32)) for _ in range(1000)]
+    addresses += [ipaddress.IPv6Address(rng.getrandbits(128)) for _ in range(1000)]
+    # Include addresses at the edges of the networks.
+    for network in networks:
+        addresses += [network.network_address, network.broadcast_address]
+        addresses += [network.network_address - 1] if int(network.network_address) > 0 else []
+
+    for address in addresses:
+        expected = any(address in network for network in networks)
+        assert network_set.contains(address) is expected, address
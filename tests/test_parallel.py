@@ -0,0 +1,59 @@
+import re
+import threading
+
+import pytest
+
+from env_config import Environment, values
+from env_config.errors import MissingEnvValueError
+from tests.helpers import set_dotenv
+
+
+# All three values must be converting at the same time to pass the barrier.
+# If they are converted one after another, waiting times out and breaks the barrier.
+barrier = threading.Barrier(3, timeout=5)
+
+
+class ConcurrentValue(values.StringValue):
+    def convert(self, value):
+        barrier.wait()
+        return threading.current_thread().name
+
+
+@set_dotenv("Test", FOO="1", BAR="2", BAZ="3")
+def test_parallel():
+    barrier.reset()
+
+    class Test(Environment, max_workers=3):
+        FOO = ConcurrentValue()
+        BAR = ConcurrentValue()
+        BAZ = ConcurrentValue()
+
+    assert not barrier.broken
+    assert all(name.startswith("env-config") for name in (Test.FOO, Test.BAR, Test.BAZ))
+
+
+@set_dotenv("Test", FOO="1", BAR="2")
+def test_parallel__plain_values_and_overrides():
+    class Overrides:
+        FOO = "foo"
+
+    class Test(Environment, max_workers=2, overrides_from=Overrides):
+        FOO = values.IntegerValue()
+        BAR = values.IntegerValue()
+        BAZ = "baz"
+
+    assert Test.FOO == "foo"
+    assert Test.BAR == 2
+    assert Test.BAZ == "baz"
+
+
+@set_dotenv("Test", BAR="1", FOO="y")
+def test_parallel__first_error_raised():
+    msg = "Value 'BAZ' in environment 'Test' not defined in the .env file and value does not have a default"
+    with pytest.raises(MissingEnvValueError, match=re.escape(msg)):
+
+        class Test(Environment, max_workers=4):
+            BAR = values.IntegerValue()
+            BAZ = values.IntegerValue()
+            FOO = values.IntegerValue()
+            FIZZ = values.IntegerValue()
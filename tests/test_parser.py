@@ -0,0 +1,164 @@
+import io
+import os
+import random
+
+import pytest
+from dotenv import dotenv_values
+
+from env_config.parser import parse_dotenv, read_dotenv
+
+CASES = [
+    "",
+    "\n\n",
+    "FOO=bar",
+    "FOO=bar\nBAR=baz\n",
+    "FOO=bar\r\nBAR=baz\r\n",
+    "FOO=bar\rBAR=baz",
+    "FOO=",
+    "FOO=\nBAR=1",
+    "FOO",
+    "FOO\nBAR=1",
+    "FOO =bar",
+    "FOO= bar",
+    "FOO = bar   ",
+    "  FOO=bar",
+    "\tFOO=bar\t",
+    "export FOO=bar",
+    "export  FOO=bar",
+    "export=1",
+    "exportFOO=1",
+    "FOO.BAR=1",
+    "FOO-BAR=1",
+    "1FOO=1",
+    "'FOO'=bar",
+    "'FOO BAR'=bar",
+    "'FOO=bar",
+    "FOO='bar'",
+    "FOO='bar baz'",
+    "FOO=' bar '",
+    "FOO='bar",
+    "FOO='b\\'ar'",
+    "FOO='b\\\\ar'",
+    "FOO='b\\nar'",
+    'FOO="bar"',
+    'FOO="b\\"ar"',
+    'FOO="b\\nar\\tbaz\\\\"',
+    'FOO="b\\xar"',
+    'FOO="multi\nline"\nBAR=1',
+    "FOO='multi\nline'\nBAR=1",
+    'FOO="bar',
+    'FOO="bar\nBAR=1',
+    'FOO="a\nb" junk\nBAR=1',
+    'FOO="bar" # comment',
+    'FOO="bar"# comment',
+    'FOO="bar" junk',
+    "FOO=bar # comment",
+    "FOO=bar# comment",
+    "FOO=bar #",
+    "FOO=#bar",
+    "FOO= #bar",
+    "FOO=bar baz # qux # quux",
+    "FOO=a\tb",
+    "# comment",
+    "  # comment\nFOO=1",
+    "#FOO=1",
+    "FOO BAR=1",
+    "FOO=1\nFOO=2",
+    "=bar",
+    "FOO==bar",
+    "FOO=bar=baz",
+    "FOO=${BAR}",
+    "BAR=1\nFOO=${BAR}",
+    "BAR=1\nFOO=x${BAR}y${BAR}",
+    "FOO=${BAR:-default}",
+    "FOO=${BAR:-}",
+    "BAR=\nFOO=${BAR:-default}",
+    "BAR\nFOO=${BAR:-default}",
+    "FOO=${FOO}x",
+    "FOO=1\nFOO=${FOO}x",
+    "FOO='${BAR:-single}'",
+    'FOO="${BAR:-double}"',
+    "FOO=$BAR",
+    "FOO=${BAR",
+    "FOO=${}",
+    "FOO=${ENV_CONFIG_PARSER_TEST}",
+    "ENV_CONFIG_PARSER_TEST=local\nFOO=${ENV_CONFIG_PARSER_TEST}",
+    "\ufeffFOO=bar",
+    "FOO=bär\nBÄR=foo",
+    "FOO=bar\n\n\n   \nBAR=baz",
+]
+
+
+@pytest.fixture(autouse=True)
+def environ():
+    os.environ["ENV_CONFIG_PARSER_TEST"] = "environ"
+    yield
+    os.environ.pop("ENV_CONFIG_PARSER_TEST", None)
+
+
+@pytest.mark.parametrize("text", CASES)
+def test_parse_dotenv__same_as_python_dotenv(text):
+    assert parse_dotenv(text) == dotenv_values(stream=io.StringIO(text))
+
+
+@pytest.mark.parametrize("text", CASES)
+def test_parse_dotenv__same_as_python_dotenv__no_interpolation(text):
+    assert parse_dotenv(text, interpolate=False) == dotenv_values(stream=io.StringIO(text), interpolate=False)
+
+
+@pytest.mark.parametrize("text", CASES)
+def test_read_dotenv__same_as_python_dotenv(tmp_path, text):
+    path = tmp_path / ".env"
+    path.write_bytes(text.encode())
+
+    assert read_dotenv(path) == dotenv_values(path)
+
+
+def test_parse_dotenv__same_as_python_dotenv__random():
+    tokens = [
+        "FOO", "BAR", "export ", "=", " ", "\t", "\n", "\r\n", "#", "'", '"', "\\", "\\n",
+        "${FOO}", "${BAR:-x}", "${", "}", "value", "a b", "é",
+    ]  # fmt: skip
+    rng = random.Random(42)
+    for _ in range(2000):
+        text = "".join(rng.choice(tokens) for _ in range(rng.randint(1, 30)))
+        assert parse_dotenv(text) == dotenv_values(stream=io.StringIO(text)), repr(text)
+
+
+def test_read_dotenv__file_missing(tmp_path):
+    assert read_dotenv(tmp_path / ".env") == {}
+
+
+def test_read_dotenv__directory(tmp_path):
+    assert read_dotenv(tmp_path) == {}
+
+
+@pytest.mark.parametrize("text", CASES)
+@pytest.mark.parametrize("keys", [set(), {"FOO"}, {"BAR"}, {"FOO", "BAR"}])
+def test_parse_dotenv__keys(text, keys):
+    expected = {key: value for key, value in parse_dotenv(text).items() if key in keys}
+    assert parse_dotenv(text, keys=keys) == expected
+
+
+def test_parse_dotenv__keys__random():
+    tokens = [
+        "FOO", "BAR", "BAZ", "export ", "=", " ", "\n", "#", "'", '"', "\\", "\\n",
+        "${FOO}", "${BAR:-x}", "${BAZ}", "value",
+    ]  # fmt: skip
+    rng = random.Random(42)
+    for _ in range(2000):
+        text = "".join(rng.choice(tokens) for _ in range(rng.randint(1, 30)))
+        expected = {key: value for key, value in parse_dotenv(text).items() if key == "FOO"}
+        assert parse_dotenv(text, keys={"FOO"}) == expected, repr(text)
+
+
+def test_parse_dotenv__keys__referenced_value_decoded():
+    text = "BAR='b\\'ar'\nBAZ=\"x${BAR}\\n\"\nFOO=${BAZ}|${BAR}"
+    assert parse_dotenv(text, keys={"FOO"}) == {"FOO": "xb'ar\n|b'ar"}
+
+
+def test_read_dotenv__keys(tmp_path):
+    path = tmp_path / ".env"
+    path.write_text("FOO=1\nBAR=2\n", encoding="utf-8")
+
+    assert read_dotenv(path, keys={"FOO"}) == {"FOO": "1"}
@@ -0,0 +1,208 @@
+import json
+import os
+import sys
+from types import ModuleType
+from unittest.mock import patch
+
+import pytest
+
+from env_config import Environment, values
+from env_config.constants import PROFILE_ENV_NAME
+from env_config.profiling import create_profiler
+from env_config.snapshot import compute_fingerprint
+from tests.helpers import set_dotenv
+
+
+@pytest.fixture
+def module():
+    module = ModuleType("env_config_profiling_test")
+    sys.modules[module.__name__] = module
+    yield module
+    del sys.modules[module.__name__]
+
+
+def test_profile():
+    with set_dotenv("Test", FOO="1", BAR="https://example.com,https://example.org"):
+
+        class Test(Environment, profile=True):
+            FOO = values.IntegerValue()
+            BAR = values.ListValue(child=values.URLValue())
+            BAZ = values.ComputedValue(lambda cls: cls.FOO * 2)
+
+    profiler = Test.profiler
+    assert profiler is not None
+    assert set(profiler.hooks) == {"load_dotenv", "pre_setup", "setup", "post_setup"}
+    assert set(profiler.settings) == {"FOO", "BAR", "BAZ"}
+
+    foo = profiler.settings["FOO"]
+    # Loaded once when settings are loaded, and read once when `BAZ` is computed.
+    assert foo.calls == 2
+    assert foo.hits == 1
+    assert foo.total_ns >= foo.load_ns >= foo.convert_ns > 0
+
+    baz = profiler.settings["BAZ"]
+    # Includes the time spent reading `FOO`.
+    assert baz.total_ns >= foo.total_ns / foo.calls
+
+    # Descriptors are restored after the environment has been set up.
+    assert type(Test.fields["FOO"].value) is values.IntegerValue
+    assert Test.FOO == 1
+    assert foo.calls == 2
+
+
+def test_profile__pre_setup():
+    with set_dotenv("Test", FOO="1"):
+
+        class Test(Environment, profile=True):
+            FOO = values.IntegerValue()
+
+            @classmethod
+            def pre_setup(cls):
+                assert cls.FOO == 1
+                cls.BAR = values.IntegerValue(env_name="FOO")
+
+    profiler = Test.profiler
+    assert set(profiler.settings) == {"FOO", "BAR"}
+
+    # `FOO` is loaded in `pre_setup`, so its conversion is recorded under the setting.
+    foo = profiler.settings["FOO"]
+    assert foo.calls == 2
+    assert foo.hits == 1
+    assert foo.load_ns >= foo.convert_ns > 0
+
+    # Settings added in `pre_setup` are profiled as well.
+    assert profiler.settings["BAR"].calls == 1
+
+
+def test_profile__disabled():
+    with set_dotenv("Test", FOO="1"):
+
+        class Test(Environment):
+            FOO = values.IntegerValue()
+
+    assert Test.profiler is None
+
+
+def test_profile__report():
+    with set_dotenv("Test", FOO="1", BAR="bar"):
+
+        class Test(Environment, profile=True):
+            FOO = values.IntegerValue()
+            BAR = values.StringValue()
+
+    report = Test.profiler.report()
+    lines = report.splitlines()
+    assert lines[0] == "Settings profile for environment 'Test'"
+    assert "pre_setup" in report
+    assert any(line.startswith("setting") and "convert (ms)" in line for line in lines)
+
+    report = Test.profiler.report(limit=1)
+    assert ("FOO " in report) != ("BAR " in report)
+
+
+def test_profile__chrome_trace(tmp_path):
+    with set_dotenv("Test", FOO="1"):
+
+        class Test(Environment, profile=True):
+            FOO = values.IntegerValue()
+
+    path = tmp_path / "trace.json"
+    Test.profiler.write_chrome_trace(path)
+    trace = json.loads(path.read_text(encoding="utf-8"))
+
+    events = {(event["name"], event["cat"]) for event in trace["traceEvents"]}
+    assert events == {
+        ("load_dotenv", "hook"),
+        ("pre_setup", "hook"),
+        ("setup", "hook"),
+        ("post_setup", "hook"),
+        ("FOO", "get"),
+        ("FOO", "get_for_environment"),
+        ("FOO", "convert"),
+    }
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in trace["traceEvents"])
+
+
+@pytest.mark.parametrize("output", ["stderr", "1", "true"])
+def test_profile__environ__stderr(output, capsys):
+    with set_dotenv("Test", FOO="1"), patch.dict(os.environ, {PROFILE_ENV_NAME: output}):
+
+        class Test(Environment):
+            FOO = values.IntegerValue()
+
+    assert Test.profiler is not None
+    assert "Settings profile for environment 'Test'" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(("filename", "is_json"), [("profile.json", True), ("profile.txt", False)])
+def test_profile__environ__file(tmp_path, filename, is_json):
+    path = tmp_path / filename
+    with set_dotenv("Test", FOO="1"), patch.dict(os.environ, {PROFILE_ENV_NAME: str(path)}):
+
+        class Test(Environment):
+            FOO = values.IntegerValue()
+
+    content = path.read_text(encoding="utf-8")
+    if is_json:
+        assert "traceEvents" in json.loads(content)
+    else:
+        assert content.startswith("Settings profile for environment 'Test'")
+
+
+@pytest.mark.parametrize("output", ["", "0", "false"])
+def test_profile__environ__disabled(output):
+    with set_dotenv("Test", FOO="1"), patch.dict(os.environ, {PROFILE_ENV_NAME: output}):
+
+        class Test(Environment):
+            FOO = values.IntegerValue()
+
+    assert Test.profiler is None
+    assert create_profiler(Test) is None
+    assert create_profiler(Test, enabled=True) is not None
+
+
+def test_profile__lazy(module):
+    with set_dotenv("Test", FOO="1", BAR="bar"):
+
+        class Test(Environment, profile=True, lazy=True, target_module=module):
+            FOO = values.IntegerValue()
+            BAR = values.StringValue()
+
+    # Settings are profiled when they are accessed.
+    assert Test.profiler.settings == {}
+    assert module.FOO == 1
+    assert set(Test.profiler.settings) == {"FOO"}
+    assert Test.profiler.settings["FOO"].calls == 1
+
+    Test.profiler.restore()
+    assert type(Test.fields["FOO"].value) is values.IntegerValue
+
+
+def test_profile__other_environment_not_recorded():
+    with set_dotenv("Test", FOO="1"):
+
+        class Test(Environment, profile=True, lazy=True):
+            FOO = values.IntegerValue()
+
+        class Other(Test):
+            pass
+
+    with patch.object(Other, "_Other__dotenv", {"FOO": "2"}, create=True):
+        assert Other.FOO == 2
+
+    assert Test.profiler.settings == {}
+    Test.profiler.restore()
+
+
+def test_profile__fingerprint_unchanged():
+    with set_dotenv("Test", FOO="1"):
+
+        class Test(Environment, profile=True, lazy=True):
+            FOO = values.IntegerValue()
+
+    fingerprint = compute_fingerprint(Test, include_fields=False)
+    profiled = compute_fingerprint(Test)
+    Test.profiler.restore()
+
+    assert compute_fingerprint(Test, include_fields=False) == fingerprint
+    assert compute_fingerprint(Test) == profiled
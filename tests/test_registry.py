@@ -0,0 +1,165 @@
+import gc
+import re
+import sys
+from types import ModuleType
+
+import pytest
+
+from env_config import Environment, values
+from env_config.errors import UnknownEnvironmentError
+from env_config.registry import EnvironmentRegistry, active_environment_name, registry
+from tests.helpers import set_environ
+
+SETTINGS = """
+from env_config.registry import registry
+
+registry.register("Production", "{package}.production")
+registry.register("Development", "{package}.development")
+ENVIRONMENT = registry.load_active()
+"""
+
+PRODUCTION = """
+from env_config import Environment, values
+
+class Production(Environment, dotenv_path=None):
+    FOO = values.StringValue(default="production")
+"""
+
+DEVELOPMENT = """
+raise RuntimeError("The module of an inactive environment should not be imported")
+"""
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch, request):
+    name = f"env_config_registry_{request.node.name.replace('[', '_').replace(']', '')}"
+    path = tmp_path / name
+    path.mkdir()
+    (path / "__init__.py").write_text("")
+    (path / "settings.py").write_text(SETTINGS.format(package=name))
+    (path / "production.py").write_text(PRODUCTION)
+    (path / "development.py").write_text(DEVELOPMENT)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    modules = dict(registry.modules)
+    yield name
+
+    registry.modules.clear()
+    registry.modules.update(modules)
+    for module in list(sys.modules):
+        if module.startswith(name):
+            del sys.modules[module]
+
+
+@set_environ("Production")
+def test_registry__load_active(package):
+    settings = __import__(f"{package}.settings", fromlist=["settings"])
+
+    # The settings are set to the module that loaded the environment.
+    assert settings.FOO == "production"
+    assert settings.ENVIRONMENT.__name__ == "Production"
+    assert settings.ENVIRONMENT.target_module == f"{package}.settings"
+    assert f"{package}.production" in sys.modules
+    assert f"{package}.development" not in sys.modules
+    assert registry.get("production") is settings.ENVIRONMENT
+
+
+@set_environ("Staging")
+def test_registry__load_active__unknown(package):
+    msg = "Unknown environment 'Staging' (selected with 'DJANGO_SETTINGS_ENVIRONMENT'). Known environments: "
+    with pytest.raises(UnknownEnvironmentError, match=re.escape(msg)) as error:
+        __import__(f"{package}.settings")
+
+    assert error.value.name == "Staging"
+    assert "Development" in error.value.known
+    assert "Production" in error.value.known
+
+
+@set_environ("Test")
+def test_registry__load_active__created():
+    env_registry = EnvironmentRegistry()
+    module = ModuleType("env_config_registry_target")
+
+    class Test(Environment, use_environ=True, target_module=module):
+        FOO = values.StringValue(default="foo")
+
+    env_registry.add(Test)
+    # Environments that have already been created are not loaded again.
+    assert env_registry.load_active(target_module=ModuleType("other")) is Test
+    assert module.FOO == "foo"
+
+
+def test_registry__get(package):
+    env_registry = EnvironmentRegistry()
+    env_registry.register("Production", f"{package}.production")
+
+    with set_environ("Development"):
+        env = env_registry.get("PRODUCTION")
+
+    assert env.__name__ == "Production"
+    assert env_registry.get("production") is env
+    # The environment was not active, so it was not loaded.
+    assert env.fields["FOO"].value.value_by_environment == {}
+
+
+def test_registry__get__module_does_not_define_environment(package):
+    env_registry = EnvironmentRegistry()
+    env_registry.register("Staging", f"{package}.production")
+
+    msg = f"Module '{package}.production' does not define environment 'Staging'"
+    with set_environ("Development"), pytest.raises(ImportError, match=re.escape(msg)):
+        env_registry.get("Staging")
+
+
+def test_registry__unknown():
+    env_registry = EnvironmentRegistry()
+    msg = "Unknown environment 'Test' (selected with 'DJANGO_SETTINGS_ENVIRONMENT'). No environments are known"
+    with pytest.raises(UnknownEnvironmentError, match=re.escape(msg)):
+        env_registry.get("Test")
+
+
+def test_registry__names():
+    env_registry = EnvironmentRegistry()
+    env_registry.register("staging", "myproject.environments.staging")
+    env_registry.register("Production", "myproject.environments.production")
+
+    with set_environ("Other"):
+
+        class Development(Environment):
+            pass
+
+    env_registry.add(Development)
+
+    assert env_registry.names() == ["Development", "Production", "staging"]
+    assert "STAGING" in env_registry
+    assert "development" in env_registry
+    assert "testing" not in env_registry
+    assert 1 not in env_registry
+    assert repr(env_registry) == "EnvironmentRegistry(Development, Production, staging)"
+
+
+def test_registry__classes_are_weak():
+    env_registry = EnvironmentRegistry()
+    with set_environ("Other"):
+
+        class Development(Environment):
+            pass
+
+    env_registry.add(Development)
+    del Development
+    gc.collect()
+    assert "Development" not in env_registry
+
+
+def test_registry__environments_are_added():
+    with set_environ("Other"):
+
+        class RegisteredEnvironment(Environment):
+            pass
+
+    assert registry.get("registeredenvironment") is RegisteredEnvironment
+
+
+def test_active_environment_name():
+    with set_environ("PrOdUcTiOn"):
+        assert active_environment_name() == "production"
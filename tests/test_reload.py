@@ -0,0 +1,313 @@
+import sys
+import threading
+from types import ModuleType
+from unittest.mock import patch
+
+import pytest
+from django.conf import settings
+from django.core.signals import setting_changed
+
+from env_config import Environment, values
+from env_config.reload import DotenvWatcher, resolve_dotenv_path
+from tests.helpers import set_environ
+
+
+@pytest.fixture
+def module():
+    module = ModuleType("env_config_reload_test")
+    sys.modules[module.__name__] = module
+    yield module
+    del sys.modules[module.__name__]
+
+
+def create_environment(path, module, **kwargs):
+    with set_environ("Test"):
+
+        class Test(Environment, dotenv_path=path, target_module=module, **kwargs):
+            FOO = values.IntegerValue()
+            BAR = values.StringValue()
+            BAZ = values.StringValue(env_name=None, default="baz")
+
+    return Test
+
+
+def test_reload(tmp_path, module):
+    path = tmp_path / ".env"
+    path.write_text("FOO=1\nBAR=bar\n", encoding="utf-8")
+    Test = create_environment(path, module)
+
+    received = []
+
+    def receiver(**kwargs):
+        received.append((kwargs["sender"], kwargs["setting"], kwargs["value"]))
+
+    path.write_text("FOO=2\nBAR=bar\n", encoding="utf-8")
+
+    setting_changed.connect(receiver)
+    try:
+        with patch.object(values.StringValue, "convert") as convert:
+            assert Test.reload() == {"FOO": 2}
+    finally:
+        setting_changed.disconnect(receiver)
+
+    # Only the changed value is converted again.
+    assert convert.call_count == 0
+    assert Test.FOO == 2
+    assert Test.dotenv == {"FOO": "2", "BAR": "bar"}
+    assert module.FOO == 2
+    assert module.BAR == "bar"
+    assert received == [(Test, "FOO", 2)]
+
+
+def test_reload__load_dotenv_with_earlier_signature(tmp_path, module):
+    path = tmp_path / ".env"
+    path.write_text("FOO=1\nBAR=bar\n", encoding="utf-8")
+
+    with set_environ("Test"):
+
+        class Test(Environment, dotenv_path=path, target_module=module):
+            FOO = values.IntegerValue()
+
+            @staticmethod
+            def load_dotenv(*, dotenv_path=None, stack_level=1):
+                return Environment.load_dotenv(dotenv_path=dotenv_path)
+
+    path.write_text("FOO=2\nBAR=bar\n", encoding="utf-8")
+    assert Test.reload() == {"FOO": 2}
+
+
+def test_reload__no_changes(tmp_path, module):
+    path = tmp_path / ".env"
+    path.write_text("FOO=1\nBAR=bar\n", encoding="utf-8")
+    Test = create_environment(path, module)
+
+    path.write_text("FOO=1\nBAR=bar\nOTHER=1\n", encoding="utf-8")
+    assert Test.reload() == {}
+    assert Test.dotenv == {"FOO": "1", "BAR": "bar", "OTHER": "1"}
+
+
+def test_reload__invalid_value(tmp_path, module):
+    path = tmp_path / ".env"
+    path.write_text("FOO=1\nBAR=bar\n", encoding="utf-8")
+    Test = create_environment(path, module)
+
+    path.write_text("FOO=foo\nBAR=baz\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="invalid literal"):
+        Test.reload()
+
+    # Nothing is updated if any of the values is invalid.
+    assert Test.dotenv == {"FOO": "1", "BAR": "bar"}
+    assert Test.FOO == 1
+    assert Test.BAR == "bar"
+    assert module.BAR == "bar"
+
+
+def test_reload__lazy(tmp_path, module):
+    path = tmp_path / ".env"
+    path.write_text("FOO=1\nBAR=bar\n", encoding="utf-8")
+    Test = create_environment(path, module, lazy=True)
+
+    assert module.FOO == 1
+
+    path.write_text("FOO=2\nBAR=baz\n", encoding="utf-8")
+    assert Test.reload() == {"FOO": 2, "BAR": "baz"}
+
+    assert module.FOO == 2
+    # Not accessed before reloading, so loaded from the environment when accessed.
+    assert "BAR" not in vars(module)
+    assert module.BAR == "baz"
+
+
+def test_reload__projection(tmp_path, module):
+    path = tmp_path / ".env"
+    path.write_text("FOO=1\nBAR=bar\n", encoding="utf-8")
+    Test = create_environment(path, module, dotenv_parser="native", dotenv_projection=True)
+
+    path.write_text("FOO=2\nBAR=bar\nOTHER=1\n", encoding="utf-8")
+    assert Test.reload() == {"FOO": 2}
+    assert Test.dotenv == {"FOO": "2", "BAR": "bar"}
+
+
+def test_reload__secrets_dir(tmp_path, module):
+    path = tmp_path / ".env"
+    path.write_text("FOO=1\n", encoding="utf-8")
+    secrets = tmp_path / "secrets"
+    secrets.mkdir()
+    (secrets / "BAR").write_text("bar\n", encoding="utf-8")
+    Test = create_environment(path, module, secrets_dir=secrets)
+    assert Test.BAR == "bar"
+
+    (secrets / "BAR").unlink()
+    (secrets / "BAR").write_text("changed\n", encoding="utf-8")
+    assert Test.reload() == {"BAR": "changed"}
+    assert module.BAR == "changed"
+
+
+def test_reload__django_settings(tmp_path):
+    import example_project.config.settings as settings_module
+
+    path = tmp_path / ".env"
+    path.write_text("ENV_CONFIG_RELOAD_TEST=1\n", encoding="utf-8")
+
+    assert settings.configured
+
+    with set_environ("Test"):
+
+        class Test(Environment, dotenv_path=path, target_module=settings_module):
+            ENV_CONFIG_RELOAD_TEST = values.IntegerValue()
+
+    try:
+        settings.ENV_CONFIG_RELOAD_TEST = 1
+
+        path.write_text("ENV_CONFIG_RELOAD_TEST=2\n", encoding="utf-8")
+        assert Test.reload() == {"ENV_CONFIG_RELOAD_TEST": 2}
+
+        assert settings.ENV_CONFIG_RELOAD_TEST == 2
+        assert settings_module.ENV_CONFIG_RELOAD_TEST == 2
+    finally:
+        del settings.ENV_CONFIG_RELOAD_TEST
+        del settings_module.ENV_CONFIG_RELOAD_TEST
+
+
+def test_reload__no_dotenv():
+    with set_environ("Test"):
+
+        class Test(Environment, use_environ=True):
+            pass
+
+    with pytest.raises(ValueError, match="Environment 'Test' does not load a `.env` file"):
+        Test.reload()
+
+
+def test_resolve_dotenv_path__searched(tmp_path, module):
+    path = tmp_path / ".env"
+    path.write_text("FOO=1\nBAR=bar\n", encoding="utf-8")
+    module.__file__ = str(tmp_path / "settings.py")
+
+    with set_environ("Test"):
+
+        class Test(Environment, target_module=module):
+            FOO = values.IntegerValue()
+
+    assert Test.dotenv_path is None
+    assert resolve_dotenv_path(Test) == path
+
+
+@set_environ("Test")
+def test_reload__module_not_in_sys_modules(tmp_path):
+    path = tmp_path / ".env"
+    path.write_text("FOO=1\n", encoding="utf-8")
+    code = compile("class Test(Environment):\n    FOO = values.IntegerValue()\n", str(tmp_path / "settings.py"), "exec")
+    namespace = {"__name__": "not_a_module", "Environment": Environment, "values": values}
+    exec(code, namespace)
+    Test = namespace["Test"]
+
+    assert resolve_dotenv_path(Test) == path
+
+    path.write_text("FOO=2\n", encoding="utf-8")
+    assert Test.reload() == {"FOO": 2}
+    assert namespace["FOO"] == 2
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_watch(tmp_path, module, use_inotify):
+    path = tmp_path / ".env"
+    path.write_text("FOO=1\nBAR=bar\n", encoding="utf-8")
+    Test = create_environment(path, module)
+
+    reloaded = threading.Event()
+    changes = []
+
+    def on_reload(settings):
+        changes.append(settings)
+        reloaded.set()
+
+    watcher = Test.watch(interval=0.01, use_inotify=use_inotify, on_reload=on_reload)
+    try:
+        expected = "inotify" if use_inotify and sys.platform.startswith("linux") else "poll"
+        assert watcher.backend == expected
+
+        # Replace the file like deployment tools do.
+        tmp = tmp_path / ".env.tmp"
+        tmp.write_text("FOO=2\nBAR=bar\n", encoding="utf-8")
+        tmp.replace(path)
+
+        assert reloaded.wait(timeout=5)
+    finally:
+        watcher.stop()
+
+    assert not watcher.thread.is_alive()
+    assert changes == [{"FOO": 2}]
+    assert module.FOO == 2
+
+
+def test_watch__invalid_value_logged(tmp_path, module, caplog):
+    path = tmp_path / ".env"
+    path.write_text("FOO=1\nBAR=bar\n", encoding="utf-8")
+    Test = create_environment(path, module)
+
+    reloaded = threading.Event()
+
+    with DotenvWatcher(Test, interval=0.01, use_inotify=False, on_reload=lambda _: reloaded.set()):
+        path.write_text("FOO=foo\nBAR=bar\n", encoding="utf-8")
+        # The watcher keeps running after a failed reload.
+        for _ in range(500):
+            if "Could not reload environment 'Test'" in caplog.text:
+                break
+            threading.Event().wait(0.01)
+
+        path.write_text("FOO=3\nBAR=bar\n", encoding="utf-8")
+        assert reloaded.wait(timeout=5)
+
+    assert "Could not reload environment 'Test'" in caplog.text
+    assert Test.FOO == 3
+
+
+def test_reload__computed_values(tmp_path, module):
+    path = tmp_path / ".env"
+    path.write_text("FOO=1\nBAR=bar\n", encoding="utf-8")
+
+    calls = []
+
+    def compute(cls):
+        calls.append(cls)
+        return f"{cls.BAR}-{cls.BAZ}"
+
+    with set_environ("Test"):
+
+        class Test(Environment, dotenv_path=path, target_module=module):
+            FOO = values.IntegerValue()
+            BAR = values.StringValue()
+            BAZ = values.StringValue(env_name=None, default="baz")
+            DOUBLE_FOO = values.ComputedValue(lambda cls: cls.FOO * 2)
+            BAR_BAZ = values.ComputedValue(compute)
+
+    path.write_text("FOO=2\nBAR=bar\n", encoding="utf-8")
+    assert Test.reload() == {"FOO": 2, "DOUBLE_FOO": 4}
+    # Settings that don't depend on the changed settings are not computed again.
+    assert len(calls) == 1
+    assert module.DOUBLE_FOO == 4
+
+    path.write_text("FOO=2\nBAR=qux\n", encoding="utf-8")
+    assert Test.reload() == {"BAR": "qux", "BAR_BAZ": "qux-baz"}
+    assert module.BAR_BAZ == "qux-baz"
+
+
+def test_reload__computed_values__error(tmp_path, module):
+    path = tmp_path / ".env"
+    path.write_text("FOO=1\nBAR=bar\n", encoding="utf-8")
+
+    with set_environ("Test"):
+
+        class Test(Environment, dotenv_path=path, target_module=module):
+            FOO = values.IntegerValue()
+            BAR = values.StringValue()
+            INVERSE = values.ComputedValue(lambda cls: 1 / cls.FOO)
+
+    path.write_text("FOO=0\nBAR=bar\n", encoding="utf-8")
+    with pytest.raises(ZeroDivisionError):
+        Test.reload()
+
+    assert Test.FOO == 1
+    assert Test.INVERSE == 1
+    assert Test.dotenv == {"FOO": "1", "BAR": "bar"}
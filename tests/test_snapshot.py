@@ -0,0 +1,253 @@
+import pickle
+from unittest.mock import patch
+
+import pytest
+
+from env_config import Environment, values
+from env_config.snapshot import Snapshot, compute_fingerprint
+from tests.helpers import set_dotenv
+
+
+class CallbackValue(values.StringValue):
+    """Converts to a value that cannot be pickled."""
+
+    def convert(self, value):
+        return lambda: value
+
+
+def test_snapshot__created(tmp_path):
+    path = tmp_path / "settings.snapshot"
+
+    with set_dotenv("Test", FOO="1"):
+
+        class Test(Environment, snapshot_path=path):
+            FOO = values.IntegerValue()
+
+    assert Test.FOO == 1
+
+    data = pickle.loads(path.read_bytes())
+    assert data["settings"] == {"FOO": 1}
+    assert data["fingerprint"] == compute_fingerprint(Test)
+
+
+def test_snapshot__used_on_next_startup(tmp_path):
+    path = tmp_path / "settings.snapshot"
+
+    with set_dotenv("Test", FOO="1"):
+
+        class Test(Environment, snapshot_path=path):
+            FOO = values.IntegerValue()
+
+    with set_dotenv("Test", FOO="1"), patch.object(values.IntegerValue, "convert") as convert:
+
+        class Test(Environment, snapshot_path=path):
+            FOO = values.IntegerValue()
+
+        assert Test.FOO == 1
+
+    assert convert.call_count == 0
+    assert globals()["FOO"] == 1
+
+
+def test_snapshot__input_changed(tmp_path):
+    path = tmp_path / "settings.snapshot"
+
+    with set_dotenv("Test", FOO="1"):
+
+        class Test(Environment, snapshot_path=path):
+            FOO = values.IntegerValue()
+
+    with set_dotenv("Test", FOO="2"):
+
+        class Test(Environment, snapshot_path=path):
+            FOO = values.IntegerValue()
+
+    assert Test.FOO == 2
+    assert pickle.loads(path.read_bytes())["settings"] == {"FOO": 2}
+
+
+def test_snapshot__definition_changed(tmp_path):
+    path = tmp_path / "settings.snapshot"
+
+    with set_dotenv("Test", FOO="1"):
+
+        class Test(Environment, snapshot_path=path):
+            FOO = values.IntegerValue()
+
+    with set_dotenv("Test", FOO="1"):
+
+        class Test(Environment, snapshot_path=path):
+            FOO = values.StringValue()
+
+    assert Test.FOO == "1"
+
+
+def test_snapshot__corrupted(tmp_path):
+    path = tmp_path / "settings.snapshot"
+    path.write_bytes(b"not a pickle")
+
+    with set_dotenv("Test", FOO="1"):
+
+        class Test(Environment, snapshot_path=path):
+            FOO = values.IntegerValue()
+
+    assert Test.FOO == 1
+    assert Snapshot(path, env=Test).load() == {"FOO": 1}
+
+
+def test_snapshot__cannot_be_pickled(tmp_path):
+    path = tmp_path / "settings.snapshot"
+
+    with set_dotenv("Test"):
+
+        class Test(Environment, snapshot_path=path):
+            FOO = values.IntegerValue(default=1)
+            BAR = CallbackValue(default="")
+
+    assert Test.FOO == 1
+    assert callable(Test.BAR)
+    assert not path.exists()
+
+
+def test_snapshot__plain_values_not_stored(tmp_path):
+    path = tmp_path / "settings.snapshot"
+
+    with set_dotenv("Test", FOO="1"):
+
+        class Test(Environment, snapshot_path=path):
+            FOO = values.IntegerValue()
+            PLAIN = "one"
+
+    assert pickle.loads(path.read_bytes())["settings"] == {"FOO": 1}
+
+    # Plain values, e.g., read with `os.environ.get` in the class body, are not part of the fingerprint,
+    # so they are read from the class instead of the snapshot.
+    with set_dotenv("Test", FOO="1"), patch.object(values.IntegerValue, "convert") as convert:
+
+        class Test(Environment, snapshot_path=path):
+            FOO = values.IntegerValue()
+            PLAIN = "two"
+
+    assert convert.call_count == 0
+    assert Test.FOO == 1
+    assert globals()["PLAIN"] == "two"
+
+
+def test_snapshot__cannot_be_written(tmp_path, caplog):
+    # The parent of the snapshot cannot be created, since a file exists in its place.
+    (tmp_path / ".env").write_text("", encoding="utf-8")
+    path = tmp_path / ".env" / "sub" / "settings.snapshot"
+
+    with set_dotenv("Test", FOO="1"):
+
+        class Test(Environment, snapshot_path=path):
+            FOO = values.IntegerValue()
+
+    assert Test.FOO == 1
+    assert "Could not write settings snapshot for environment 'Test'" in caplog.text
+
+
+def test_snapshot__input_file_changed(tmp_path):
+    path = tmp_path / "settings.snapshot"
+    data = tmp_path / "data.json"
+    data.write_text("[1]", encoding="utf-8")
+
+    with set_dotenv("Test", FOO=str(data)):
+
+        class Test(Environment, snapshot_path=path):
+            FOO = values.JsonFileValue()
+
+    assert Test.FOO == [1]
+
+    # The raw value doesn't change, but the file it points to does.
+    data.write_text("[1, 2]", encoding="utf-8")
+
+    with set_dotenv("Test", FOO=str(data)):
+
+        class Test(Environment, snapshot_path=path):
+            FOO = values.JsonFileValue()
+
+    assert Test.FOO == [1, 2]
+
+
+def test_snapshot__path_created_again(tmp_path):
+    path = tmp_path / "settings.snapshot"
+    media = tmp_path / "media"
+
+    with set_dotenv("Test", MEDIA=str(media)):
+
+        class Test(Environment, snapshot_path=path):
+            MEDIA = values.PathValue(create_if_missing=True)
+
+    media.rmdir()
+
+    # The directory no longer exists, so the value is converted again, which creates it.
+    with set_dotenv("Test", MEDIA=str(media)):
+
+        class Test(Environment, snapshot_path=path):
+            MEDIA = values.PathValue(create_if_missing=True)
+
+    assert Test.MEDIA == str(media)
+    assert media.is_dir()
+
+
+def test_snapshot__path_removed(tmp_path):
+    path = tmp_path / "settings.snapshot"
+    media = tmp_path / "media"
+    media.mkdir()
+
+    with set_dotenv("Test", MEDIA=str(media)):
+
+        class Test(Environment, snapshot_path=path):
+            MEDIA = values.PathValue()
+
+    media.rmdir()
+
+    with set_dotenv("Test", MEDIA=str(media)), pytest.raises(ValueError, match="does not exist"):
+
+        class Test(Environment, snapshot_path=path):
+            MEDIA = values.PathValue()
+
+
+def test_snapshot__relative_path(tmp_path, monkeypatch):
+    path = tmp_path / "settings.snapshot"
+    (tmp_path / "sub" / "media").mkdir(parents=True)
+    (tmp_path / "media").mkdir()
+
+    monkeypatch.chdir(tmp_path)
+    with set_dotenv("Test", MEDIA="media"):
+
+        class Test(Environment, snapshot_path=path):
+            MEDIA = values.PathValue()
+
+    assert Test.MEDIA == str(tmp_path / "media")
+
+    # Relative paths are resolved from the current working directory, not the one the snapshot was created in.
+    monkeypatch.chdir(tmp_path / "sub")
+    with set_dotenv("Test", MEDIA="media"):
+
+        class Test(Environment, snapshot_path=path):
+            MEDIA = values.PathValue()
+
+    assert Test.MEDIA == str(tmp_path / "sub" / "media")
+
+
+def test_snapshot__path_default(tmp_path, monkeypatch):
+    path = tmp_path / "settings.snapshot"
+    (tmp_path / "sub").mkdir()
+
+    monkeypatch.chdir(tmp_path)
+    with set_dotenv("Test"):
+
+        class Test(Environment, snapshot_path=path):
+            MEDIA = values.PathValue(default="media", create_if_missing=True)
+
+    # Defaults are converted like raw values, so they are checked in the same way.
+    monkeypatch.chdir(tmp_path / "sub")
+    with set_dotenv("Test"):
+
+        class Test(Environment, snapshot_path=path):
+            MEDIA = values.PathValue(default="media", create_if_missing=True)
+
+    assert Test.MEDIA == str(tmp_path / "sub" / "media")
+    assert (tmp_path / "sub" / "media").is_dir()
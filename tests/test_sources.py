@@ -0,0 +1,176 @@
+import os
+import re
+from unittest.mock import patch
+
+import pytest
+
+from env_config import Environment, values
+from env_config.constants import Undefined
+from env_config.errors import MissingEnvValueError
+from env_config.sources import DirectorySource, EnvironView, layer_sources
+from tests.helpers import set_dotenv
+
+
+def test_environ_view():
+    environ = {"FOO": "1", "BAR": "2"}
+    view = EnvironView(environ)
+
+    assert view["FOO"] == "1"
+    assert view.get("BAZ") is None
+    assert "BAR" in view
+    assert "BAZ" not in view
+    assert list(view) == ["FOO", "BAR"]
+    assert len(view) == 2
+    assert view == environ
+    assert repr(view) == "EnvironView()"
+
+    with pytest.raises(KeyError):
+        view["BAZ"]
+
+
+def test_environ_view__read_through():
+    environ = {"FOO": "1"}
+    view = EnvironView(environ)
+
+    environ["FOO"] = "2"
+    environ["BAR"] = "3"
+    assert view == {"FOO": "2", "BAR": "3"}
+
+
+def test_environ_view__freeze():
+    environ = {"FOO": "1", "BAR": "2"}
+    view = EnvironView(environ)
+
+    snapshot = view.freeze({"FOO", "BAZ"})
+    environ["FOO"] = "3"
+    assert snapshot == {"FOO": "1"}
+
+
+def test_environ_view__os_environ(monkeypatch):
+    monkeypatch.setenv("ENV_CONFIG_SOURCES_TEST", "value")
+    assert EnvironView()["ENV_CONFIG_SOURCES_TEST"] == "value"
+
+
+def test_directory_source(tmp_path):
+    (tmp_path / "FOO").write_text("foo\n", encoding="utf-8")
+    (tmp_path / "BAR").write_text("bar\r\n", encoding="utf-8")
+    (tmp_path / "MULTILINE").write_text("line 1\nline 2\n\n", encoding="utf-8")
+    (tmp_path / ".hidden").write_text("hidden", encoding="utf-8")
+    (tmp_path / "DIR").mkdir()
+
+    source = DirectorySource(tmp_path)
+
+    assert source["FOO"] == "foo"
+    assert source["BAR"] == "bar"
+    assert source["MULTILINE"] == "line 1\nline 2\n"
+    assert "FOO" in source
+    assert ".hidden" not in source
+    assert "DIR" not in source
+    assert sorted(source) == ["BAR", "FOO", "MULTILINE"]
+    assert len(source) == 3
+    assert repr(source) == f"DirectorySource({str(tmp_path)!r})"
+
+    with pytest.raises(KeyError):
+        source["BAZ"]
+
+
+def test_directory_source__keys(tmp_path):
+    (tmp_path / "FOO").write_text("foo", encoding="utf-8")
+    (tmp_path / "BAR").write_text("bar", encoding="utf-8")
+
+    source = DirectorySource(tmp_path, keys={"FOO", "BAZ"})
+    assert source == {"FOO": "foo"}
+
+
+def test_directory_source__symlinks(tmp_path):
+    # Kubernetes mounts files as symbolic links to a hidden directory that is swapped on updates.
+    data = tmp_path / "..2024_01_01"
+    data.mkdir()
+    (data / "FOO").write_text("foo", encoding="utf-8")
+    (tmp_path / "..data").symlink_to(data.name)
+    (tmp_path / "FOO").symlink_to("..data/FOO")
+
+    assert DirectorySource(tmp_path) == {"FOO": "foo"}
+
+
+def test_directory_source__max_size(tmp_path):
+    (tmp_path / "FOO").write_text("x" * 11, encoding="utf-8")
+    (tmp_path / "BAR").write_text("x" * 10, encoding="utf-8")
+
+    source = DirectorySource(tmp_path, max_size=10)
+    assert source["BAR"] == "x" * 10
+
+    msg = f"File {str(tmp_path / 'FOO')!r} is larger than the maximum size of 10 bytes"
+    with pytest.raises(ValueError, match=re.escape(msg)):
+        source["FOO"]
+
+
+def test_directory_source__cached(tmp_path):
+    path = tmp_path / "FOO"
+    path.write_text("foo", encoding="utf-8")
+
+    with patch("builtins.open", wraps=open) as mock_open:
+        assert DirectorySource(tmp_path)["FOO"] == "foo"
+        assert DirectorySource(tmp_path)["FOO"] == "foo"
+
+    # The file is read only once for sources sharing the directory.
+    assert mock_open.call_count == 1
+
+    # Replaced files are read again.
+    path.write_text("changed", encoding="utf-8")
+    os.utime(path, ns=(0, 0))
+    assert DirectorySource(tmp_path)["FOO"] == "changed"
+
+
+def test_layer_sources():
+    assert layer_sources(Undefined, Undefined) is Undefined
+
+    first = {"FOO": "1"}
+    assert layer_sources(first, Undefined) is first
+
+    layered = layer_sources({"FOO": "1"}, {"FOO": "2", "BAR": "2"})
+    assert layered["FOO"] == "1"
+    assert layered["BAR"] == "2"
+    assert layered.get("BAZ") is None
+
+
+@set_dotenv("Test", FOO="dotenv")
+def test_environment__secrets_dir(tmp_path):
+    (tmp_path / "FOO").write_text("secret", encoding="utf-8")
+    (tmp_path / "BAR").write_text("secret", encoding="utf-8")
+    (tmp_path / "UNDECLARED").write_text("secret", encoding="utf-8")
+
+    class Test(Environment, secrets_dir=tmp_path):
+        FOO = values.StringValue()
+        BAR = values.StringValue()
+        BAZ = values.StringValue(default="default")
+
+    # Values from the `.env` file take precedence.
+    assert Test.FOO == "dotenv"
+    assert Test.BAR == "secret"
+    assert Test.BAZ == "default"
+    assert Test.secrets_dir == tmp_path
+    # Only the files for declared values are included.
+    assert "UNDECLARED" not in Test.dotenv
+
+
+@set_dotenv("Test")
+def test_environment__secrets_dir__no_dotenv(tmp_path):
+    (tmp_path / "FOO").write_text("secret", encoding="utf-8")
+
+    class Test(Environment, dotenv_path=None, secrets_dir=tmp_path):
+        FOO = values.StringValue()
+        BAR = values.StringValue(env_name="DJANGO_BAR", default="bar")
+
+    assert Test.FOO == "secret"
+    assert Test.BAR == "bar"
+    assert isinstance(Test.dotenv, DirectorySource)
+
+
+@set_dotenv("Test")
+def test_environment__secrets_dir__missing(tmp_path):
+    msg = "Value 'FOO' in environment 'Test' not defined in the sources of the environment and value does not have a default"
+    with pytest.raises(MissingEnvValueError, match=re.escape(msg)):
+
+        class Test(Environment, dotenv_path=None, secrets_dir=tmp_path):
+            FOO = values.StringValue()
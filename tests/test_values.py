@@ -1,4 +1,9 @@
+import gc
 import re
+import sys
+import threading
+import weakref
+from array import array
 from decimal import Decimal, InvalidOperation
 from json import JSONDecodeError
 from pathlib import Path
@@ -8,7 +13,10 @@
 from django.core.exceptions import ValidationError
 
 from env_config import Environment, values
-from tests.helpers import set_dotenv
+from env_config.errors import CircularDependencyError, JsonSchemaError, MissingEnvValueError
+from env_config.imports import ImportString
+from env_config.networks import IPNetworkSet
+from tests.helpers import set_dotenv, set_environ
 
 
 @set_dotenv("Test", FOO="bar")
@@ -437,6 +445,54 @@ class Test(Environment):
             FOO = values.IPValue()
 
 
+def test_environment__ip_network_set_value():
+    with set_dotenv("Test", FOO="10.0.0.0/8, 192.168.1.1,,2001:db8::/32"):
+
+        class Test(Environment):
+            FOO = values.IPNetworkSetValue()
+
+    assert isinstance(Test.FOO, IPNetworkSet)
+    assert "10.1.2.3" in Test.FOO
+    assert "192.168.1.1" in Test.FOO
+    assert "192.168.1.2" not in Test.FOO
+    assert "2001:db8::1" in Test.FOO
+
+
+def test_environment__ip_network_set_value__delimiter():
+    with set_dotenv("Test", FOO="10.0.0.0/8;::1"):
+
+        class Test(Environment):
+            FOO = values.IPNetworkSetValue(delimiter=";")
+
+    assert Test.FOO == IPNetworkSet(["10.0.0.0/8", "::1"])
+
+
+def test_environment__ip_network_set_value__not_strict():
+    with set_dotenv("Test", FOO="10.0.0.1/8"):
+
+        class Test(Environment):
+            FOO = values.IPNetworkSetValue(strict=False)
+
+    assert Test.FOO == IPNetworkSet(["10.0.0.0/8"])
+
+
+def test_environment__ip_network_set_value__default():
+    with set_dotenv("Test"):
+
+        class Test(Environment):
+            FOO = values.IPNetworkSetValue(default=["127.0.0.1", "::1"])
+
+    assert Test.FOO == IPNetworkSet(["127.0.0.1", "::1"])
+
+
+@pytest.mark.parametrize("value", ["localhost", "10.0.0.1/8", "10.0.0.0/33"])
+def test_environment__ip_network_set_value__invalid(value):
+    with set_dotenv("Test", FOO=value), pytest.raises(ValueError, match=re.escape(value)):
+
+        class Test(Environment):
+            FOO = values.IPNetworkSetValue()
+
+
 @pytest.mark.parametrize(
     ("regex", "value"),
     [
@@ -731,3 +787,536 @@ class Test(Environment):
             "LOCATION": "redis://master:6379/0",
         }
     }
+
+
+def test_value__slots():
+    assert not hasattr(values.StringValue(), "__dict__")
+    assert not hasattr(values.ListValue(), "__dict__")
+    assert not hasattr(values.DatabaseURLValue(), "__dict__")
+
+
+def test_value__environments_referenced_weakly():
+    descriptor = values.StringValue(default="foo")
+
+    with set_dotenv("Test"):
+
+        class Test(Environment):
+            FOO = descriptor
+
+    assert Test.FOO == "foo"
+    assert len(descriptor.value_by_environment) == 1
+
+    ref = weakref.ref(Test)
+    del Test
+    gc.collect()
+
+    assert ref() is None
+    assert len(descriptor.value_by_environment) == 0
+
+
+def test_value__validators_reused():
+    url = values.URLValue()
+    regex = values.RegexValue(regex=r"^\d+$")
+
+    assert url.convert("https://example.com") == "https://example.com"
+    assert regex.convert("1") == "1"
+    hits = values.get_validator.cache_info().hits
+
+    assert url.convert("https://example.org") == "https://example.org"
+    assert values.RegexValue(regex=r"^\d+$").convert("2") == "2"
+    assert values.get_validator.cache_info().hits == hits + 2
+
+
+def test_environment__list_value__url_child():
+    urls = [f"https://{i}.example.com" for i in range(100)]
+    with set_dotenv("Test", FOO=",".join(urls)):
+
+        class Test(Environment):
+            FOO = values.ListValue(child=values.URLValue())
+
+    assert Test.FOO == urls
+
+
+@pytest.mark.parametrize("mode", ["spec", "lazy"])
+def test_environment__import_string_value__not_imported(mode):
+    with set_dotenv("Test", FOO="django.contrib.postgres.search.SearchVector"):
+
+        class Test(Environment):
+            FOO = values.ImportStringValue(mode=mode)
+
+    assert Test.FOO == "django.contrib.postgres.search.SearchVector"
+    assert "django.contrib.postgres.search" not in sys.modules
+
+
+def test_environment__import_string_value__lazy():
+    with set_dotenv("Test", FOO="env_config.base.Environment"):
+
+        class Test(Environment):
+            FOO = values.ImportStringValue(mode="lazy")
+
+    assert isinstance(Test.FOO, ImportString)
+    assert Test.FOO.load() is Environment
+
+
+@pytest.mark.parametrize("mode", ["spec", "lazy"])
+@pytest.mark.parametrize("value", ["foo", "this.does.not.exist", "env_config.base.Missing"])
+def test_environment__import_string_value__not_imported__invalid(mode, value):
+    with set_dotenv("Test", FOO=value), pytest.raises(ImportError):
+
+        class Test(Environment):
+            FOO = values.ImportStringValue(mode=mode)
+
+
+def test_import_string_value__unknown_mode():
+    msg = "Unknown import mode 'foo'. Available modes: import, spec, lazy"
+    with pytest.raises(ValueError, match=re.escape(msg)):
+        values.ImportStringValue(mode="foo")
+
+
+def test_environment__computed_value():
+    with set_dotenv("Test", REDIS_HOST="redis", DEBUG="true"):
+
+        class Test(Environment):
+            REDIS_HOST = values.StringValue()
+            DEBUG = values.BooleanValue()
+            PLAIN = "plain"
+
+            @values.ComputedValue
+            def CACHES(cls):
+                return {"default": {"LOCATION": f"redis://{cls.REDIS_HOST}", "DEBUG": cls.DEBUG}}
+
+            LOCATION = values.ComputedValue(lambda cls: cls.CACHES["default"]["LOCATION"] + cls.PLAIN)
+
+    assert Test.CACHES == {"default": {"LOCATION": "redis://redis", "DEBUG": True}}
+    assert Test.LOCATION == "redis://redisplain"
+    assert globals()["LOCATION"] == "redis://redisplain"
+    assert Test.fields["CACHES"].is_descriptor
+    assert Test.fields["CACHES"].env_name is None
+    assert vars(Test)["CACHES"].dependencies(Test) == {"REDIS_HOST", "DEBUG"}
+    assert vars(Test)["LOCATION"].dependencies(Test) == {"CACHES", "PLAIN"}
+
+
+def test_environment__computed_value__memoized():
+    calls = []
+
+    def compute(cls):
+        calls.append(cls)
+        return cls.FOO * 2
+
+    with set_dotenv("Test", FOO="1"):
+
+        class Test(Environment):
+            FOO = values.IntegerValue()
+            BAR = values.ComputedValue(compute)
+
+    assert Test.BAR == 2
+    assert Test.BAR == 2
+    assert len(calls) == 1
+
+
+def test_environment__computed_value__per_environment():
+    with set_dotenv("Parent", FOO="1"):
+
+        class Parent(Environment):
+            FOO = values.IntegerValue()
+            BAR = values.ComputedValue(lambda cls: cls.FOO * 2)
+
+    with set_dotenv("Child", FOO="2"):
+
+        class Child(Parent):
+            pass
+
+    assert Parent.BAR == 2
+    assert Child.BAR == 4
+
+
+def test_environment__computed_value__classmethod_dependencies():
+    with set_dotenv("Test", FOO="1"):
+
+        class Test(Environment):
+            FOO = values.IntegerValue()
+
+            @classmethod
+            def double_foo(cls):
+                return cls.FOO * 2
+
+            BAR = values.ComputedValue(lambda cls: cls.double_foo())
+
+    assert Test.BAR == 2
+    assert vars(Test)["BAR"].dependencies(Test) == {"FOO"}
+
+
+def test_environment__computed_value__not_computed():
+    with set_dotenv("Other"):
+
+        class Test(Environment):
+            FOO = values.ComputedValue(lambda cls: 1)
+
+    assert vars(Test)["FOO"].dependencies(Test) is None
+
+
+def test_environment__computed_value__circular():
+    msg = "Circular dependency between settings in environment 'Test': BAR -> BAZ -> BAR"
+    with set_dotenv("Test"), pytest.raises(CircularDependencyError, match=re.escape(msg)) as error:
+
+        class Test(Environment):
+            FOO = values.ComputedValue(lambda cls: cls.BAR)
+            BAR = values.ComputedValue(lambda cls: cls.BAZ)
+            BAZ = values.ComputedValue(lambda cls: cls.BAR)
+
+    assert error.value.cycle == ["BAR", "BAZ", "BAR"]
+
+
+def test_computed_value__recompute():
+    calls = []
+
+    def compute(name, func):
+        def wrapper(cls):
+            calls.append(name)
+            return func(cls)
+
+        return values.ComputedValue(wrapper)
+
+    with set_dotenv("Test", FOO="1", BAR="2"):
+
+        class Test(Environment):
+            FOO = values.IntegerValue()
+            BAR = values.IntegerValue()
+            # Defined before its dependency to check that dependencies are computed first.
+            FOO_TIMES_DOUBLE = compute("FOO_TIMES_DOUBLE", lambda cls: cls.FOO * cls.DOUBLE_FOO)
+            DOUBLE_FOO = compute("DOUBLE_FOO", lambda cls: cls.FOO * 2)
+            DOUBLE_BAR = compute("DOUBLE_BAR", lambda cls: cls.BAR * 2)
+
+    calls.clear()
+    assert values.ComputedValue.recompute(Test, {"FOO": 3}) == {"FOO_TIMES_DOUBLE": 18, "DOUBLE_FOO": 6}
+    assert calls == ["FOO_TIMES_DOUBLE", "DOUBLE_FOO"]
+
+    # Values are not set to the environment.
+    assert Test.FOO == 1
+    assert Test.FOO_TIMES_DOUBLE == 2
+
+
+@pytest.mark.parametrize(
+    ("child", "value"),
+    [
+        (values.StringValue(), " foo , bar,,baz , "),
+        (values.BooleanValue(), "yes, N ,TRUE,,0, "),
+        (values.BooleanValue(), "yes,maybe"),
+        (values.IntegerValue(), "1, 2 ,,-3,1_000"),
+        (values.IntegerValue(), "1, ,2"),
+        (values.IntegerValue(), "1,foo"),
+        (values.FloatValue(), "1.5, 2 ,,inf,-0.0"),
+        (values.FloatValue(), "1.5,foo"),
+        (values.DecimalValue(), "1.50, 2 ,,-3"),
+        (values.DecimalValue(), "1.50,foo"),
+    ],
+)
+@pytest.mark.parametrize("sequence_class", [values.ListValue, values.TupleValue, values.SetValue])
+def test_sequence_value__bulk_conversion(sequence_class, child, value):
+    value_descriptor = sequence_class(child=child)
+    assert type(child) in values.BULK_CONVERTERS
+
+    try:
+        expected = list(value_descriptor.convert_items(value))
+    except Exception as error:  # noqa: BLE001
+        # Errors are the same as when converting the items one by one.
+        with pytest.raises(type(error), match=re.escape(str(error))):
+            value_descriptor.convert(value)
+        return
+
+    with patch.object(sequence_class, "convert_items") as convert_items:
+        result = value_descriptor.convert(value)
+
+    assert convert_items.call_count == 0
+    assert result == type(result)(expected)
+
+
+def test_sequence_value__bulk_conversion__not_for_subclasses():
+    value = values.ListValue(child=values.PositiveIntegerValue())
+    assert type(value.child) not in values.BULK_CONVERTERS
+
+    with pytest.raises(ValueError, match="Value must be positive, got -1"):
+        value.convert("1,-1")
+
+
+def test_sequence_value__bulk_conversion__not_for_sequences():
+    value = values.ListValue(child=values.IntegerValue())
+    with patch.dict(values.BULK_CONVERTERS, {values.IntegerValue: None}):
+        assert value.convert(["1", "2"]) == [1, 2]
+
+
+@pytest.mark.parametrize(
+    ("typecode", "value", "expected"),
+    [
+        ("q", "1, 2 ,,-3", [1, 2, -3]),
+        ("B", "0,255", [0, 255]),
+        ("H", "", []),
+        ("d", "1.5, -2,inf", [1.5, -2.0, float("inf")]),
+        ("f", "0.5,1e38", [0.5, array("f", [1e38])[0]]),
+    ],
+)
+def test_environment__array_value(typecode, value, expected):
+    with set_dotenv("Test", FOO=value):
+
+        class Test(Environment):
+            FOO = values.ArrayValue(typecode)
+
+    assert isinstance(Test.FOO, array)
+    assert Test.FOO.typecode == typecode
+    assert Test.FOO.tolist() == expected
+
+
+def test_environment__array_value__delimiter():
+    with set_dotenv("Test", FOO="1;2;3"):
+
+        class Test(Environment):
+            FOO = values.ArrayValue("i", delimiter=";")
+
+    assert Test.FOO == array("i", [1, 2, 3])
+
+
+@pytest.mark.parametrize("default", [[1, 2], array("H", [1, 2]), array("q", [1, 2])])
+def test_environment__array_value__default(default):
+    with set_dotenv("Test"):
+
+        class Test(Environment):
+            FOO = values.ArrayValue("H", default=default)
+
+    assert Test.FOO == array("H", [1, 2])
+
+
+@pytest.mark.parametrize(
+    ("typecode", "value", "message"),
+    [
+        ("B", "1,256", "Value 256 is out of range for array typecode 'B' (0 to 255)"),
+        ("b", "-129", "Value -129 is out of range for array typecode 'b' (-128 to 127)"),
+        ("Q", "-1", "Value -1 is out of range for array typecode 'Q' (0 to 18446744073709551615)"),
+        ("q", str(2**63), f"Value {2**63} is out of range for array typecode 'q'"),
+        ("f", "1e39", "Value 1e+39 is out of range for array typecode 'f'"),
+        ("i", "1.5", "invalid literal for int() with base 10: '1.5'"),
+        ("d", "foo", "could not convert string to float: 'foo'"),
+    ],
+)
+def test_environment__array_value__invalid(typecode, value, message):
+    with set_dotenv("Test", FOO=value), pytest.raises(ValueError, match=re.escape(message)):
+
+        class Test(Environment):
+            FOO = values.ArrayValue(typecode)
+
+
+def test_environment__array_value__invalid_typecode():
+    with pytest.raises(ValueError, match="Unsupported array typecode 'u'. Available typecodes: b, B, h"):
+        values.ArrayValue("u")
+
+
+@pytest.mark.parametrize(
+    ("typecode", "bounds"),
+    [
+        ("b", (-128, 127)),
+        ("B", (0, 255)),
+        ("h", (-(2**15), 2**15 - 1)),
+        ("H", (0, 2**16 - 1)),
+        ("q", (-(2**63), 2**63 - 1)),
+        ("Q", (0, 2**64 - 1)),
+    ],
+)
+def test_array_bounds(typecode, bounds):
+    assert values.array_bounds(typecode) == bounds
+    array(typecode, bounds)
+
+
+def test_environment__json_value__backend():
+    with set_dotenv("Test", FOO='{"foo": [1, NaN]}'):
+
+        class Test(Environment):
+            FOO = values.JsonValue(backend="json")
+            BAR = values.JsonValue(env_name="FOO")
+
+    assert str(Test.FOO) == str(Test.BAR) == "{'foo': [1, nan]}"
+
+
+def test_environment__json_value__large_integer():
+    with set_dotenv("Test", FOO='{"id": 12345678901234567890123}'):
+
+        class Test(Environment):
+            FOO = values.JsonValue()
+
+    # The standard library is used by default, which doesn't lose precision for large integers.
+    assert Test.FOO == {"id": 12345678901234567890123}
+
+
+def test_environment__json_value__unknown_backend():
+    with pytest.raises(ValueError, match="Unknown JSON backend 'simplejson'"):
+        values.JsonValue(backend="simplejson")
+
+
+def test_environment__json_value__schema():
+    schema = {"type": "object", "properties": {"foo": {"type": "integer"}}}
+    with set_dotenv("Test", FOO='{"foo": "1"}'), pytest.raises(JsonSchemaError, match=re.escape("$.foo")):
+
+        class Test(Environment):
+            FOO = values.JsonValue(schema=schema)
+
+
+def test_environment__json_file_value(tmp_path):
+    path = tmp_path / "routes.json"
+    path.write_text('{"routes": [{"path": "/", "port": 8000}]}', encoding="utf-8")
+    schema = {"type": "object", "required": ["routes"]}
+
+    with set_dotenv("Test", FOO=str(path)):
+
+        class Test(Environment):
+            FOO = values.JsonFileValue(schema=schema)
+
+    assert Test.FOO == {"routes": [{"path": "/", "port": 8000}]}
+
+
+def test_environment__json_file_value__default():
+    with set_dotenv("Test"):
+
+        class Test(Environment):
+            FOO = values.JsonFileValue(default=[])
+
+    assert Test.FOO == []
+
+
+def test_environment__json_file_value__does_not_exist(tmp_path):
+    path = tmp_path / "routes.json"
+    with set_dotenv("Test", FOO=str(path)), pytest.raises(ValueError, match=f"JSON file '{path}' does not exist"):
+
+        class Test(Environment):
+            FOO = values.JsonFileValue()
+
+
+@pytest.mark.parametrize(("content", "error"), [("[1,", JSONDecodeError), ('{"foo": 1}', JsonSchemaError)])
+def test_environment__json_file_value__invalid(tmp_path, content, error):
+    path = tmp_path / "routes.json"
+    path.write_text(content, encoding="utf-8")
+
+    with set_dotenv("Test", FOO=str(path)), pytest.raises(error):
+
+        class Test(Environment):
+            FOO = values.JsonFileValue(schema={"type": "array"})
+
+
+def join_refresh(name):
+    for thread in threading.enumerate():
+        if thread.name == f"env-config-{name}":
+            thread.join(timeout=5)
+
+
+def test_environment__dynamic_value():
+    source = {"FOO": "true"}
+    with set_dotenv("Test"):
+
+        class Test(Environment):
+            FOO = values.DynamicValue(values.BooleanValue(), ttl=60, source=source)
+
+    assert Test.FOO is True
+    source["FOO"] = "false"
+
+    # The value is cached until it expires.
+    assert Test.FOO is True
+    stats = Test.fields["FOO"].value.stats
+    assert stats == values.DynamicStats(hits=2, misses=1)
+
+    # Reading the counts doesn't change them.
+    assert Test.fields["FOO"].value.stats == values.DynamicStats(hits=2, misses=1)
+    assert Test.FOO is True
+    assert Test.fields["FOO"].value.stats == values.DynamicStats(hits=3, misses=1)
+
+
+def test_environment__dynamic_value__stale_while_revalidate():
+    source = {"FOO": "1"}
+    with set_dotenv("Test"):
+
+        class Test(Environment):
+            FOO = values.DynamicValue(values.IntegerValue(), ttl=0, source=source)
+
+    source["FOO"] = "2"
+    # The expired value is returned while it's refreshed in the background.
+    assert Test.FOO == 1
+    join_refresh("FOO")
+    assert Test.FOO == 2
+    join_refresh("FOO")
+
+    stats = Test.fields["FOO"].value.stats
+    assert stats == values.DynamicStats(stale_hits=2, misses=1, refreshes=2)
+
+
+def test_environment__dynamic_value__single_refresh():
+    source = {"FOO": "1"}
+    with set_dotenv("Test"):
+
+        class Test(Environment):
+            FOO = values.DynamicValue(values.IntegerValue(), ttl=0, source=source)
+
+    value = Test.fields["FOO"].value
+    started = threading.Event()
+    release = threading.Event()
+    get_for_environment = values.DynamicValue.get_for_environment
+
+    def slow_get_for_environment(self, env):
+        started.set()
+        release.wait(timeout=5)
+        return get_for_environment(self, env)
+
+    with patch.object(values.DynamicValue, "get_for_environment", slow_get_for_environment):
+        thread = value.start_refresh(Test)
+        assert started.wait(timeout=5)
+        # Accessing the value while it's being refreshed doesn't start another refresh.
+        assert value.start_refresh(Test) is None
+        assert Test.FOO == 1
+        release.set()
+        thread.join(timeout=5)
+
+    assert value.stats.refreshes == 1
+    assert not value.refreshing
+
+
+def test_environment__dynamic_value__refresh_error(caplog):
+    source = {"FOO": "1"}
+    with set_dotenv("Test"):
+
+        class Test(Environment):
+            FOO = values.DynamicValue(values.IntegerValue(), ttl=60, source=source)
+
+    source["FOO"] = "invalid"
+    value = Test.fields["FOO"].value
+    value.refresh(Test)
+
+    # The previous value is used until it expires again.
+    assert Test.FOO == 1
+    assert value.stats.errors == 1
+    assert "Could not refresh setting 'FOO' of environment 'Test'" in caplog.text
+
+
+@set_environ("Test", FOO="1")
+def test_environment__dynamic_value__environ(monkeypatch):
+    class Test(Environment, use_environ=True):
+        FOO = values.DynamicValue(values.IntegerValue(), ttl=0)
+
+    assert Test.FOO == 1
+    monkeypatch.setenv("FOO", "2")
+    Test.fields["FOO"].value.refresh(Test)
+    assert Test.FOO == 2
+
+
+def test_environment__dynamic_value__async_source():
+    from env_config.aio import MappingSource
+
+    with set_dotenv("Test"):
+
+        class Test(Environment):
+            FOO = values.DynamicValue(values.StringValue(), source=MappingSource({"FOO": "async"}))
+            BAR = values.DynamicValue(values.StringValue(), source=MappingSource({}), default="default")
+
+    assert Test.FOO == "async"
+    assert Test.BAR == "default"
+
+
+def test_environment__dynamic_value__missing():
+    with set_dotenv("Test"), pytest.raises(MissingEnvValueError):
+
+        class Test(Environment):
+            FOO = values.DynamicValue(values.StringValue(), source={})